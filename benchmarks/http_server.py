@@ -0,0 +1,241 @@
+"""
+Servidor HTTP local para los benchmarks de las descargas:
+    - _QuietHTTPServer: No imprimir las desconexiones de los clientes
+    - BenchmarkHandler: Servir contenido sintético con latencia y ancho de banda simulados
+    - BenchmarkServer: Iniciar y detener el servidor en un hilo
+
+Rutas disponibles:
+    - /files/<bytes>/<nombre>: Archivo de contenido determinista (Ej: /files/1048576/a.bin)
+    - /status/<código>: Responder solo con el código de estado (Ej: /status/429)
+"""
+
+import sys
+import time
+from threading import Thread
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+# Bloque base con el que se genera el contenido de los archivos
+PATTERN = bytes(range(256)) * 256
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """
+    No imprimir las desconexiones de los clientes (Ej: al cancelar
+    una descarga), solo los demás errores
+    """
+
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+
+            return
+
+        super().handle_error(request, client_address)
+
+
+class BenchmarkHandler(BaseHTTPRequestHandler):
+    """
+    Servir contenido sintético según la configuración del servidor
+    (latency, bandwidth, ranges, chunked)
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _send_body(self, start: int, length: int) -> None:
+
+        bandwidth = self.server.bandwidth
+        chunked = self.server.chunked
+
+        sent = 0
+        begin = time.perf_counter()
+
+        while sent < length:
+
+            offset = (start + sent) % len(PATTERN)
+            block = PATTERN[offset:offset + min(length - sent, 1024 * 64)]
+
+            if chunked:
+
+                self.wfile.write(f'{len(block):X}\r\n'.encode() + block + b"\r\n")
+
+            else:
+
+                self.wfile.write(block)
+
+            sent += len(block)
+
+            # Limitar el ancho de banda esperando lo necesario
+            if bandwidth and (delay := sent / bandwidth - (time.perf_counter() - begin)) > 0:
+
+                time.sleep(delay)
+
+        if chunked:
+
+            self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self) -> None:
+
+        try:
+
+            self._respond()
+
+        # El cliente cerró la conexión antes de terminar
+        except (BrokenPipeError, ConnectionResetError):
+
+            self.close_connection = True
+
+    def _respond(self) -> None:
+
+        # Latencia simulada antes de responder
+        if self.server.latency:
+
+            time.sleep(self.server.latency)
+
+        parts = self.path.split("?")[0].strip("/").split("/")
+
+        if len(parts) == 2 and parts[0] == "status" and parts[1].isdigit():
+
+            self.send_response(int(parts[1]))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+            return
+
+        if len(parts) != 3 or parts[0] != "files" or not parts[1].isdigit():
+
+            self.send_error(404)
+
+            return
+
+        size = int(parts[1])
+        start, end = 0, size - 1
+
+        # Responder solo el rango solicitado (Ej: "bytes=100-199",
+        # "bytes=100-" o "bytes=-100"), los inválidos se ignoran
+        requested = None
+        range_header = self.headers.get("Range") or ""
+
+        if self.server.ranges and range_header.startswith("bytes="):
+
+            first, _, last = range_header[6:].partition("-")
+
+            try:
+
+                if first:
+
+                    requested = (int(first), min(int(last), size - 1) if last else size - 1)
+
+                else:
+
+                    requested = (max(0, size - int(last)), size - 1)
+
+            except ValueError:
+
+                requested = None
+
+        if requested:
+
+            start, end = requested
+
+            if start > end:
+
+                self.send_response(416)
+                self.send_header("Content-Range", f'bytes */{size}')
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+                return
+
+            self.send_response(206)
+            self.send_header("Content-Range", f'bytes {start}-{end}/{size}')
+
+        else:
+
+            self.send_response(200)
+
+        self.send_header("Content-Type", "application/octet-stream")
+
+        if self.server.ranges:
+
+            self.send_header("Accept-Ranges", "bytes")
+
+        if self.server.chunked:
+
+            self.send_header("Transfer-Encoding", "chunked")
+
+        else:
+
+            self.send_header("Content-Length", str(end - start + 1))
+
+        self.end_headers()
+
+        self._send_body(start, end - start + 1)
+
+
+class BenchmarkServer:
+    """
+    Iniciar y detener el servidor en un hilo (Se puede usar con "with")
+
+    Ej:
+    - with BenchmarkServer(latency=0.05, bandwidth=1024 ** 2) as server:
+          download_file(server.url_of(1024 ** 2, "a.bin"))
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, bandwidth: int | None = None, ranges: bool = True, chunked: bool = False) -> None:
+        """
+        Parameters:
+        host (str): Dirección del servidor
+        port (int): Puerto (0 para uno libre cualquiera)
+        latency (float): Segundos de espera antes de cada respuesta
+        bandwidth (int | None): Bytes por segundo de cada respuesta (None sin límite)
+        ranges (bool): Aceptar peticiones de rangos (Range)
+        chunked (bool): Responder con "Transfer-Encoding: chunked" (sin Content-Length)
+        """
+
+        self.httpd = _QuietHTTPServer((host, port), BenchmarkHandler)
+
+        self.httpd.latency = latency
+        self.httpd.bandwidth = bandwidth
+        self.httpd.ranges = ranges
+        self.httpd.chunked = chunked
+
+        self.thread = Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+
+        host, port = self.httpd.server_address[:2]
+
+        return f'http://{host}:{port}'
+
+    def url_of(self, size: int, filename: str) -> str:
+        """
+        Obtener la URL de un archivo sintético de "size" bytes
+        """
+
+        return f'{self.url}/files/{size}/{filename}'
+
+    def start(self) -> "BenchmarkServer":
+
+        self.thread.start()
+
+        return self
+
+    def stop(self) -> None:
+
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "BenchmarkServer":
+
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+
+        self.stop()
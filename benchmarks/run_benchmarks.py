@@ -0,0 +1,331 @@
+"""
+Benchmarks de utilsdsp (descargas, organizar, tamaño, copiar, comprimir y sanear)
+
+Ej:
+    - python benchmarks/run_benchmarks.py --scales small,medium --output results.json
+    - python benchmarks/run_benchmarks.py --only download --latency 0.05 --bandwidth 1048576
+    - python benchmarks/run_benchmarks.py --compare results_anterior.json
+
+Funciones:
+    - bench_download: Descargar archivos desde el servidor local
+    - bench_download_chunked: Descargar archivos sin Content-Length (chunked)
+    - bench_organize: Organizar un directorio plano según los tipos
+    - bench_size: Obtener el tamaño de un árbol de directorios
+    - bench_copy: Copiar un árbol de directorios en paralelo
+    - bench_compress: Comprimir un árbol de directorios
+    - bench_sanitize: Sanear una lista de nombres de archivos
+    - run_benchmark: Repetir un benchmark y resumir sus tiempos
+    - compare_results: Comparar los resultados con otros anteriores
+    - main: Ejecutar los benchmarks desde la Terminal
+"""
+
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+from itertools import count
+from datetime import datetime
+from importlib import metadata
+
+# Usar el paquete del repositorio aunque no esté instalado
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utilsdsp import use_reporter, download_files, organize_files_by_type, obtain_size, copy_dirs_parallel, compress, sanitize_filenames
+from http_server import BenchmarkServer
+from synthetic_trees import generate_tree, generate_filenames, EXTENSIONS
+
+
+# Tamaños de cada escala
+SCALES = {
+    "small": {"files": 200, "file_size": 4096, "downloads": 10, "download_size": 1024 * 256, "names": 2000},
+    "medium": {"files": 2000, "file_size": 16384, "downloads": 40, "download_size": 1024 ** 2, "names": 20000},
+    "large": {"files": 20000, "file_size": 32768, "downloads": 100, "download_size": 1024 ** 2 * 4, "names": 200000}
+}
+
+# Repeticiones del benchmark de saneamiento (para variar la semilla)
+SANITIZE_RUNS = count()
+
+
+def bench_download(scale: dict, workdir: Path, options: argparse.Namespace, chunked: bool = False) -> dict:
+
+    with BenchmarkServer(latency=options.latency, bandwidth=options.bandwidth, chunked=chunked) as server:
+
+        urls = [server.url_of(scale["download_size"], f'file_{idx}.bin') for idx in range(scale["downloads"])]
+
+        start = time.perf_counter()
+
+        download_files(
+            urls,
+            path_dst=str(workdir / "downloads"),
+            max_workers=options.workers,
+            overwrite=True,
+            write_logs=False,
+            disable_pbar=True
+        )
+
+        seconds = time.perf_counter() - start
+
+    # Contar las descargas fallidas (archivos que faltan o incompletos)
+    downloaded = [path for path in (workdir / "downloads").glob("*.bin") if path.stat().st_size == scale["download_size"]]
+
+    return {
+        "seconds": seconds,
+        "items": len(urls),
+        "bytes": len(urls) * scale["download_size"],
+        "failed": len(urls) - len(downloaded)
+    }
+
+
+def bench_download_chunked(scale: dict, workdir: Path, options: argparse.Namespace) -> dict:
+
+    return bench_download(scale, workdir, options, chunked=True)
+
+
+def bench_organize(scale: dict, workdir: Path, options: argparse.Namespace) -> dict:
+
+    tree = generate_tree(workdir / "organize", scale["files"], depth=0, file_size=64, seed=options.seed)
+
+    start = time.perf_counter()
+
+    organize_files_by_type(tree["path"], {ext: ext.upper() for ext in EXTENSIONS})
+
+    return {"seconds": time.perf_counter() - start, "items": tree["files"], "bytes": tree["size"]}
+
+
+def bench_size(scale: dict, workdir: Path, options: argparse.Namespace) -> dict:
+
+    tree = generate_tree(workdir / "size", scale["files"], file_size=scale["file_size"], seed=options.seed)
+
+    start = time.perf_counter()
+
+    obtain_size(tree["path"])
+
+    return {"seconds": time.perf_counter() - start, "items": tree["files"], "bytes": tree["size"]}
+
+
+def bench_copy(scale: dict, workdir: Path, options: argparse.Namespace) -> dict:
+
+    tree = generate_tree(workdir / "copy", scale["files"], file_size=scale["file_size"], seed=options.seed)
+
+    start = time.perf_counter()
+
+    copy_dirs_parallel(tree["path"], workdir / "copy_dst", max_workers=options.workers, print_msg=False)
+
+    return {"seconds": time.perf_counter() - start, "items": tree["files"], "bytes": tree["size"]}
+
+
+def bench_compress(scale: dict, workdir: Path, options: argparse.Namespace) -> dict:
+
+    tree = generate_tree(workdir / "compress", scale["files"], file_size=scale["file_size"], seed=options.seed)
+
+    start = time.perf_counter()
+
+    compress(tree["path"], workdir / "compress_dst", options.compress_type, max_workers=options.workers)
+
+    return {"seconds": time.perf_counter() - start, "items": tree["files"], "bytes": tree["size"]}
+
+
+def bench_sanitize(scale: dict, workdir: Path, options: argparse.Namespace) -> dict:
+
+    # Otra semilla en cada repetición para no medir la caché
+    names = generate_filenames(scale["names"], seed=options.seed + next(SANITIZE_RUNS))
+
+    start = time.perf_counter()
+
+    sanitize_filenames(names, unique=True)
+
+    return {"seconds": time.perf_counter() - start, "items": len(names), "bytes": sum(len(name) for name in names)}
+
+
+# Benchmarks según su nombre
+BENCHMARKS = {
+    "download": bench_download,
+    "download_chunked": bench_download_chunked,
+    "organize": bench_organize,
+    "size": bench_size,
+    "copy": bench_copy,
+    "compress": bench_compress,
+    "sanitize": bench_sanitize
+}
+
+
+def run_benchmark(name: str, scale_name: str, options: argparse.Namespace) -> dict:
+    """
+    Repetir un benchmark (cada vez en un directorio temporal nuevo)
+    y resumir sus tiempos
+
+    Parameters:
+    name (str): Nombre del benchmark
+    scale_name (str): Nombre de la escala
+    options (argparse.Namespace): Opciones de la Terminal
+
+    Returns:
+    dict: Resultado (benchmark, scale, runs, min, median, failed, items_per_sec, bytes_per_sec)
+    """
+
+    runs = []
+
+    for _ in range(options.repeat):
+
+        workdir = Path(tempfile.mkdtemp(prefix=f'utilsdsp_bench_{name}_', dir=options.tmpdir))
+
+        try:
+
+            with use_reporter("silent"):
+
+                runs.append(BENCHMARKS[name](SCALES[scale_name], workdir, options))
+
+        finally:
+
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    seconds = [run["seconds"] for run in runs]
+    median = statistics.median(seconds)
+
+    # Los tiempos de las repeticiones con fallos no son un rendimiento
+    failed = sum(run.get("failed", 0) for run in runs)
+    valid = median and not failed
+
+    return {
+        "benchmark": name,
+        "scale": scale_name,
+        "params": SCALES[scale_name],
+        "runs": [round(value, 6) for value in seconds],
+        "min": round(min(seconds), 6),
+        "median": round(median, 6),
+        "failed": failed,
+        "items_per_sec": round(runs[0]["items"] / median, 2) if valid else None,
+        "bytes_per_sec": round(runs[0]["bytes"] / median, 2) if valid else None
+    }
+
+
+def compare_results(results: list, path_baseline: str | Path) -> None:
+    """
+    Comparar las medianas con las de unos resultados anteriores
+    (ratio > 1 significa más lento que antes, se omiten los fallidos)
+
+    Parameters:
+    results (list): Resultados actuales
+    path_baseline (str | Path): Archivo JSON con los resultados anteriores
+
+    Returns:
+    None
+    """
+
+    baseline = json.loads(Path(path_baseline).read_text("utf-8"))
+
+    previous = {(item["benchmark"], item["scale"]): item["median"] for item in baseline["results"]}
+
+    print(f'\n{"benchmark":<18}{"scale":<8}{"antes":>12}{"ahora":>12}{"ratio":>8}')
+
+    for item in results:
+
+        if item.get("failed") or not (before := previous.get((item["benchmark"], item["scale"]))):
+
+            continue
+
+        print(f'{item["benchmark"]:<18}{item["scale"]:<8}{before:>12.4f}{item["median"]:>12.4f}{item["median"] / before:>8.2f}')
+
+
+def __version_info() -> dict:
+    """
+    Obtener la versión del paquete y el commit actual (sí existen)
+    """
+
+    try:
+
+        version = metadata.version("utilsdsp")
+
+    except metadata.PackageNotFoundError:
+
+        version = None
+
+    try:
+
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+
+        commit = None
+
+    return {"version": version, "commit": commit}
+
+
+def main(argv: list | None = None) -> list:
+
+    parser = argparse.ArgumentParser(description="Benchmarks de utilsdsp")
+
+    parser.add_argument("--scales", default="small", help=f'Escalas separadas por comas ({", ".join(SCALES)})')
+    parser.add_argument("--only", default=",".join(BENCHMARKS), help=f'Benchmarks separados por comas ({", ".join(BENCHMARKS)})')
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones de cada benchmark")
+    parser.add_argument("--workers", type=int, default=4, help="Hilos de las descargas, copias y compresión")
+    parser.add_argument("--latency", type=float, default=0.0, help="Segundos de latencia del servidor local")
+    parser.add_argument("--bandwidth", type=int, default=None, help="Bytes por segundo de cada respuesta del servidor local")
+    parser.add_argument("--compress-type", default="zip", help="Tipo de comprimido (zip, gztar, zsttar, etc)")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla de los árboles sintéticos")
+    parser.add_argument("--tmpdir", default=None, help="Directorio para los archivos temporales")
+    parser.add_argument("--output", default=None, help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--compare", default=None, help="Archivo JSON con resultados anteriores a comparar")
+
+    options = parser.parse_args(argv)
+
+    scales = [scale for scale in options.scales.split(",") if scale]
+    names = [name for name in options.only.split(",") if name]
+
+    for value, valid in [*((scale, SCALES) for scale in scales), *((name, BENCHMARKS) for name in names)]:
+
+        if value not in valid:
+
+            parser.error(f'Valor no válido: {value}')
+
+    results = []
+
+    for scale in scales:
+
+        for name in names:
+
+            result = run_benchmark(name, scale, options)
+
+            results.append(result)
+
+            if result["failed"]:
+
+                print(f'{name:<18}{scale:<8}FALLIDO: {result["failed"]} elementos con errores')
+
+            else:
+
+                print(f'{name:<18}{scale:<8}mediana: {result["median"]:.4f}s  ({result["items_per_sec"]} elementos/s)')
+
+    if options.output:
+
+        Path(options.output).write_text(json.dumps({
+            **__version_info(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "options": {key: value for key, value in vars(options).items() if key not in ("output", "compare")},
+            "results": results
+        }, indent=2), "utf-8")
+
+    if options.compare:
+
+        compare_results(results, options.compare)
+
+    return results
+
+
+if __name__ == "__main__":
+
+    main()
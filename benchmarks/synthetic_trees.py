@@ -0,0 +1,96 @@
+"""
+Generar directorios sintéticos para los benchmarks:
+    - generate_tree: Crear un árbol de directorios con la forma indicada
+    - generate_filenames: Generar nombres de archivos "sucios" para sanear
+"""
+
+import os
+import random
+from pathlib import Path
+
+
+# Extensiones por defecto de los archivos generados
+EXTENSIONS = ("txt", "jpg", "png", "pdf", "mp4", "zip", "html", "json")
+
+
+def generate_tree(path_dst: str | Path, files: int = 1000, depth: int = 2, fanout: int = 4, file_size: int = 4096, size_jitter: float = 0.5, extensions: tuple = EXTENSIONS, seed: int = 0) -> dict:
+    """
+    Crear un árbol de directorios con la forma indicada
+    (Mismo contenido con la misma semilla)
+
+    Parameters:
+    path_dst (str | Path): Directorio raíz a crear
+    files (int): Cantidad total de archivos
+    depth (int): Niveles de sub-directorios (0 para un directorio plano)
+    fanout (int): Sub-directorios por cada directorio
+    file_size (int): Tamaño promedio de los archivos en bytes
+    size_jitter (float): Variación del tamaño (0.5 -> entre 50% y 150%)
+    extensions (tuple): Extensiones de los archivos (se reparten al azar)
+    seed (int): Semilla del generador aleatorio
+
+    Returns:
+    dict: Datos del árbol creado (path, files, dirs, size)
+    """
+
+    rand = random.Random(seed)
+    root = Path(path_dst)
+
+    # Conformar todos los directorios de cada nivel
+    dirs = [root]
+    level = [root]
+
+    for _ in range(depth):
+
+        level = [parent / f'dir_{idx:03d}' for parent in level for idx in range(fanout)]
+
+        dirs.extend(level)
+
+    for dir_ in dirs:
+
+        os.makedirs(dir_, exist_ok=True)
+
+    # Bloque aleatorio del que se toman los contenidos
+    block = rand.randbytes(max(1, int(file_size * (1 + size_jitter))))
+
+    total_size = 0
+
+    for idx in range(files):
+
+        size = max(0, int(file_size * rand.uniform(1 - size_jitter, 1 + size_jitter)))
+        ext = rand.choice(extensions)
+
+        with open(rand.choice(dirs) / f'file_{idx:07d}.{ext}', "wb") as file:
+
+            file.write(block[:size])
+
+        total_size += size
+
+    return {
+        "path": str(root),
+        "files": files,
+        "dirs": len(dirs),
+        "size": total_size
+    }
+
+
+def generate_filenames(amount: int = 10000, length: int = 80, seed: int = 0) -> list:
+    """
+    Generar nombres de archivos con caracteres inválidos, espacios
+    repetidos, acentos y emojis, para los benchmarks de saneamiento
+
+    Parameters:
+    amount (int): Cantidad de nombres
+    length (int): Cantidad de caracteres de cada nombre
+    seed (int): Semilla del generador aleatorio
+
+    Returns:
+    list: Nombres generados
+    """
+
+    rand = random.Random(seed)
+
+    chars = "abcdefghijklmnopqrstuvwxyz0123456789" * 4 + '   <>:"/\\|?*áéíóúñ' + "😀👍🏽"
+
+    return [
+        "".join(rand.choices(chars, k=length)) + "." + rand.choice(EXTENSIONS) for _ in range(amount)
+    ]
@@ -14,7 +14,7 @@ setup(
     long_description=long_desc,
     long_description_content_type='text/markdown',
     url='https://github.com/dunieskysp/utils_dsp',
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*", "tests", "tests.*"]),
     install_requires=[
         "outputstyles>=1.0.0",
         "validators>=0.28.1",
@@ -22,6 +22,14 @@ setup(
         "tqdm>=4.66.2",
         "curl_cffi>=0.9.0"
     ],
+    entry_points={
+        "console_scripts": ["utilsdsp=utilsdsp.utilsdsp_cli:main"]
+    },
+    extras_require={
+        "zstd": ["zstandard>=0.22.0"],
+        "lz4": ["lz4>=4.3.0"],
+        "numpy": ["numpy>=1.24.0"]
+    },
     keywords=['python', 'utilsdsp'],
     classifiers=[
         "Development Status :: 3 - Alpha",
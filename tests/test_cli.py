@@ -0,0 +1,67 @@
+"""
+Pruebas de la línea de comandos
+"""
+
+import sys
+import json
+import subprocess
+import pytest
+from pathlib import Path
+from utilsdsp.utilsdsp_cli import build_parser, main
+
+
+def test_build_parser_subcommands() -> None:
+
+    parser = build_parser()
+
+    args = parser.parse_args(["size", "a", "b", "--json", "-w", "4", "--unit", "MB"])
+
+    assert (args.command, args.paths, args.json, args.workers, args.unit) == ("size", ["a", "b"], True, 4, "MB")
+
+    args = parser.parse_args(["sync", "src", "dst", "--delete"])
+
+    assert (args.src, args.dst, args.delete, args.checksum) == ("src", "dst", True, False)
+
+    # Sin subcomando o con una unidad no válida
+    for argv in [[], ["size", "a", "--unit", "PB"]]:
+
+        with pytest.raises(SystemExit):
+
+            parser.parse_args(argv)
+
+
+def test_size_json_returns_raw_bytes(tmp_path: Path, capsys) -> None:
+
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "a.txt").write_bytes(b"a" * 1500)
+    (tmp_path / "b.txt").write_bytes(b"b" * 10)
+
+    code = main(["size", str(tmp_path / "dir"), str(tmp_path / "b.txt"), "--json"])
+
+    output = json.loads(capsys.readouterr().out)
+
+    assert code == 0
+    assert [item["size"] for item in output["result"]] == [1500, 10]
+
+
+def test_exit_code_is_1_on_errors(tmp_path: Path, capsys) -> None:
+
+    code = main(["size", str(tmp_path / "missing"), "--json"])
+
+    output = json.loads(capsys.readouterr().out)
+
+    assert code == 1
+    assert output["messages"]["error"] == 1
+
+    # Tipos sin el formato "ext=Carpeta"
+    assert main(["organize", str(tmp_path), "--type", "jpg", "--quiet"]) == 1
+
+
+def test_import_is_lazy() -> None:
+
+    # Importar la línea de comandos no carga las descargas ni la compresión
+    code = "import sys, json, utilsdsp.utilsdsp_cli; print(json.dumps(sorted(name for name in sys.modules if name.startswith('utilsdsp.'))))"
+
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert json.loads(output) == ["utilsdsp.utilsdsp_cli", "utilsdsp.utilsdsp_report"]
@@ -0,0 +1,354 @@
+"""
+Pruebas de la compresión de archivos y directorios
+"""
+
+import pytest
+from pathlib import Path
+from utilsdsp import compress, list_archive, use_reporter
+
+
+@pytest.fixture
+def path_src(tmp_path: Path) -> Path:
+
+    src = tmp_path / "src"
+
+    (src / "sub").mkdir(parents=True)
+    (src / "a.txt").write_text("a" * 1000)
+    (src / "sub" / "b.txt").write_text("b" * 1000)
+
+    return src
+
+
+@pytest.mark.parametrize("compress_type, options", [
+    ("gztar", {}),
+    ("gztar", {"max_workers": 2}),
+    ("zip", {}),
+    ("zip", {"level": 5}),
+    ("zsttar", {}),
+    ("gztar", {"volume_size": 512})
+])
+def test_compress_creates_missing_path_dst(path_src: Path, tmp_path: Path, compress_type: str, options: dict) -> None:
+
+    # El directorio de destino (y su padre) aún no existen
+    path_dst = tmp_path / "new" / "dir"
+
+    with use_reporter("counters") as reporter:
+
+        result = compress(path_src, path_dst, compress_type, **options)
+
+    assert result is not None
+    assert Path(result).parent == path_dst.resolve()
+    assert reporter.summary()["error"] == 0
+
+    # Los volúmenes no se pueden listar por separado
+    if not options.get("volume_size"):
+
+        assert "src/sub/b.txt" in list_archive(result, use_index=False)
+
+
+def test_compress_volume_error_reports_real_path_once(path_src: Path, tmp_path: Path, monkeypatch) -> None:
+
+    from utilsdsp import CountersReporter
+    from utilsdsp.utilsdsp_compress import _VolumeWriter
+
+    next_volume = _VolumeWriter._next_volume
+
+    # No se puede abrir el segundo volumen (Ej: disco lleno)
+    def failing_next_volume(self) -> None:
+
+        if self.volumes:
+
+            raise OSError("No space left on device")
+
+        next_volume(self)
+
+    monkeypatch.setattr(_VolumeWriter, "_next_volume", failing_next_volume)
+
+    class TextReporter(CountersReporter):
+
+        def __init__(self) -> None:
+
+            super().__init__()
+
+            self.messages = []
+
+        def report(self, level: str, *args, sep: str = " ", end: str = "\n") -> None:
+
+            super().report(level, *args, sep=sep, end=end)
+
+            self.messages.append(sep.join(str(arg) for arg in args))
+
+    (path_src / "c.bin").write_bytes(bytes(range(256)) * 64)
+
+    with use_reporter(TextReporter()) as reporter:
+
+        result = compress(path_src, tmp_path / "dst", "tar", volume_size=4096)
+
+    assert result is None
+    assert reporter.summary()["error"] == 1
+    assert "_VolumeWriter" not in reporter.messages[0]
+    assert "src.tar.001" in reporter.messages[0]
+
+    # No quedan volúmenes incompletos
+    assert not list((tmp_path / "dst").iterdir())
+
+
+def test_uncompress_pipelined_defers_directory_attributes_and_hardlinks(tmp_path: Path) -> None:
+
+    import io
+    import tarfile
+    from utilsdsp import uncompress
+
+    path_src = tmp_path / "data.tar"
+
+    # Un directorio de solo lectura antes de sus archivos y un enlace
+    # duro a un archivo escrito por otro hilo
+    with tarfile.open(path_src, "w") as tar:
+
+        folder = tarfile.TarInfo("data/ro")
+        folder.type = tarfile.DIRTYPE
+        folder.mode = 0o555
+        folder.mtime = 1_000_000_000
+
+        tar.addfile(folder)
+
+        for idx in range(20):
+
+            content = f'file {idx}'.encode()
+
+            member = tarfile.TarInfo(f'data/ro/file_{idx}.txt')
+            member.size = len(content)
+            member.mode = 0o644
+
+            tar.addfile(member, io.BytesIO(content))
+
+        link = tarfile.TarInfo("data/ro/link.txt")
+        link.type = tarfile.LNKTYPE
+        link.linkname = "data/ro/file_19.txt"
+
+        tar.addfile(link)
+
+    path_dst = tmp_path / "out"
+
+    try:
+
+        with use_reporter("counters") as reporter:
+
+            result = uncompress(path_src, path_dst, max_workers=4)
+
+        folder_dst = path_dst / "data" / "ro"
+
+        assert result is not None
+        assert reporter.summary()["error"] == 0
+        assert len(list(folder_dst.glob("file_*.txt"))) == 20
+        assert (folder_dst / "link.txt").read_text() == "file 19"
+        assert folder_dst.stat().st_mtime == 1_000_000_000
+
+    finally:
+
+        # Permitir que pytest borre el directorio temporal
+        if (path_dst / "data" / "ro").exists():
+
+            (path_dst / "data" / "ro").chmod(0o755)
+
+
+@pytest.mark.parametrize("filename", ["report.2024", "data.001", "backup.tar.002"])
+def test_uncompress_numeric_suffix_is_not_a_volume_set(tmp_path: Path, filename: str) -> None:
+
+    from utilsdsp import uncompress
+
+    # Archivos con una extensión numérica que no son volúmenes (en
+    # "backup.tar.002" falta el primer volumen)
+    path_src = tmp_path / filename
+
+    path_src.write_bytes(b"not an archive")
+
+    with use_reporter("counters") as reporter:
+
+        result = uncompress(path_src, tmp_path / "out")
+
+    assert result is None
+    assert reporter.summary()["warning"] == 1
+    assert reporter.summary()["error"] == 0
+
+
+def test_uncompress_volume_set_round_trip(path_src: Path, tmp_path: Path) -> None:
+
+    from utilsdsp import uncompress
+
+    with use_reporter("counters") as reporter:
+
+        first = compress(path_src, tmp_path / "dst", "gztar", volume_size=512)
+
+        result = uncompress(first, tmp_path / "out")
+
+    assert result is not None
+    assert reporter.summary()["error"] == 0
+    assert (tmp_path / "out" / "src" / "sub" / "b.txt").read_text() == "b" * 1000
+
+
+@pytest.mark.parametrize("use_index", [False, True], ids=["stream", "index"])
+@pytest.mark.parametrize("compress_type, options", [("tar", {}), ("gztar", {}), ("gztar", {"max_workers": 2})])
+def test_extract_members(path_src: Path, tmp_path: Path, compress_type: str, options: dict, use_index: bool) -> None:
+
+    from utilsdsp import extract_members
+
+    for idx in range(10):
+
+        (path_src / f'file_{idx}.txt').write_text(f'content {idx}' * 100)
+
+    with use_reporter("counters") as reporter:
+
+        archive = compress(path_src, tmp_path / "dst", compress_type, **options)
+
+        names = list_archive(archive)
+
+        result = extract_members(archive, ["src/file_7.txt", "src/sub/*"], tmp_path / "out", use_index=use_index)
+
+    assert "src/file_7.txt" in names
+    assert reporter.summary()["error"] == 0
+    assert len(result) == 2
+    assert (tmp_path / "out" / "src" / "file_7.txt").read_text() == "content 7" * 100
+    assert (tmp_path / "out" / "src" / "sub" / "b.txt").read_text() == "b" * 1000
+
+    # El índice solo se guarda sí se pide
+    assert Path(f'{archive}.index.json').exists() == use_index
+
+
+def test_extract_members_index_decompresses_each_block_once(path_src: Path, tmp_path: Path, monkeypatch) -> None:
+
+    from utilsdsp import extract_members
+    from utilsdsp import utilsdsp_compress
+
+    for idx in range(50):
+
+        (path_src / f'file_{idx}.txt').write_text(f'content {idx}')
+
+    archive = compress(path_src, tmp_path / "dst", "gztar")
+
+    # Construir el índice antes de contar
+    list_archive(archive, use_index=True)
+
+    opened = []
+    open_decompressed = getattr(utilsdsp_compress, "__open_decompressed")
+
+    def counting(fileobj, compress_type):
+
+        opened.append(fileobj.tell())
+
+        return open_decompressed(fileobj, compress_type)
+
+    monkeypatch.setattr(utilsdsp_compress, "__open_decompressed", counting)
+
+    result = extract_members(archive, "src/file_*", tmp_path / "out", use_index=True)
+
+    # Un tar.gz normal es un solo bloque: una sola pasada
+    assert len(result) == 50
+    assert len(opened) == 1
+
+
+@pytest.mark.parametrize("use_index", [False, True], ids=["stream", "index"])
+@pytest.mark.parametrize("mode", ["w", "w:gz"])
+def test_extract_members_resolves_hardlinks_and_continues_after_errors(tmp_path: Path, mode: str, use_index: bool) -> None:
+
+    import io
+    import tarfile
+    from utilsdsp import extract_members
+
+    path_src = tmp_path / ("data.tar" if mode == "w" else "data.tar.gz")
+
+    with tarfile.open(path_src, mode) as tar:
+
+        for name in ["data/target.txt", "data/other.txt"]:
+
+            member = tarfile.TarInfo(name)
+            member.size = len(name)
+
+            tar.addfile(member, io.BytesIO(name.encode()))
+
+        # Un enlace duro a un miembro que no se selecciona
+        link = tarfile.TarInfo("data/link.txt")
+        link.type = tarfile.LNKTYPE
+        link.linkname = "data/target.txt"
+
+        tar.addfile(link)
+
+        # Un miembro que no se puede extraer (fuera del destino)
+        evil = tarfile.TarInfo("data/../../evil.txt")
+        evil.size = 4
+
+        tar.addfile(evil, io.BytesIO(b"evil"))
+
+    with use_reporter("counters") as reporter:
+
+        result = extract_members(path_src, ["data/link.txt", "data/other.txt", "data/../../evil.txt"], tmp_path / "out", use_index=use_index)
+
+    assert sorted(Path(path).name for path in result) == ["link.txt", "other.txt"]
+    assert (tmp_path / "out" / "data" / "link.txt").read_text() == "data/target.txt"
+    assert reporter.summary()["error"] == 1
+    assert not (tmp_path / "evil.txt").exists()
+
+
+@pytest.mark.parametrize("name", ["../evil.txt", "sub/../../evil.txt"])
+def test_uncompress_pipelined_rejects_members_outside_without_data_filter(tmp_path: Path, monkeypatch, name: str) -> None:
+
+    import io
+    import tarfile
+    from utilsdsp import uncompress
+
+    # Python anterior a 3.11.4 (sin el filtro "data")
+    monkeypatch.delattr(tarfile, "data_filter", raising=False)
+
+    path_src = tmp_path / "evil.tar"
+
+    with tarfile.open(path_src, "w") as tar:
+
+        member = tarfile.TarInfo(name)
+        member.size = 4
+
+        tar.addfile(member, io.BytesIO(b"evil"))
+
+    (tmp_path / "out").mkdir()
+
+    with use_reporter("counters") as reporter:
+
+        result = uncompress(path_src, tmp_path / "out", max_workers=2)
+
+    assert result is None
+    assert reporter.summary()["error"] == 1
+    assert not (tmp_path / "evil.txt").exists()
+
+
+@pytest.mark.parametrize("compress_type", ["gztar", "bztar", "xztar"])
+def test_block_writer_only_with_max_workers(path_src: Path, tmp_path: Path, monkeypatch, compress_type: str) -> None:
+
+    from utilsdsp import compress_files
+    from utilsdsp import utilsdsp_compress
+
+    created = []
+
+    class CountingWriter(utilsdsp_compress._BlockCompressWriter):
+
+        def __init__(self, *args, **kwargs) -> None:
+
+            created.append(args)
+
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(utilsdsp_compress, "_BlockCompressWriter", CountingWriter)
+
+    files = sorted(path for path in path_src.rglob("*") if path.is_file())
+
+    # Un solo flujo sin hilos (también con un nivel de compresión o en volúmenes)
+    single = compress_files(files, tmp_path / "single.tar", compress_type, root_dir=path_src)
+    level = compress(path_src, tmp_path / "level", compress_type=compress_type, level=1)
+
+    assert compress(path_src, tmp_path / "volumes", compress_type=compress_type, volume_size=1024 ** 2)
+    assert created == []
+
+    blocks = compress_files(files, tmp_path / "blocks.tar", compress_type, root_dir=path_src, max_workers=2)
+
+    assert len(created) == 1
+
+    assert list_archive(single) == list_archive(blocks) == ["a.txt", "sub/b.txt"]
+    assert list_archive(level) == ["src", "src/a.txt", "src/sub", "src/sub/b.txt"]
@@ -0,0 +1,54 @@
+"""
+Pruebas de las operaciones con diccionarios
+"""
+
+import pytest
+from itertools import count
+from utilsdsp import join_iters_to_dict, join_list_to_dict, use_reporter
+
+
+@pytest.mark.parametrize("duplicates, expected", [
+    ("last", {"txt": "Documentos", "jpg": "Imagenes"}),
+    ("first", {"txt": "Textos", "jpg": "Imagenes"}),
+    ("group", {"txt": ["Textos", "Documentos"], "jpg": ["Imagenes"]})
+])
+def test_join_iters_to_dict_duplicates(duplicates: str, expected: dict) -> None:
+
+    keys = ["txt", "jpg", "txt"]
+    values = ["Textos", "Imagenes", "Documentos"]
+
+    assert join_iters_to_dict(keys, values, duplicates=duplicates) == expected
+
+
+def test_join_iters_to_dict_single_pass_iterators() -> None:
+
+    # Generadores (solo se pueden recorrer una vez) y llaves no string
+    keys = (number for number in range(3))
+    values = (number * 10 for number in range(3))
+
+    assert join_iters_to_dict(keys, values) == {"0": 0, "1": 10, "2": 20}
+    assert join_iters_to_dict(range(2), "ab", keys_to_str=False) == {0: "a", 1: "b"}
+    assert join_list_to_dict([], []) == {}
+
+
+@pytest.mark.parametrize("keys, values", [
+    (["a", "b", "c"], [1, 2]),
+    (["a"], [1, 2, 3]),
+    (count(), [1, 2])
+], ids=["extra-keys", "extra-values", "infinite-keys"])
+def test_join_iters_to_dict_reports_mismatched_lengths_once(keys, values) -> None:
+
+    with use_reporter("counters") as reporter:
+
+        assert join_iters_to_dict(keys, values) is None
+
+    assert reporter.summary()["error"] == 1
+
+
+def test_join_iters_to_dict_rejects_unknown_duplicates_policy() -> None:
+
+    with use_reporter("counters") as reporter:
+
+        assert join_iters_to_dict(["a"], [1], duplicates="sum") is None
+
+    assert reporter.summary()["error"] == 1
@@ -0,0 +1,217 @@
+"""
+Pruebas de las operaciones con directorios
+"""
+
+import os
+import errno
+import pytest
+import threading
+from pathlib import Path
+from utilsdsp import sync_dirs, copy_dirs, copy_dirs_parallel, move_dirs_batch, delete_dir, use_reporter
+from utilsdsp import utilsdsp_dirs
+
+
+def test_sync_dirs_copies_symlinks_as_links(tmp_path: Path) -> None:
+
+    path_src = tmp_path / "src"
+    path_dst = tmp_path / "dst"
+    outside = tmp_path / "outside.txt"
+
+    (path_src / "sub").mkdir(parents=True)
+    (path_src / "sub" / "file.txt").write_text("data")
+    outside.write_text("outside")
+
+    # Un enlace roto, uno a un directorio y uno a un archivo
+    os.symlink("missing.txt", path_src / "broken")
+    os.symlink("sub", path_src / "linked_dir")
+    os.symlink("sub/file.txt", path_src / "linked_file")
+
+    # El destino tiene un enlace a un archivo externo con el nombre de un archivo
+    path_dst.mkdir()
+    os.symlink(outside, path_dst / "plain.txt")
+    (path_src / "plain.txt").write_text("plain")
+
+    with use_reporter("counters") as reporter:
+
+        summary = sync_dirs(path_src, path_dst, print_msg=False)
+
+    assert summary["errors"] == 0
+    assert reporter.summary()["error"] == 0
+
+    assert os.readlink(path_dst / "broken") == "missing.txt"
+    assert os.readlink(path_dst / "linked_dir") == "sub"
+    assert os.readlink(path_dst / "linked_file") == "sub/file.txt"
+    assert not (path_dst / "plain.txt").is_symlink()
+    assert (path_dst / "plain.txt").read_text() == "plain"
+
+    # No se escribió a través del enlace del destino
+    assert outside.read_text() == "outside"
+
+    # Una segunda sincronización no cambia nada
+    summary = sync_dirs(path_src, path_dst, delete=True, print_msg=False)
+
+    assert summary["new"] == summary["updated"] == summary["deleted"] == []
+    assert summary["errors"] == 0
+
+
+def test_sync_dirs_deletes_extraneous_symlinks(tmp_path: Path) -> None:
+
+    path_src = tmp_path / "src"
+    path_dst = tmp_path / "dst"
+    target = tmp_path / "target"
+
+    path_src.mkdir()
+    (target / "keep").mkdir(parents=True)
+    path_dst.mkdir()
+
+    os.symlink(target, path_dst / "dir_link")
+    os.symlink("missing", path_dst / "broken")
+
+    summary = sync_dirs(path_src, path_dst, delete=True, print_msg=False)
+
+    assert sorted(summary["deleted"]) == ["broken", "dir_link"]
+    assert summary["errors"] == 0
+
+    # No se eliminó el contenido del destino del enlace
+    assert (target / "keep").is_dir()
+
+
+def test_copy_dirs_sync_updates_modified_files(tmp_path: Path) -> None:
+
+    path_src = tmp_path / "src"
+    path_dst = tmp_path / "dst"
+
+    path_src.mkdir()
+    (path_src / "file.txt").write_text("v1")
+
+    assert copy_dirs(path_src, path_dst, sync=True, print_msg=False) == str(path_dst / "src")
+
+    (path_src / "file.txt").write_text("version 2")
+
+    # Con "sync" se reemplazan los archivos modificados aunque "overwrite" sea False
+    copy_dirs(path_src, path_dst, sync=True, print_msg=False)
+
+    assert (path_dst / "src" / "file.txt").read_text() == "version 2"
+
+
+def test_copy_dirs_parallel_copies_dirs_metadata(tmp_path: Path) -> None:
+
+    path_src = tmp_path / "src"
+
+    (path_src / "sub").mkdir(parents=True)
+    (path_src / "sub" / "file.txt").write_text("data")
+    (path_src / "file.txt").write_text("data")
+
+    os.chmod(path_src / "sub", 0o750)
+
+    # Fechas antiguas en los directorios (después de crear su contenido)
+    for path in [path_src / "sub", path_src]:
+
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+
+    stats = copy_dirs_parallel(path_src, tmp_path / "dst", max_workers=2, print_msg=False)
+
+    assert stats["errors"] == 0
+    assert stats["files"] == 2
+
+    for rel in ["", "sub"]:
+
+        stat_src = (path_src / rel).stat()
+        stat_dst = (tmp_path / "dst" / "src" / rel).stat()
+
+        assert int(stat_dst.st_mtime) == int(stat_src.st_mtime)
+        assert stat_dst.st_mode == stat_src.st_mode
+
+
+@pytest.mark.parametrize("partial", [0, 3], ids=["nothing", "partial"])
+def test_copy_file_fast_falls_back_when_copy_file_range_stops_early(tmp_path: Path, monkeypatch, partial: int) -> None:
+
+    if not hasattr(os, "copy_file_range"):
+
+        pytest.skip("os.copy_file_range no está disponible")
+
+    copy_file_range = os.copy_file_range
+    calls = []
+
+    # Copiar solo "partial" bytes y luego devolver 0 (Ej: en FUSE)
+    def fake_copy_file_range(fd_src, fd_dst, count, *args):
+
+        calls.append(count)
+
+        return copy_file_range(fd_src, fd_dst, partial) if len(calls) == 1 and partial else 0
+
+    monkeypatch.setattr(utilsdsp_dirs, "fcntl", None)
+    monkeypatch.setattr(os, "copy_file_range", fake_copy_file_range)
+    monkeypatch.setattr(os, "sendfile", lambda *args: 0)
+
+    path_src = tmp_path / "file.bin"
+    path_src.write_bytes(bytes(range(256)) * 40)
+
+    copied = getattr(utilsdsp_dirs, "__copy_file_fast")(str(path_src), str(tmp_path / "copy.bin"))
+
+    assert copied == path_src.stat().st_size
+    assert (tmp_path / "copy.bin").read_bytes() == path_src.read_bytes()
+
+
+def test_move_dirs_batch_falls_back_to_copy_across_filesystems(tmp_path: Path, monkeypatch) -> None:
+
+    path_src = tmp_path / "src"
+
+    (path_src / "dir" / "sub").mkdir(parents=True)
+    (path_src / "dir" / "sub" / "file.txt").write_text("data")
+    (path_src / "file.txt").write_text("data")
+
+    path_dst = tmp_path / "dst"
+    path_dst.mkdir()
+    (path_dst / "file.txt").write_text("old")
+
+    # Simular que el destino está en otro sistema de archivos
+    def fake_rename(src, dst, *args, **kwargs):
+
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(os, "rename", fake_rename)
+
+    with use_reporter("counters"):
+
+        summary = move_dirs_batch([path_src / "dir", path_src / "file.txt", path_src / "missing"], path_dst, print_msg=False)
+
+    assert summary == {"moved": 1, "skipped": 1, "errors": 1}
+    assert (path_dst / "dir" / "sub" / "file.txt").read_text() == "data"
+    assert not (path_src / "dir").exists()
+
+    # Sobrescribir el archivo que ya existe
+    summary = move_dirs_batch([path_src / "file.txt"], path_dst, overwrite=True, print_msg=False)
+
+    assert summary == {"moved": 1, "skipped": 0, "errors": 0}
+    assert (path_dst / "file.txt").read_text() == "data"
+    assert not (path_src / "file.txt").exists()
+
+
+@pytest.mark.parametrize("options", [{"max_workers": 4}, {"background": True}, {"max_workers": 4, "background": True}], ids=["parallel", "background", "background-parallel"])
+def test_delete_dir_parallel_and_background(tmp_path: Path, options: dict) -> None:
+
+    path = tmp_path / "tree"
+
+    for number in range(5):
+
+        (path / f'dir_{number}' / "sub").mkdir(parents=True)
+
+        for item in range(10):
+
+            (path / f'dir_{number}' / "sub" / f'file_{item}.txt').write_text("data")
+
+    os.symlink(tmp_path, path / "link")
+
+    assert delete_dir(path, print_msg=False, **options)
+    assert not path.exists()
+
+    # Esperar a que termine la eliminación en segundo plano
+    for thread in threading.enumerate():
+
+        if thread.name == "utilsdsp-delete":
+
+            thread.join(timeout=10)
+
+    # No queda la papelera y no se siguió el enlace simbólico
+    assert [item.name for item in tmp_path.iterdir()] == []
@@ -0,0 +1,201 @@
+"""
+Pruebas de las descargas
+"""
+
+import io
+import tarfile
+import zipfile
+import pytest
+import requests
+
+from utilsdsp import download_file, download_files, download_files_to_archive, use_reporter
+from utilsdsp import utilsdsp_downloads
+
+
+class FakeResponse:
+
+    def __init__(self, chunks: list, fail: bool = False) -> None:
+
+        self.url = "https://example.com/file.bin"
+        self.headers = {"Content-Length": str(sum(len(chunk) for chunk in chunks) + (10 if fail else 0))}
+        self.chunks = chunks
+        self.fail = fail
+
+    def iter_content(self, chunk_size: int = 1):
+
+        yield from self.chunks
+
+        # Simular un corte a mitad de la transferencia
+        if self.fail:
+
+            raise requests.exceptions.ConnectionError("reset")
+
+
+def test_download_files_adaptive_survives_unexpected_errors(tmp_path, monkeypatch) -> None:
+
+    downloaded = []
+
+    # Una de las descargas levanta una excepción inesperada
+    def fake_download_file(url, filename, path_dst, **kwargs):
+
+        if url.endswith("/boom"):
+
+            raise ValueError("boom")
+
+        downloaded.append(url)
+
+        return str(tmp_path / filename)
+
+    monkeypatch.setattr(utilsdsp_downloads, "download_file", fake_download_file)
+
+    urls = ["https://example.com/boom"] + [f'https://example.com/file_{idx}' for idx in range(6)]
+
+    download_files(urls, path_dst=str(tmp_path), max_workers=2, write_logs=False, disable_pbar=True, adaptive=True)
+
+    assert len(downloaded) == 6
+
+
+def test_download_files_to_archive_overwrite_removes_stale_archives(tmp_path) -> None:
+
+    # Comprimidos de una descarga anterior con más partes
+    stale = [tmp_path / f'downloads-{number:05d}.tar' for number in range(1, 4)]
+
+    for path in stale:
+
+        path.write_bytes(b"old")
+
+    with use_reporter("counters") as reporter:
+
+        result = download_files_to_archive(["not a url"], path_dst=str(tmp_path), max_archive_size=1024, write_logs=False, disable_pbar=True)
+
+    assert result is None
+    assert reporter.summary()["warning"] == 1
+    assert all(path.exists() for path in stale)
+
+    with use_reporter("counters"):
+
+        result = download_files_to_archive(["not a url"], path_dst=str(tmp_path), max_archive_size=1024, overwrite=True, write_logs=False, disable_pbar=True)
+
+    assert result is not None
+    assert not any(path.exists() for path in stale)
+
+
+def test_download_file_removes_partial_file_on_interrupted_transfer(tmp_path, monkeypatch) -> None:
+
+    responses = [FakeResponse([b"a" * 10], fail=True), FakeResponse([b"a" * 20])]
+
+    monkeypatch.setattr(utilsdsp_downloads, "validate_and_resquest", lambda *args, **kwargs: responses.pop(0))
+
+    filepath = tmp_path / "file.bin"
+
+    with use_reporter("counters") as reporter:
+
+        result = download_file("https://example.com/file.bin", filename="file.bin", path_dst=str(tmp_path), write_logs=False, disable_pbar=True)
+
+    assert result is None
+    assert reporter.summary()["error"] == 1
+    assert list(tmp_path.iterdir()) == []
+
+    # El reintento no se encuentra el archivo incompleto
+    with use_reporter("counters"):
+
+        result = download_file("https://example.com/file.bin", filename="file.bin", path_dst=str(tmp_path), write_logs=False, disable_pbar=True)
+
+    assert result == str(filepath)
+    assert filepath.read_bytes() == b"a" * 20
+
+
+def build_archive(compress_type: str) -> bytes:
+
+    buffer = io.BytesIO()
+
+    if compress_type == "zip":
+
+        with zipfile.ZipFile(buffer, "w") as zip_file:
+
+            zip_file.writestr("data/file.txt", "new")
+
+    else:
+
+        with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+
+            info = tarfile.TarInfo("data/file.txt")
+            info.size = 3
+
+            tar.addfile(info, io.BytesIO(b"new"))
+
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("compress_type", ["zip", "tar.gz"])
+@pytest.mark.parametrize("options, content, renamed", [
+    ({}, "old", False),
+    ({"overwrite": True}, "new", False),
+    ({"rename": True}, "old", True)
+], ids=["keep", "overwrite", "rename"])
+def test_download_file_extract_applies_exists_policy(tmp_path, monkeypatch, compress_type: str, options: dict, content: str, renamed: bool) -> None:
+
+    data = build_archive(compress_type)
+
+    monkeypatch.setattr(utilsdsp_downloads, "validate_and_resquest", lambda *args, **kwargs: FakeResponse([data]))
+
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "file.txt").write_text("old")
+
+    with use_reporter("counters") as reporter:
+
+        result = download_file("https://example.com/data", filename=f'data.{compress_type}', path_dst=str(tmp_path), write_logs=False, disable_pbar=True, extract=True, **options)
+
+    assert result == str(tmp_path / "data")
+    assert reporter.summary()["warning"] == (0 if options else 1)
+    assert (tmp_path / "data" / "file.txt").read_text() == content
+    assert (tmp_path / "data" / "file_1.txt").exists() == renamed
+
+
+def test_download_file_extract_reports_failure_once(tmp_path, monkeypatch) -> None:
+
+    monkeypatch.setattr(utilsdsp_downloads, "validate_and_resquest", lambda *args, **kwargs: FakeResponse([b"not an archive"]))
+
+    with use_reporter("counters") as reporter:
+
+        result = download_file("https://example.com/data", filename="data.tar.gz", path_dst=str(tmp_path), write_logs=False, disable_pbar=True, extract=True)
+
+    assert result is None
+    assert reporter.summary()["error"] == 1
+
+
+def test_download_files_to_archive_sanitizes_dirs_and_survives_unexpected_errors(tmp_path, monkeypatch) -> None:
+
+    # Una de las descargas levanta una excepción inesperada
+    def fake_fetch_payload(url, filename, arcdir, **kwargs):
+
+        if url.endswith("/boom"):
+
+            raise ValueError("boom")
+
+        buffer = io.BytesIO(b"data")
+
+        return (f'{arcdir}/{filename}' if arcdir else filename), buffer, 4
+
+    monkeypatch.setattr(utilsdsp_downloads, "__fetch_payload", fake_fetch_payload)
+
+    urls = [
+        "https://example.com/boom, boom.txt",
+        "https://example.com/a, a.txt, ../../escape",
+        "https://example.com/b, b.txt, /absolute/dir",
+        "https://example.com/c, c.txt, sub"
+    ]
+
+    with use_reporter("counters") as reporter:
+
+        result = download_files_to_archive(urls, path_dst=str(tmp_path / "dst"), write_logs=False, disable_pbar=True)
+
+    assert result is not None
+    assert reporter.summary()["error"] == 1
+
+    with tarfile.open(tmp_path / "dst" / "downloads.tar") as tar:
+
+        names = sorted(tar.getnames())
+
+    # Ningún miembro queda fuera de la raíz del comprimido
+    assert names == ["absolute/dir/b.txt", "escape/a.txt", "sub/c.txt"]
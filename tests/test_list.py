@@ -0,0 +1,20 @@
+"""
+Pruebas de las operaciones con listas
+"""
+
+from utilsdsp import iter_unique_elements
+
+
+def test_iter_unique_elements_approximate_has_no_hash_collisions() -> None:
+
+    # Pares que colisionan con "hash" (-1/-2, 1/2**61, (1, -1)/(1, -2))
+    values = [-1, -2, 1, 2 ** 61, (1, -1), (1, -2), ("a", 1), ("a", "1")]
+
+    assert list(iter_unique_elements(values, approximate=True)) == values
+
+
+def test_iter_unique_elements_approximate_matches_exact() -> None:
+
+    values = [1, 1.0, True, "1", [1], (1,), {"a": [1]}, {"a": [1]}, {1, 2}, {2, 1}, ("ab", "c"), ("a", "bc")]
+
+    assert list(iter_unique_elements(values, approximate=True)) == list(iter_unique_elements(values))
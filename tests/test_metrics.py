@@ -0,0 +1,91 @@
+"""
+Pruebas de las métricas
+"""
+
+import json
+import pytest
+from pathlib import Path
+from utilsdsp import METRICS, enable_metrics, disable_metrics, reset_metrics, increment, observe, timer, measure_queue_wait, obtain_metrics, export_metrics, copy_dirs_parallel
+
+
+@pytest.fixture
+def metrics():
+
+    reset_metrics()
+    enable_metrics()
+
+    yield METRICS
+
+    disable_metrics()
+    reset_metrics()
+
+
+def test_metrics_are_disabled_by_default() -> None:
+
+    reset_metrics()
+
+    increment("utilsdsp_test_total")
+    observe("utilsdsp_test_seconds", 1.0)
+
+    with timer("utilsdsp_test_seconds"):
+        pass
+
+    assert obtain_metrics() == {"counters": {}, "histograms": {}}
+
+
+def test_histogram_buckets_are_cumulative(metrics) -> None:
+
+    for value in [0.0001, 0.3, 0.3, 100.0]:
+
+        observe("utilsdsp_test_seconds", value, op="copy")
+
+    sample = obtain_metrics()["histograms"]["utilsdsp_test_seconds"][0]
+
+    assert sample["labels"] == {"op": "copy"}
+    assert sample["count"] == 4
+    assert sample["sum"] == pytest.approx(100.6001)
+    assert (sample["buckets"]["0.0005"], sample["buckets"]["0.25"], sample["buckets"]["0.5"], sample["buckets"]["30.0"], sample["buckets"]["+Inf"]) == (1, 1, 3, 3, 4)
+
+    # Las funciones envueltas registran la espera en la cola
+    assert measure_queue_wait(lambda value: value * 2, "tests")(21) == 42
+    assert obtain_metrics()["histograms"]["utilsdsp_pool_queue_wait_seconds"][0]["labels"] == {"pool": "tests"}
+
+
+def test_export_metrics_prometheus(metrics, tmp_path: Path) -> None:
+
+    increment("utilsdsp_test_total", 2, host='a"b\\c')
+    increment("utilsdsp_test_total", host='a"b\\c')
+    observe("utilsdsp_test_seconds", 0.002)
+
+    text = export_metrics(tmp_path / "metrics.prom", output_format="prometheus")
+    lines = text.splitlines()
+
+    assert lines[:2] == ["# TYPE utilsdsp_test_total counter", 'utilsdsp_test_total{host="a\\"b\\\\c"} 3']
+    assert "# TYPE utilsdsp_test_seconds histogram" in lines
+    assert 'utilsdsp_test_seconds_bucket{le="0.001"} 0' in lines
+    assert 'utilsdsp_test_seconds_bucket{le="0.005"} 1' in lines
+    assert 'utilsdsp_test_seconds_bucket{le="+Inf"} 1' in lines
+    assert "utilsdsp_test_seconds_count 1" in lines
+    assert (tmp_path / "metrics.prom").read_text("utf-8") == text
+
+    # En JSON el mismo contenido que "obtain_metrics"
+    result = export_metrics(tmp_path / "metrics.json")
+
+    assert json.loads((tmp_path / "metrics.json").read_text("utf-8")) == result == obtain_metrics()
+
+
+def test_copy_dirs_parallel_records_metrics(metrics, tmp_path: Path) -> None:
+
+    path_src = tmp_path / "src"
+    path_src.mkdir()
+
+    for number in range(3):
+
+        (path_src / f'file_{number}.txt').write_bytes(b"a" * 100)
+
+    copy_dirs_parallel(path_src, tmp_path / "dst", max_workers=2, print_msg=False)
+
+    counters = obtain_metrics()["counters"]
+
+    assert counters["utilsdsp_copies_total"][0]["value"] == 3
+    assert counters["utilsdsp_bytes_copied_total"][0]["value"] == 300
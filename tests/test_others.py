@@ -0,0 +1,43 @@
+"""
+Pruebas de las demás utilidades
+"""
+
+import pytest
+from threading import Thread
+from utilsdsp import calc_imgs_dimensions, obtain_img_size
+from utilsdsp import utilsdsp_others
+
+
+@pytest.mark.parametrize("with_numpy", [True, False], ids=["numpy", "python"])
+def test_calc_imgs_dimensions_skips_invalid_sizes(with_numpy: bool, monkeypatch) -> None:
+
+    if with_numpy and utilsdsp_others.np is None:
+
+        pytest.skip("NumPy no está instalado")
+
+    if not with_numpy:
+
+        monkeypatch.setattr(utilsdsp_others, "np", None)
+
+    # Tamaños no leidos (None) o con un lado en 0
+    sizes = [(100, 50), None, (0, 10), (200, 100)]
+
+    assert calc_imgs_dimensions(sizes, 50) == [(50, 25), None, None, (50, 25)]
+    assert calc_imgs_dimensions(sizes, height_final=10) == [(20, 10), None, None, (20, 10)]
+    assert calc_imgs_dimensions([None]) == [None]
+
+
+@pytest.mark.parametrize("data", [b"\xff\xd8\xff\xe0", b"\xff\xd8\xff\xe0\x00", b"\xff\xd8\xff\xe0\x00\x00", b"\xff\xd8\xff\xc0\x00\x11\x08"], ids=["no-length", "short-length", "zero-length", "short-sof"])
+def test_obtain_img_size_truncated_jpeg(tmp_path, data: bytes) -> None:
+
+    path = tmp_path / "image.jpg"
+    path.write_bytes(data)
+
+    result = []
+
+    # Leer en un hilo aparte para no colgar las pruebas sí no termina
+    thread = Thread(target=lambda: result.append(obtain_img_size(path, print_msg=False)), daemon=True)
+    thread.start()
+    thread.join(timeout=5)
+
+    assert result == [None]
@@ -0,0 +1,101 @@
+"""
+Pruebas de las operaciones con rutas
+"""
+
+from pathlib import Path
+from threading import Thread
+from utilsdsp import rename_exists_file, stat_cache, validate_path, obtain_path_stat, compress, uncompress
+from utilsdsp import utilsdsp_paths
+
+
+def test_rename_exists_file_reflects_deleted_files(tmp_path: Path, monkeypatch) -> None:
+
+    # Sin esperar a que caduquen las reservas
+    monkeypatch.setattr(utilsdsp_paths, "__rename_ttl", 0.0)
+
+    path_src = tmp_path / "foto.jpg"
+
+    for name in ["foto.jpg", "foto_1.jpg", "foto_2.jpg", "foto_3.jpg"]:
+
+        (tmp_path / name).write_text(name)
+
+    path_new = rename_exists_file(path_src)
+
+    assert Path(path_new).name == "foto_4.jpg"
+
+    Path(path_new).write_text("foto_4.jpg")
+
+    # Los números vuelven a estar libres después de eliminar los archivos
+    for number in range(1, 5):
+
+        (tmp_path / f'foto_{number}.jpg').unlink()
+
+    assert Path(rename_exists_file(path_src)).name == "foto_1.jpg"
+
+
+def test_rename_exists_file_reserves_names_not_created_yet(tmp_path: Path) -> None:
+
+    path_src = tmp_path / "doc.txt"
+
+    path_src.write_text("doc")
+
+    # Dos reservas seguidas (Ej: hilos simultaneos) antes de crear los archivos
+    first = rename_exists_file(path_src)
+    second = rename_exists_file(path_src)
+
+    assert [Path(first).name, Path(second).name] == ["doc_1.txt", "doc_2.txt"]
+
+
+def test_stat_cache_is_scoped_to_its_context(tmp_path: Path) -> None:
+
+    path = tmp_path / "file.txt"
+
+    seen = []
+
+    with stat_cache():
+
+        assert not validate_path(path, print_msg=False)
+
+        path.write_text("file")
+
+        # Dentro del contexto se reutiliza el stat guardado
+        assert not validate_path(path, print_msg=False)
+
+        # Otro hilo no ve la caché de este contexto
+        thread = Thread(target=lambda: seen.append(validate_path(path, print_msg=False)))
+        thread.start()
+        thread.join()
+
+        # Los "stat_cache" anidados comparten la caché
+        with stat_cache():
+
+            assert not validate_path(path, print_msg=False)
+
+        assert obtain_path_stat(path) is None
+
+    assert seen == [True]
+
+    # Al cerrar el último se vacía la caché
+    assert validate_path(path, print_msg=False)
+
+
+def test_stat_cache_is_invalidated_by_compress_and_uncompress(tmp_path: Path) -> None:
+
+    path_src = tmp_path / "data"
+    path_src.mkdir()
+    (path_src / "file.txt").write_text("data")
+
+    path_out = tmp_path / "out"
+
+    with stat_cache():
+
+        assert not validate_path(tmp_path / "data.zip", print_msg=False)
+        assert not validate_path(path_out / "data" / "file.txt", print_msg=False)
+
+        archive = compress(path_src, compress_type="zip")
+
+        assert validate_path(archive, print_msg=False)
+
+        uncompress(archive, path_out)
+
+        assert validate_path(path_out / "data" / "file.txt", print_msg=False)
@@ -0,0 +1,104 @@
+"""
+Pruebas del reporte de los mensajes
+"""
+
+import logging
+import pytest
+from outputstyles import error, warning
+from utilsdsp import Reporter, ConsoleReporter, CountersReporter, LogReporter, RateLimitedReporter, set_reporter, obtain_reporter, use_reporter, report
+
+
+def test_reporter_is_abstract() -> None:
+
+    with pytest.raises(TypeError):
+
+        Reporter()
+
+    # Un reporter propio solo necesita "report"
+    class ListReporter(Reporter):
+
+        def __init__(self) -> None:
+
+            self.messages = []
+
+        def report(self, level: str, *args, sep: str = " ", end: str = "\n") -> None:
+
+            self.messages.append((level, sep.join(str(arg) for arg in args)))
+
+    with use_reporter(ListReporter()) as reporter:
+
+        report("info", "a", "b")
+
+    assert reporter.messages == [("info", "a b")]
+    assert reporter.summary() == {}
+
+
+def test_use_reporter_restores_the_previous_one() -> None:
+
+    previous = obtain_reporter()
+
+    with pytest.raises(RuntimeError):
+
+        with use_reporter("silent"):
+
+            raise RuntimeError("boom")
+
+    assert obtain_reporter() is previous
+
+    # "set_reporter" retorna el anterior para restaurarlo
+    counters = CountersReporter()
+
+    assert set_reporter(counters) is previous
+    assert set_reporter(previous) is counters
+
+
+def test_counters_reporter_ignores_blank_lines(capsys) -> None:
+
+    with use_reporter("counters") as reporter:
+
+        report("error", error("Error:", "ico"), "a")
+        report("warning", warning("Ya existe:", "ico"))
+        report("warning", "")
+        report("info", "\n")
+
+    assert reporter.summary() == {"error": 1, "warning": 1, "success": 0, "info": 0}
+    assert capsys.readouterr().out == ""
+
+
+def test_console_reporter_prints(capsys) -> None:
+
+    with use_reporter(ConsoleReporter()):
+
+        report("info", "a", "b", sep="-")
+
+    assert capsys.readouterr().out == "a-b\n"
+
+
+def test_log_reporter_sends_plain_text(caplog) -> None:
+
+    with caplog.at_level(logging.INFO, logger="utilsdsp"), use_reporter("log") as reporter:
+
+        report("error", error("No existe la ruta:", "ico"), "\n  /tmp/x")
+        report("success", "")
+
+    # Un solo registro, sin estilos ni saltos de línea
+    assert [(record.levelno, record.utilsdsp_level) for record in caplog.records] == [(logging.ERROR, "error")]
+    assert caplog.records[0].getMessage().endswith("No existe la ruta: /tmp/x")
+    assert "\x1b[" not in caplog.records[0].getMessage()
+    assert reporter.summary()["error"] == 1
+
+
+def test_rate_limited_reporter_prints_at_most_one_message_per_interval(capsys) -> None:
+
+    with use_reporter(RateLimitedReporter(interval=3600)) as reporter:
+
+        for number in range(5):
+
+            report("error", f'error {number}')
+
+        report("warning", "warning")
+
+    output = capsys.readouterr().out.splitlines()
+
+    assert output == ["error 0", "... 5 mensajes omitidos (error: 4, warning: 1)"]
+    assert reporter.summary()["error"] == 5
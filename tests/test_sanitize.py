@@ -0,0 +1,17 @@
+"""
+Pruebas del saneamiento de los nombres de archivos
+"""
+
+import pytest
+from utilsdsp import sanitize_filenames
+
+
+@pytest.mark.parametrize("filename", ["x" * 300 + ".txt", "a.b.c " * 40 + ".txt", "😀" * 200 + ".jpg"], ids=["ascii", "dots", "emoji"])
+def test_sanitize_filenames_unique_keeps_truncated_stem(filename: str) -> None:
+
+    result = sanitize_filenames([filename] * 3, unique=True)
+
+    assert len(set(result)) == 3
+    assert result[1].endswith(f'..._1{filename[-4:]}')
+    assert result[2].endswith(f'..._2{filename[-4:]}')
+    assert all(len(name) <= 120 and len(name.encode()) <= 255 for name in result)
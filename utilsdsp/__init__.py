@@ -1,6 +1,23 @@
 """
 Útiles de @dunieskysp
 
+Reportar los mensajes de las funciones:
+    - set_reporter: Cambiar el reporter de todo el paquete (console, silent, counters, log, ratelimited)
+    - obtain_reporter: Obtener el reporter actual
+    - use_reporter: Usar un reporter solo dentro de un bloque "with"
+    - report: Reportar un mensaje con el reporter actual
+
+Métricas de las funciones (deshabilitadas por defecto):
+    - enable_metrics: Habilitar el registro de las métricas
+    - disable_metrics: Deshabilitar el registro de las métricas
+    - reset_metrics: Borrar las métricas registradas
+    - increment: Incrementar un contador
+    - observe: Registrar un valor en un histograma
+    - timer: Medir el tiempo de un bloque "with" en un histograma
+    - measure_queue_wait: Medir la espera de una tarea en la cola de un pool
+    - obtain_metrics: Obtener las métricas en un diccionario
+    - export_metrics: Exportar las métricas como diccionario o texto de Prometheus
+
 Operaciones con rutas:
     - obtain_current_path: Obtener la ruta donde se está ejecutando el script
     - obtain_absolute_path: Obtener la ruta absoluta
@@ -10,6 +27,9 @@ Operaciones con rutas:
     - obtain_default_path: Obtener la ruta absoluta por defecto (PC o Google Colab)
     - obtain_downloads_path: Obtener la ruta para guardar las descargas
     - rename_exists_file: Renombrar un archivo sí existe en el destino
+    - stat_cache: Guardar en caché las rutas resueltas y sus stat durante un lote
+    - obtain_path_stat: Obtener el stat de una ruta (None sí no existe)
+    - invalidate_stat_cache: Eliminar de la caché las rutas modificadas
 
 Operaciones con directorios:
     - create_dir: Crear directorio
@@ -19,7 +39,10 @@ Operaciones con directorios:
     - del_empty_dirs: Borrar recursivamente los sub-directorios vacios
     - select_dir_content: Seleccionar contenido de un directorio
     - move_dirs: Mover archivo(s) y directorio(s) hacia otro directorio
+    - move_dirs_batch: Mover una lista de archivo(s) y directorio(s) hacia un mismo directorio
     - copy_dirs: Copiar archivo(s) y directorio(s) hacia otro directorio
+    - copy_dirs_parallel: Copiar archivo(s) y directorio(s) en paralelo hacia otro directorio
+    - sync_dirs: Sincronizar incrementalmente un directorio con otro (similar a rsync)
     - rename_dir: Renombrar un archivo o directorio
 
 Operaciones con archivos:
@@ -29,6 +52,7 @@ Operaciones con archivos:
 Operaciones de saneamiento
     - truncate_filename: Truncar el nombre del archivo o directorio
     - sanitize_filename: Sanear el nombre de un archivo o directorio
+    - sanitize_filenames: Sanear una lista de nombres de archivos o directorios
 
 Tamaño de archivos y directorios:
     - natural_size: Convertir los bytes a medidas más legibles
@@ -36,20 +60,32 @@ Tamaño de archivos y directorios:
 
 Comprimir archivos y directorios:
     - compress: Comprimir un directorio o archivo
+    - compress_batch: Comprimir varios directorios o archivos simultaneos (procesos)
+    - compress_files: Comprimir un iterable de rutas directamente, sin copiarlas antes
     - uncompress: Descomprimir un archivo
+    - uncompress_stream: Descomprimir un flujo sin guardar el comprimido
+    - obtain_compress_type: Obtener el tipo de comprimido según la extensión
+    - register_codec: Registrar un códec de compresión para los tar
+    - list_archive: Listar los miembros de un comprimido
+    - extract_members: Extraer miembros seleccionados de un comprimido
 
 Otras funciones útiles:
     - obtain_url_from_html: Obtener la URL desde un archivo HTML
+    - obtain_urls_from_htmls: Obtener las URLs de varios archivos HTML simultaneos
     - create_headers_decorates: Crear un encabezado decorado
     - clear_output: Limpiar salida en la Terminal según el SO
+    - obtain_img_size: Obtener el tamaño de una imagen leyendo solo su encabezado
     - calc_img_dimensions: Calcular las dimensiones de una imagen
+    - calc_imgs_dimensions: Calcular las dimensiones de varias imágenes a la vez
     - obtain_similar_vars: Obtener el valor o nombre de variables similares
 
 Operaciones con listas:
     - remove_repeated_elements: Eliminar elementos repetidos
+    - iter_unique_elements: Recorrer los elementos no repetidos de un iterable
 
 Operaciones con Diccionarios:
     - join_list_to_dict: Unir dos listas en un diccionario
+    - join_iters_to_dict: Unir dos iterables en un diccionario en una sola pasada
 
 Organizar directorios:
     - move_to_root: Mover archivos de los sub-directorios hacía el directorio raíz
@@ -65,48 +101,83 @@ Descargar archivos desde internet:
     - organize_urls_data: Organizar en tuplas los datos de las URLs a descargar
     - update_description_pbar: Actualizar descripción de la barra de progreso principal
     - download_files: Descargar multiples archivos simultaneos desde internet
+    - download_files_to_archive: Descargar multiples archivos directamente hacia comprimidos
 
 
 """
 
-# Útiles de rutas
-from utilsdsp.utilsdsp_paths import obtain_current_path, obtain_absolute_path, change_current_path, validate_path, join_path, obtain_default_path, obtain_downloads_path, rename_exists_file
+from importlib import import_module
+
+
+# Módulo de cada nombre público. Se importan solo al usarlos por primera
+# vez (Ej: "from utilsdsp import obtain_size" no carga las descargas).
+# Están en el orden de sus dependencias, porque los módulos usan
+# "from utilsdsp import ..." con los nombres de los anteriores
+__lazy_modules = {
+
+    # Reportar los mensajes (Lo usan todos los demás módulos)
+    "utilsdsp_report": ["Reporter", "ConsoleReporter", "SilentReporter", "CountersReporter", "LogReporter", "RateLimitedReporter", "set_reporter", "obtain_reporter", "use_reporter", "report"],
+
+    # Métricas de las funciones (Las registran los demás módulos)
+    "utilsdsp_metrics": ["METRICS", "enable_metrics", "disable_metrics", "reset_metrics", "increment", "observe", "timer", "measure_queue_wait", "obtain_metrics", "export_metrics"],
+
+    # Útiles de rutas
+    "utilsdsp_paths": ["obtain_current_path", "obtain_absolute_path", "change_current_path", "validate_path", "join_path", "obtain_default_path", "obtain_downloads_path", "rename_exists_file", "stat_cache", "obtain_path_stat", "invalidate_stat_cache"],
+
+    # Útiles de directorios
+    "utilsdsp_dirs": ["create_dir", "create_downloads_dir", "create_symbolic_link", "delete_dir", "del_empty_dirs", "select_dir_content", "move_dirs", "move_dirs_batch", "copy_dirs", "copy_dirs_parallel", "sync_dirs", "rename_dir"],
+
+    # Útiles de archivos
+    "utilsdsp_files": ["read_text_file", "write_text_file"],
+
+    # Útiles de seneamiento de nombres de archivos
+    "utilsdsp_sanitize": ["truncate_filename", "sanitize_filename", "sanitize_filenames"],
 
+    # Obtener tamaño de archivos y directorios
+    "utilsdsp_sizefile": ["natural_size", "obtain_size"],
 
-# Útiles de directorios
-from utilsdsp.utilsdsp_dirs import create_dir, create_downloads_dir, create_symbolic_link, delete_dir, del_empty_dirs, select_dir_content, move_dirs, copy_dirs, rename_dir
+    # Comprimir archivos y directorios
+    "utilsdsp_compress": ["compress", "compress_batch", "compress_files", "uncompress", "uncompress_stream", "list_archive", "extract_members", "register_codec", "obtain_compress_type"],
 
+    # Otras funciones útiles
+    "utilsdsp_others": ["obtain_url_from_html", "obtain_urls_from_htmls", "create_headers_decorates", "clear_output", "obtain_img_size", "calc_img_dimensions", "calc_imgs_dimensions", "obtain_similar_vars"],
 
-# Útiles de archivos
-from utilsdsp.utilsdsp_files import read_text_file, write_text_file
+    # Útiles de las Listas
+    "utilsdsp_list": ["remove_repeated_elements", "iter_unique_elements"],
 
+    # Útiles de los Diccionarios
+    "utilsdsp_dict": ["join_list_to_dict", "join_iters_to_dict"],
 
-# Útiles de seneamiento de nombres de archivos
-from utilsdsp.utilsdsp_sanitize import truncate_filename, sanitize_filename
+    # Organizar los directorios
+    "utilsdsp_organizedirs": ["move_files_to_root", "move_files_to_subdir", "organize_files_by_type", "organize_files_by_name"],
 
+    # Descargar archivos desde internet
+    "utilsdsp_downloads": ["validate_and_resquest", "obtain_filename", "update_download_logs", "organize_urls_data", "update_description_pbar", "download_file", "download_files", "download_files_to_archive"]
+}
 
-# Obtener tamaño de archivos y directorios
-from utilsdsp.utilsdsp_sizefile import natural_size, obtain_size
+# Nombre público -> módulo
+__lazy_names = {name: module for module, names in __lazy_modules.items() for name in names}
 
+__all__ = list(__lazy_names)
 
-# Comprimir archivos y directorios
-from utilsdsp.utilsdsp_compress import compress, uncompress
 
+def __getattr__(name: str):
+    """
+    Importar el módulo de un nombre público al usarlo por primera vez
+    """
 
-# Otras funciones útiles
-from utilsdsp.utilsdsp_others import obtain_url_from_html, create_headers_decorates, clear_output, calc_img_dimensions, obtain_similar_vars
+    if name not in __lazy_names:
 
-# Útiles de las Listas
-from utilsdsp.utilsdsp_list import remove_repeated_elements
+        raise AttributeError(f"module 'utilsdsp' has no attribute '{name}'")
 
+    value = getattr(import_module(f'utilsdsp.{__lazy_names[name]}'), name)
 
-# Útiles de los Diccionarios
-from utilsdsp.utilsdsp_dict import join_list_to_dict
+    # Guardarlo para no volver a pasar por "__getattr__"
+    globals()[name] = value
 
+    return value
 
-# Organizar los directorios
-from utilsdsp.utilsdsp_organizedirs import move_files_to_root, move_files_to_subdir, organize_files_by_type, organize_files_by_name
 
+def __dir__() -> list:
 
-# Descargar archivos desde internet
-from utilsdsp.utilsdsp_downloads import validate_and_resquest, obtain_filename, update_download_logs, organize_urls_data, update_description_pbar, download_file, download_files
+    return sorted(set(globals()) | set(__all__))
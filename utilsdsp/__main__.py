@@ -0,0 +1,8 @@
+"""
+Ejecutar la línea de comandos con "python -m utilsdsp"
+"""
+
+from utilsdsp.utilsdsp_cli import main
+
+
+raise SystemExit(main())
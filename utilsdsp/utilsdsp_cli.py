@@ -0,0 +1,347 @@
+"""
+Línea de comandos de utilsdsp (utilsdsp <subcomando> o python -m utilsdsp):
+    - _CliReporter: Contar los mensajes e imprimirlos solo sí no es silencioso
+    - __read_lines: Leer líneas no vacias de argumentos o de stdin ("-")
+    - __parallel: Ejecutar una función sobre varias rutas en paralelo
+    - cmd_download: Descargar las URLs de un manifiesto (formato de organize_urls_data)
+    - cmd_organize: Organizar los archivos de un directorio según su tipo o nombre
+    - cmd_size: Obtener el tamaño de varias rutas en paralelo
+    - cmd_compress: Comprimir varias rutas en paralelo
+    - cmd_sync: Sincronizar incrementalmente un directorio con otro
+    - cmd_clean_empty: Borrar los sub-directorios vacios de varias rutas en paralelo
+    - build_parser: Construir el parser de los argumentos
+    - main: Ejecutar la línea de comandos
+
+Ej:
+    - utilsdsp download urls.txt --dst Descargas --workers 16 --adaptive
+    - cat urls.txt | utilsdsp download - --json
+    - find . -maxdepth 1 -type d | utilsdsp size - --json
+    - utilsdsp organize Descargas --type jpg=Imagenes --type txt=Textos
+    - utilsdsp compress Fotos Videos --type zsttar --workers 2 --quiet
+    - utilsdsp sync Origen Destino --delete
+    - utilsdsp clean-empty Descargas
+"""
+
+import sys
+import json
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from outputstyles import error
+from utilsdsp.utilsdsp_report import CountersReporter, use_reporter, report
+
+
+class _CliReporter(CountersReporter):
+    """
+    Contar los mensajes de cada tipo (para el código de salida y
+    la salida JSON) e imprimirlos solo sí no es silencioso
+    """
+
+    def __init__(self, silent: bool = False) -> None:
+
+        super().__init__()
+
+        self.silent = silent
+
+    def report(self, level: str, *args, sep: str = " ", end: str = "\n") -> None:
+
+        super().report(level, *args, sep=sep, end=end)
+
+        if not self.silent:
+
+            print(*args, sep=sep, end=end)
+
+
+def __read_lines(values: list) -> list:
+    """
+    Leer líneas no vacias de los argumentos o de stdin sí alguno es "-"
+    (Se ignoran las líneas que comienzan con "#")
+
+    Parameters:
+    values (list): Argumentos de la línea de comandos
+
+    Returns:
+    list: Líneas leidas
+    """
+
+    lines = []
+
+    for value in values:
+
+        source = sys.stdin if value == "-" else [value]
+
+        for line in source:
+
+            line = line.strip()
+
+            if line and not line.startswith("#"):
+
+                lines.append(line)
+
+    return lines
+
+
+def __parallel(func, paths: list, workers: int = 1) -> list:
+    """
+    Ejecutar una función sobre varias rutas en paralelo (hilos),
+    conservando el orden de las rutas
+
+    Parameters:
+    func (Callable): Función que recibe una ruta
+    paths (list): Rutas
+    workers (int): Cantidad de hilos
+
+    Returns:
+    list: Resultados en el mismo orden de las rutas
+    """
+
+    if workers <= 1 or len(paths) <= 1:
+
+        return [func(path) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        return list(executor.map(func, paths))
+
+
+def cmd_download(args: argparse.Namespace) -> dict:
+    """
+    Descargar las URLs de un manifiesto en el formato de organize_urls_data
+    (URL, Nombre, Carpeta por línea)
+    """
+
+    from utilsdsp.utilsdsp_downloads import download_files
+
+    if args.manifest == "-":
+
+        urls_data = __read_lines(["-"])
+
+    else:
+
+        with open(args.manifest, encoding="utf-8") as file:
+
+            urls_data = __read_lines(file)
+
+    path_dst = download_files(
+        urls_data,
+        path_dst=args.dst,
+        max_workers=args.workers,
+        char_separation=args.separator,
+        overwrite=args.overwrite,
+        rename=args.rename,
+        write_logs=bool(args.logs),
+        logs_path=args.logs,
+        timeout=args.timeout,
+        disable_pbar=args.quiet or args.json,
+        adaptive=args.adaptive,
+        print_msg=not args.quiet
+    )
+
+    return {"path": path_dst, "urls": len(urls_data)}
+
+
+def cmd_organize(args: argparse.Namespace) -> dict | None:
+    """
+    Organizar los archivos de un directorio según su tipo (--type ext=Carpeta)
+    o según su nombre (--by-name)
+    """
+
+    from utilsdsp.utilsdsp_organizedirs import organize_files_by_type, organize_files_by_name
+
+    if args.by_name:
+
+        organize_files_by_name(
+            args.path,
+            path_dst=args.dst,
+            file_type=args.file_type,
+            secondary=args.secondary,
+            not_include=args.not_include,
+            overwrite=args.overwrite,
+            print_msg=not args.quiet
+        )
+
+        return {"path": args.path}
+
+    # Comprobar que los tipos tengan el formato "ext=Carpeta"
+    if not args.type or not all("=" in item for item in args.type):
+
+        report("error", error('Indique los tipos como "--type ext=Carpeta" o use "--by-name"', "ico"))
+
+        return
+
+    files_data = dict(item.split("=", 1) for item in args.type)
+
+    organize_files_by_type(args.path, files_data, args.dst, args.overwrite, not args.quiet)
+
+    return {"path": args.path, "types": files_data}
+
+
+def cmd_size(args: argparse.Namespace) -> list:
+    """
+    Obtener el tamaño de varias rutas en paralelo
+    (en bytes sin la unidad sí la salida es JSON)
+    """
+
+    from utilsdsp.utilsdsp_sizefile import obtain_size
+
+    paths = __read_lines(args.paths)
+
+    sizes = __parallel(lambda path: obtain_size(path, args.unit, args.file_type, raw=args.json), paths, args.workers)
+
+    # Imprimir una línea por ruta (como "du")
+    if not (args.quiet or args.json):
+
+        for path, size in zip(paths, sizes):
+
+            print(f'{size}\t{path}')
+
+    return [{"path": path, "size": size} for path, size in zip(paths, sizes)]
+
+
+def cmd_compress(args: argparse.Namespace) -> dict:
+    """
+    Comprimir varias rutas (cada una en un proceso diferente)
+    """
+
+    from utilsdsp.utilsdsp_compress import compress, compress_batch
+
+    paths = __read_lines(args.paths)
+
+    options = {
+        "path_dst": args.dst,
+        "compress_type": args.type,
+        "overwrite": args.overwrite,
+        "level": args.level,
+        "volume_size": args.volume_size
+    }
+
+    if len(paths) == 1:
+
+        return {paths[0]: compress(paths[0], max_workers=args.workers, **options)}
+
+    return compress_batch(paths, max_workers=args.workers, **options)
+
+
+def cmd_sync(args: argparse.Namespace) -> dict | None:
+    """
+    Sincronizar incrementalmente un directorio con otro
+    """
+
+    from utilsdsp.utilsdsp_dirs import sync_dirs
+
+    return sync_dirs(args.src, args.dst, args.checksum, args.delete, args.workers, not args.quiet)
+
+
+def cmd_clean_empty(args: argparse.Namespace) -> list:
+    """
+    Borrar los sub-directorios vacios de varias rutas en paralelo
+    """
+
+    from utilsdsp.utilsdsp_dirs import del_empty_dirs
+
+    paths = __read_lines(args.paths)
+
+    __parallel(lambda path: del_empty_dirs(path, not args.quiet), paths, args.workers)
+
+    return paths
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Construir el parser de los argumentos
+
+    Returns:
+    argparse.ArgumentParser: Parser con todos los subcomandos
+    """
+
+    # Opciones comunes de todos los subcomandos
+    common = argparse.ArgumentParser(add_help=False)
+
+    common.add_argument("-w", "--workers", type=int, default=1, help="Cantidad de tareas simultaneas")
+    common.add_argument("-q", "--quiet", action="store_true", help="No mostrar los mensajes")
+    common.add_argument("--json", action="store_true", help="Imprimir el resultado en JSON")
+
+    parser = argparse.ArgumentParser(prog="utilsdsp", description="Útiles de @dunieskysp desde la Terminal")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Descargar
+    sub = subparsers.add_parser("download", parents=[common], help="Descargar las URLs de un manifiesto")
+    sub.add_argument("manifest", help='Archivo con "URL, Nombre, Carpeta" por línea ("-" para stdin)')
+    sub.add_argument("-d", "--dst", default=None, help="Directorio de las descargas")
+    sub.add_argument("--separator", default=",", help="Caracter que separa los datos de cada línea")
+    sub.add_argument("--overwrite", action="store_true", help="Sobrescribir los archivos existentes")
+    sub.add_argument("--rename", action="store_true", help="Renombrar sí ya existe el archivo")
+    sub.add_argument("--timeout", type=int, default=10, help="Segundos de espera por cada respuesta")
+    sub.add_argument("--logs", default=None, help="Archivo donde guardar los logs")
+    sub.add_argument("--adaptive", action="store_true", help="Ajustar las descargas simultaneas hasta --workers")
+    sub.set_defaults(func=cmd_download)
+
+    # Organizar
+    sub = subparsers.add_parser("organize", parents=[common], help="Organizar los archivos de un directorio")
+    sub.add_argument("path", help="Directorio a organizar")
+    sub.add_argument("-d", "--dst", default=None, help="Directorio de destino")
+    sub.add_argument("-t", "--type", action="append", default=[], help="Extensión y carpeta (Ej: jpg=Imagenes)")
+    sub.add_argument("--by-name", action="store_true", help="Organizar según el nombre de los archivos")
+    sub.add_argument("--file-type", default=None, help="Tipos de archivos a organizar según el nombre")
+    sub.add_argument("--secondary", default=None, help="Texto que identifica a los archivos secundarios")
+    sub.add_argument("--not-include", default=None, help="Texto a eliminar del nombre de las carpetas")
+    sub.add_argument("--overwrite", action="store_true", help="Sobrescribir el destino sí existe")
+    sub.set_defaults(func=cmd_organize)
+
+    # Tamaño
+    sub = subparsers.add_parser("size", parents=[common], help="Obtener el tamaño de archivos o directorios")
+    sub.add_argument("paths", nargs="+", help='Rutas ("-" para leerlas de stdin)')
+    sub.add_argument("-u", "--unit", default=None, choices=["KB", "MB", "GB", "TB"], help="Unidad del resultado")
+    sub.add_argument("--file-type", default="*", help="Tipos de archivos a contar en los directorios")
+    sub.set_defaults(func=cmd_size)
+
+    # Comprimir
+    sub = subparsers.add_parser("compress", parents=[common], help="Comprimir archivos o directorios")
+    sub.add_argument("paths", nargs="+", help='Rutas ("-" para leerlas de stdin)')
+    sub.add_argument("-d", "--dst", default=None, help="Directorio de los comprimidos")
+    sub.add_argument("-t", "--type", default="zip", help="Tipo de comprimido (zip, tar, gztar, zsttar, etc)")
+    sub.add_argument("--level", type=int, default=None, help="Nivel de compresión")
+    sub.add_argument("--volume-size", type=int, default=None, help="Dividir en volúmenes de este tamaño (bytes)")
+    sub.add_argument("--overwrite", action="store_true", help="Sobrescribir los comprimidos existentes")
+    sub.set_defaults(func=cmd_compress)
+
+    # Sincronizar
+    sub = subparsers.add_parser("sync", parents=[common], help="Sincronizar un directorio con otro")
+    sub.add_argument("src", help="Directorio de origen")
+    sub.add_argument("dst", help="Directorio de destino")
+    sub.add_argument("--checksum", action="store_true", help="Comparar el contenido y no solo tamaño y fecha")
+    sub.add_argument("--delete", action="store_true", help="Eliminar del destino lo que no existe en el origen")
+    sub.set_defaults(func=cmd_sync)
+
+    # Borrar los directorios vacios
+    sub = subparsers.add_parser("clean-empty", parents=[common], help="Borrar los sub-directorios vacios")
+    sub.add_argument("paths", nargs="+", help='Directorios raíz ("-" para leerlos de stdin)')
+    sub.set_defaults(func=cmd_clean_empty)
+
+    return parser
+
+
+def main(argv: list | None = None) -> int:
+    """
+    Ejecutar la línea de comandos
+
+    Parameters:
+    argv (list | None): Argumentos (Por defecto los de sys.argv)
+
+    Returns:
+    int: Código de salida (0 sin errores, 1 sí se reportó algún error)
+    """
+
+    args = build_parser().parse_args(argv)
+
+    # Los mensajes no se imprimen sí la salida es JSON
+    with use_reporter(_CliReporter(silent=args.quiet or args.json)) as reporter:
+
+        result = args.func(args)
+
+    summary = reporter.summary()
+
+    if args.json:
+
+        print(json.dumps({"command": args.command, "result": result, "messages": summary}, default=str, ensure_ascii=False))
+
+    return 1 if summary.get("error") or result is None else 0
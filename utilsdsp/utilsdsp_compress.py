@@ -1,107 +1,2156 @@
 """
+Códecs de compresión:
+    - register_codec: Registrar un códec de compresión para los tar
+    - obtain_compress_type: Obtener el tipo de comprimido según la extensión
+    - __archive_stem: Obtener el nombre de un comprimido sin su extensión
+    - __open_writer: Abrir un flujo de escritura comprimido
+    - __open_decompressed: Abrir un flujo descomprimido desde la posición actual
+    - __open_tar_reader: Abrir un tar para leer desde un archivo abierto
+
 Comprimir archivos y directorios:
+    - _BlockCompressWriter: Comprimir por bloques independientes en varios hilos
+    - __make_tar_parallel: Crear un archivo tar comprimido por bloques en paralelo
+    - __make_zip: Crear un archivo zip con un nivel de compresión
+    - _VolumeWriter: Escribir un flujo dividido en volúmenes de tamaño fijo
+    - _VolumeReader: Leer varios volúmenes como un solo archivo
+    - __volumes_of: Obtener los volúmenes existentes de un comprimido
+    - __is_volume: Comprobar sí un archivo es un volumen de un comprimido dividido
+    - __walk_paths: Obtener las rutas a comprimir de un directorio o archivo
     - compress: Comprimir un directorio o archivo
+    - compress_batch: Comprimir varios directorios o archivos simultaneos (procesos)
+    - __obtain_arcname: Obtener el nombre de un elemento dentro del comprimido
+    - compress_files: Comprimir un iterable de rutas directamente, sin copiarlas antes
+    - __zip_member_path: Obtener la ruta de destino saneada de un miembro zip
+    - __unzip_parallel: Extraer un zip en paralelo
+    - __filter_member: Sanear un miembro de un tar antes de extraerlo
+    - __write_member: Escribir un miembro ya descomprimido de un tar
+    - __untar_pipelined: Extraer un tar solapando la descompresión y la escritura
+    - __uncompress_volumes: Descomprimir un comprimido dividido en volúmenes
     - uncompress: Descomprimir un archivo
+
+Descomprimir un flujo:
+    - _ChunkReader: Leer un iterable de bloques de bytes como un archivo
+    - __existing_member: Aplicar la política de los archivos existentes a un miembro
+    - uncompress_stream: Descomprimir un flujo sin guardar el comprimido
+
+Listar y extraer miembros de un comprimido:
+    - _BlockScanReader: Descomprimir un flujo registrando dónde empieza cada bloque
+    - __build_archive_index: Crear el índice de los miembros de un tar
+    - __load_archive_index: Cargar el índice guardado de un tar o crearlo
+    - list_archive: Listar los miembros de un comprimido
+    - __link_or_copy: Crear un enlace duro hacia un archivo ya extraido
+    - __open_indexed: Abrir un flujo descomprimido desde el bloque de un miembro del índice
+    - __extract_indexed: Extraer un solo miembro de un tar saltando a su bloque
+    - __extract_kwargs: Usar el filtro "data" de tarfile sí está disponible
+    - extract_members: Extraer miembros seleccionados de un comprimido
 """
 
-from pathlib import Path
-from shutil import make_archive, unpack_archive
-from outputstyles import error, info, warning
-from utilsdsp import validate_path, delete_dir
+import os
+import re
+import bz2
+import json
+import zlib
+import gzip
+import lzma
+import tarfile
+import zipfile
+from copy import copy
+from bisect import bisect_right
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable
+from threading import local
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from shutil import make_archive, unpack_archive, copyfileobj, copy2
+from tempfile import SpooledTemporaryFile
+from outputstyles import error, info, warning
+from utilsdsp import validate_path, delete_dir, create_dir, invalidate_stat_cache, rename_exists_file, report
+
+# Dependencias opcionales de los códecs zstd y lz4
+try:
+    from compression import zstd as zstd_stdlib  # Python >= 3.14
+except ImportError:
+    zstd_stdlib = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+
+# Extensiones de los archivos según el tipo de comprimido
+EXTENSIONS = {
+    "zip": ".zip",
+    "tar": ".tar",
+    "gztar": ".tar.gz",
+    "bztar": ".tar.bz2",
+    "xztar": ".tar.xz"
+}
+
+# Tipos de comprimidos según las extensiones reales de los archivos
+SUFFIXES = {
+    ".zip": "zip",
+    ".tar": "tar",
+    ".tar.gz": "gztar",
+    ".tgz": "gztar",
+    ".tar.bz2": "bztar",
+    ".tbz2": "bztar",
+    ".tar.xz": "xztar",
+    ".txz": "xztar"
+}
+
+# Tipos de comprimidos que admiten la compresión por bloques en paralelo
+# (gzip, bzip2 y xz admiten varios flujos concatenados en un archivo)
+BLOCK_TYPES = ["gztar", "bztar", "xztar"]
+
+# Códecs de compresión registrados para los tar (zsttar, lz4tar, ...)
+CODECS = {}
+
+
+# COMMENT Códecs de compresión
+def __zstd_writer(fileobj: BinaryIO, level: int | None = None, max_workers: int | None = None) -> BinaryIO:
+    """
+    Abrir un flujo de escritura zstd (multihilo sí se indica "max_workers")
+    """
+
+    level = 3 if level is None else level
+
+    if zstandard:
+
+        compressor = zstandard.ZstdCompressor(level=level, threads=max_workers or 0)
+
+        return compressor.stream_writer(fileobj, closefd=False)
+
+    options = {zstd_stdlib.CompressionParameter.compression_level: level}
+
+    if max_workers:
+
+        options[zstd_stdlib.CompressionParameter.nb_workers] = max_workers
+
+    return zstd_stdlib.ZstdFile(fileobj, "w", options=options)
+
+
+def __zstd_reader(fileobj: BinaryIO) -> BinaryIO:
+    """
+    Abrir un flujo de lectura zstd (admite varios frames concatenados)
+    """
+
+    if zstandard:
+
+        decompressor = zstandard.ZstdDecompressor()
+
+        return decompressor.stream_reader(fileobj, read_across_frames=True, closefd=False)
+
+    return zstd_stdlib.ZstdFile(fileobj)
+
+
+def __lz4_writer(fileobj: BinaryIO, level: int | None = None, max_workers: int | None = None) -> BinaryIO:
+    """
+    Abrir un flujo de escritura lz4 (frame)
+    """
+
+    return lz4_frame.LZ4FrameFile(fileobj, "wb", compression_level=level or 0)
+
+
+def __lz4_reader(fileobj: BinaryIO) -> BinaryIO:
+    """
+    Abrir un flujo de lectura lz4 (frame)
+    """
+
+    return lz4_frame.LZ4FrameFile(fileobj, "rb")
+
+
+def register_codec(compress_type: str, suffixes: list, open_writer: Callable, open_reader: Callable, available: bool = True, fallback: str | None = None) -> None:
+    """
+    Registrar un códec de compresión para los tar
+
+    Parameters:
+    compress_type (str): Tipo de comprimido (Ej: "zsttar")
+    suffixes (list): Extensiones de los archivos, la primera es la principal (Ej: [".tar.zst", ".tzst"])
+    open_writer (Callable): Función (fileobj, level, max_workers) que devuelve un
+                            flujo de escritura comprimido (write y close)
+    open_reader (Callable): Función (fileobj) que devuelve un flujo de lectura
+                            descomprimido (read)
+    available (bool): Sí están instaladas las dependencias del códec
+    fallback (str | None): Tipo de comprimido a usar sí no está disponible
+
+    Returns:
+    None
+    """
+
+    CODECS[compress_type] = {
+        "writer": open_writer,
+        "reader": open_reader,
+        "available": available,
+        "fallback": fallback
+    }
+
+    EXTENSIONS[compress_type] = suffixes[0]
+
+    for suffix in suffixes:
+
+        SUFFIXES[suffix] = compress_type
+
+
+# Códecs incluidos (Sí no están instaladas sus dependencias se usa gztar)
+register_codec(
+    "zsttar", [".tar.zst", ".tzst"], __zstd_writer, __zstd_reader,
+    available=bool(zstandard or zstd_stdlib), fallback="gztar"
+)
+
+register_codec(
+    "lz4tar", [".tar.lz4"], __lz4_writer, __lz4_reader,
+    available=bool(lz4_frame), fallback="gztar"
+)
+
+
+def obtain_compress_type(path_src: str | Path) -> str | None:
+    """
+    Obtener el tipo de comprimido según la extensión del archivo
+
+    Parameters:
+    path_src (str | Path): Ruta del archivo comprimido
+
+    Returns:
+    str: Tipo de comprimido (zip, tar, gztar, bztar, xztar, zsttar, lz4tar, ...)
+    None: Sí la extensión no es admitida
+    """
+
+    name = Path(path_src).name.lower()
+
+    # Comprobar primero las extensiones más largas (.tar.gz antes que .gz)
+    for suffix in sorted(SUFFIXES, key=len, reverse=True):
+
+        if name.endswith(suffix):
+
+            return SUFFIXES[suffix]
+
+
+def __archive_stem(path_src: str | Path) -> str:
+    """
+    Obtener el nombre de un comprimido sin su extensión
+    (Ej: "datos.tar.gz" -> "datos")
+
+    Parameters:
+    path_src (str | Path): Ruta del archivo comprimido
+
+    Returns:
+    str: Nombre sin la extensión del comprimido
+    """
+
+    name = Path(path_src).name
+
+    for suffix in sorted(SUFFIXES, key=len, reverse=True):
+
+        if name.lower().endswith(suffix):
+
+            return name[:-len(suffix)]
+
+    return Path(name).stem
+
+
+def __open_writer(fileobj: BinaryIO, compress_type: str, level: int | None = None, max_workers: int | None = None) -> BinaryIO:
+    """
+    Abrir un flujo de escritura comprimido sobre un archivo abierto
+
+    Parameters:
+    fileobj (BinaryIO): Archivo de destino abierto en modo binario
+    compress_type (str): Tipo de comprimido (tar, gztar, bztar, xztar, zsttar, ...)
+    level (int | None): Nivel de compresión
+    max_workers (int | None): Cantidad de hilos para comprimir
+
+    Returns:
+    BinaryIO: Flujo de escritura (El mismo archivo sí es un tar sin comprimir)
+    """
+
+    if compress_type in CODECS:
+
+        return CODECS[compress_type]["writer"](fileobj, level, max_workers)
+
+    # Comprimir por bloques en varios hilos solo sí se piden los hilos
+    if compress_type in BLOCK_TYPES and max_workers:
+
+        return _BlockCompressWriter(fileobj, compress_type, level, max_workers)
+
+    # Comprimir como un solo flujo (con el nivel por defecto de cada formato)
+    if compress_type == "gztar":
+
+        return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=9 if level is None else level, mtime=0)
+
+    if compress_type == "bztar":
+
+        return bz2.BZ2File(fileobj, "wb", compresslevel=9 if level is None else level)
+
+    if compress_type == "xztar":
+
+        return lzma.LZMAFile(fileobj, "wb", preset=6 if level is None else level)
+
+    return fileobj
+
+
+def __open_decompressed(fileobj: BinaryIO, compress_type: str) -> BinaryIO:
+    """
+    Abrir un flujo descomprimido desde la posición actual del archivo
+
+    Parameters:
+    fileobj (BinaryIO): Archivo comprimido abierto en modo binario
+    compress_type (str): Tipo de comprimido (tar, gztar, bztar, xztar, zsttar, ...)
+
+    Returns:
+    BinaryIO: Flujo descomprimido
+    """
+
+    if compress_type == "gztar":
+
+        return gzip.GzipFile(fileobj=fileobj)
+
+    if compress_type == "bztar":
+
+        return bz2.BZ2File(fileobj)
+
+    if compress_type == "xztar":
+
+        return lzma.LZMAFile(fileobj)
+
+    if compress_type in CODECS:
+
+        # Comprobar que esté instalada la dependencia del códec
+        if not CODECS[compress_type]["available"]:
+
+            raise ImportError(f'No está instalada la dependencia de "{compress_type}"')
+
+        return CODECS[compress_type]["reader"](fileobj)
+
+    return fileobj
+
+
+def __open_tar_reader(fileobj: BinaryIO, compress_type: str) -> tarfile.TarFile:
+    """
+    Abrir un tar para leer desde un archivo abierto
+
+    Parameters:
+    fileobj (BinaryIO): Archivo comprimido abierto en modo binario
+    compress_type (str): Tipo de comprimido (tar, gztar, bztar, xztar, zsttar, ...)
+
+    Returns:
+    tarfile.TarFile: Tar abierto (como un flujo sí es de un códec registrado)
+    """
+
+    if compress_type in CODECS:
+
+        return tarfile.open(fileobj=__open_decompressed(fileobj, compress_type), mode="r|")
+
+    return tarfile.open(fileobj=fileobj, mode="r:*")
+
+
+class _BlockCompressWriter:
+    """
+    Objeto tipo archivo que divide lo escrito en bloques y los comprime
+    de forma independiente en varios hilos (similar a pigz)
+        - Cada bloque es un flujo gzip, bzip2 o xz completo y el resultado
+          es su concatenación, que las herramientas estándar leen sin problemas
+    """
+
+    def __init__(self, fileobj, compress_type: str = "gztar", level: int | None = None, max_workers: int | None = None, block_size: int = 1024 ** 2 * 4) -> None:
+        """
+        Parameters:
+        fileobj (BinaryIO): Archivo de destino (abierto en modo binario)
+        compress_type (str): Tipo de comprimido (gztar, bztar o xztar)
+        level (int | None): Nivel de compresión (Por defecto el de cada formato)
+        max_workers (int | None): Cantidad de bloques comprimiendose a la vez
+        block_size (int): Tamaño de cada bloque sin comprimir
+        """
+
+        self.fileobj = fileobj
+        self.compress_type = compress_type
+        self.level = level
+        self.block_size = block_size
+
+        self.buffer = bytearray()
+
+        # Bloques en proceso (se escriben en el mismo orden)
+        max_workers = max_workers or os.cpu_count() or 1
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.pending = deque()
+        self.max_pending = max_workers * 2
+
+    def _compress(self, data: bytes) -> bytes:
+        """
+        Comprimir un bloque como un flujo independiente
+        (zlib, bz2 y lzma liberan el GIL mientras comprimen)
+        """
+
+        if self.compress_type == "gztar":
+
+            level = 9 if self.level is None else self.level
+
+            return gzip.compress(data, compresslevel=level, mtime=0)
+
+        if self.compress_type == "bztar":
+
+            level = 9 if self.level is None else self.level
+
+            return bz2.compress(data, compresslevel=level)
+
+        level = 6 if self.level is None else self.level
+
+        return lzma.compress(data, preset=level)
+
+    def _submit(self, data: bytes) -> None:
+        """
+        Enviar un bloque a comprimir y escribir los que ya terminaron
+        """
+
+        self.pending.append(self.executor.submit(self._compress, data))
+
+        # Limitar los bloques en memoria, escribiendo los más antiguos
+        while len(self.pending) > self.max_pending:
+
+            self.fileobj.write(self.pending.popleft().result())
+
+    def write(self, data: bytes) -> int:
+
+        self.buffer += data
+
+        while len(self.buffer) >= self.block_size:
+
+            self._submit(bytes(self.buffer[:self.block_size]))
+
+            del self.buffer[:self.block_size]
+
+        return len(data)
+
+    def close(self) -> None:
+
+        # Comprimir lo que queda (Al menos un bloque, aunque esté vacio)
+        if self.buffer or not self.pending:
+
+            self._submit(bytes(self.buffer))
+
+            self.buffer.clear()
+
+        # Escribir todos los bloques pendientes
+        while self.pending:
+
+            self.fileobj.write(self.pending.popleft().result())
+
+        self.executor.shutdown()
+
+
+def __make_tar_parallel(path_src: Path, path_archive: Path, compress_type: str, base_include: bool = True, level: int | None = None, max_workers: int | None = None) -> str:
+    """
+    Crear un archivo tar comprimido por bloques en paralelo (o como
+    un solo flujo con un nivel de compresión, sí no hay "max_workers")
+
+    Parameters:
+    path_src (Path): Ruta del directorio o archivo a comprimir
+    path_archive (Path): Ruta del archivo comprimido
+    compress_type (str): Tipo de comprimido (gztar, bztar o xztar)
+    base_include (bool): Incluir el directorio base en el comprimido
+    level (int | None): Nivel de compresión
+    max_workers (int | None): Cantidad de hilos para comprimir
+
+    Returns:
+    str: Ruta absoluta del archivo comprimido
+    """
+
+    # Nombre dentro del comprimido (igual que "make_archive")
+    arcname = path_src.name if path_src.is_file() or base_include else "."
+
+    with open(path_archive, "wb") as file:
+
+        writer = __open_writer(file, compress_type, level, max_workers)
+
+        try:
+
+            # Escribir el tar sin comprimir como un flujo hacia los bloques
+            with tarfile.open(fileobj=writer, mode="w|") as tar:
+
+                tar.add(path_src, arcname=arcname)
+
+        finally:
+
+            writer.close()
+
+    return str(path_archive)
+
+
+def __make_zip(path_src: Path, path_archive: Path, base_include: bool = True, level: int | None = None) -> str:
+    """
+    Crear un archivo zip con un nivel de compresión
+
+    Parameters:
+    path_src (Path): Ruta del directorio o archivo a comprimir
+    path_archive (Path): Ruta del archivo comprimido
+    base_include (bool): Incluir el directorio base en el comprimido
+    level (int | None): Nivel de compresión (0 - 9)
+
+    Returns:
+    str: Ruta absoluta del archivo comprimido
+    """
+
+    with zipfile.ZipFile(path_archive, "w", zipfile.ZIP_DEFLATED, compresslevel=level) as zip_file:
+
+        # Comprimir un archivo
+        if path_src.is_file():
+
+            zip_file.write(path_src, path_src.name)
+
+            return str(path_archive)
+
+        # Directorio a partir del cual se conforman los nombres
+        root = path_src.parent if base_include else path_src
+
+        if base_include:
+
+            zip_file.write(path_src, path_src.name)
+
+        for dirpath, dirnames, filenames in os.walk(path_src):
+
+            dirnames.sort()
+
+            for name in dirnames + sorted(filenames):
+
+                path = os.path.join(dirpath, name)
+
+                zip_file.write(path, os.path.relpath(path, root))
+
+    return str(path_archive)
+
+
+class _VolumeWriter:
+    """
+    Objeto tipo archivo que divide lo escrito en volúmenes de tamaño
+    fijo (<comprimido>.001, <comprimido>.002, ...)
+        - No admite "seek", por lo que los zip se escriben como un flujo
+    """
+
+    def __init__(self, path: str | Path, volume_size: int) -> None:
+        """
+        Parameters:
+        path (str | Path): Ruta del comprimido (sin el número del volumen)
+        volume_size (int): Tamaño máximo de cada volumen en bytes
+        """
+
+        self.path = str(path)
+        self.volume_size = volume_size
+
+        self.volumes = []
+        self.file = None
+        self.written = 0
+        self.position = 0
+
+    def _next_volume(self) -> None:
+        """
+        Cerrar el volumen actual y abrir el siguiente
+        """
+
+        if self.file:
+
+            self.file.close()
+
+        self.volumes.append(f'{self.path}.{len(self.volumes) + 1:03d}')
+
+        self.file = open(self.volumes[-1], "wb")
+        self.written = 0
+
+    def write(self, data: bytes) -> int:
+
+        view = memoryview(data)
+
+        while view:
+
+            if self.file is None or self.written >= self.volume_size:
+
+                self._next_volume()
+
+            size = min(len(view), self.volume_size - self.written)
+
+            self.file.write(view[:size])
+
+            self.written += size
+            self.position += size
+
+            view = view[size:]
+
+        return len(data)
+
+    @property
+    def name(self) -> str:
+        """
+        Ruta del volumen actual (o la base sí aún no hay ninguno)
+        """
+
+        return self.volumes[-1] if self.volumes else self.path
+
+    def tell(self) -> int:
+
+        return self.position
+
+    def flush(self) -> None:
+
+        if self.file:
+
+            self.file.flush()
+
+    def close(self) -> None:
+
+        # Solo cerrar el volumen abierto (no crear otro al cerrar, Ej:
+        # después de un error al abrir el siguiente volumen)
+        if self.file:
+
+            self.file.close()
+
+        self.file = None
+
+
+class _VolumeReader:
+    """
+    Objeto tipo archivo que lee varios volúmenes como un solo archivo
+    (Admite "seek", por lo que se pueden leer los zip)
+    """
+
+    def __init__(self, paths: list) -> None:
+        """
+        Parameters:
+        paths (list): Rutas de los volúmenes en orden
+        """
+
+        self.files = [open(path, "rb") for path in paths]
+
+        # Posición inicial de cada volumen dentro del total
+        self.sizes = [os.fstat(file.fileno()).st_size for file in self.files]
+        self.starts = [sum(self.sizes[:i]) for i in range(len(self.sizes))]
+
+        self.size = sum(self.sizes)
+        self.position = 0
+
+    def read(self, size: int = -1) -> bytes:
+
+        size = self.size - self.position if size is None or size < 0 else size
+
+        chunks = []
+
+        while size > 0 and self.position < self.size:
+
+            # Volumen donde está la posición actual
+            idx = bisect_right(self.starts, self.position) - 1
+            offset = self.position - self.starts[idx]
+
+            self.files[idx].seek(offset)
+
+            data = self.files[idx].read(min(size, self.sizes[idx] - offset))
+
+            if not data:
+                break
+
+            chunks.append(data)
+
+            self.position += len(data)
+            size -= len(data)
+
+        return b"".join(chunks)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self.position, os.SEEK_END: self.size}[whence]
+
+        self.position = max(0, base + offset)
+
+        return self.position
+
+    def tell(self) -> int:
+
+        return self.position
+
+    def seekable(self) -> bool:
+
+        return True
+
+    def readable(self) -> bool:
+
+        return True
+
+    def close(self) -> None:
+
+        for file in self.files:
+
+            file.close()
+
+
+def __volumes_of(path: str | Path) -> list:
+    """
+    Obtener los volúmenes existentes de un comprimido
+
+    Parameters:
+    path (str | Path): Ruta del comprimido (sin el número del volumen)
+
+    Returns:
+    list: Rutas de los volúmenes en orden (<comprimido>.001, ...)
+    """
+
+    path = Path(path)
+
+    pattern = re.compile(rf'{re.escape(path.name)}\.\d{{3,}}')
+
+    try:
+
+        volumes = [
+            item for item in os.listdir(path.parent) if pattern.fullmatch(item)
+        ]
+
+    except OSError:
+
+        return []
+
+    return [
+        str(path.parent / item) for item in sorted(volumes, key=lambda item: int(item.rsplit(".", 1)[1]))
+    ]
+
+
+def __is_volume(path_src: Path) -> bool:
+    """
+    Comprobar sí un archivo es un volumen de un comprimido dividido
+    por este paquete (<comprimido>.001, ...), y no solo un archivo
+    con una extensión numérica (Ej: "informe.2024" o "datos.001")
+
+    Parameters:
+    path_src (Path): Ruta del archivo
+
+    Returns:
+    bool: True sí es un volumen, False sí no lo es
+    """
+
+    base, _, number = path_src.name.rpartition(".")
+
+    if not (base and len(number) >= 3 and number.isdigit()):
+
+        return False
+
+    # El comprimido debe tener una extensión admitida y su primer volumen
+    path_archive = path_src.with_name(base)
+
+    return bool(obtain_compress_type(path_archive)) and Path(f'{path_archive}.001').is_file()
+
+
+def __walk_paths(path_src: Path, base_include: bool = True):
+    """
+    Obtener las rutas a comprimir de un directorio o archivo
+    (en el mismo orden que "make_archive")
+
+    Parameters:
+    path_src (Path): Ruta del directorio o archivo a comprimir
+    base_include (bool): Incluir el directorio base
+
+    Returns:
+    Generator: Rutas de los elementos a comprimir
+    """
+
+    if path_src.is_file():
+
+        yield path_src
+
+        return
+
+    if base_include:
+
+        yield path_src
+
+    for dirpath, dirnames, filenames in os.walk(path_src):
+
+        dirnames.sort()
+
+        for name in dirnames + sorted(filenames):
+
+            yield os.path.join(dirpath, name)
+
+
+def compress(path_src: str | Path, path_dst: str | Path | None = None, compress_type: str = "zip", base_include: bool = True, overwrite: bool = False, delete_src: bool = False, level: int | None = None, max_workers: int | None = None, volume_size: int | None = None) -> str | None:
+    """
+    Comprimir un directorio o archivo
+
+    Parameters:
+    path_src (str | Path): Ruta del directorio o archivo a comprimir
+    path_dst (str | Path | None): Ruta del directorio a guardar el comprimido
+    compress_type (str): Tipo de comprimido (zip, tar, gztar, bztar, xztar,
+                         zsttar o lz4tar)
+    base_include (bool): Incluir el directorio base en el comprimido
+    overwrite (bool): Sobrescribir el archivo comprimido sí existe
+    delete_src (bool): Eliminar el archivo o directorio de origen
+    level (int | None): Nivel de compresión (Por defecto el de cada formato)
+    max_workers (int | None): Comprimir en paralelo con esta cantidad de hilos
+                              (por bloques en gztar, bztar o xztar y multihilo en zsttar)
+    volume_size (int | None): Dividir el comprimido en volúmenes de este tamaño
+                              en bytes (<comprimido>.001, <comprimido>.002, ...)
+
+    Returns:
+    str: Ruta absoluta del archivo comprimido (o del primer volumen)
+    None: Sí no existe el origen, sí ya existe el destino y
+          sí no se pudo comprimir el archivo
+    """
+
+    # Comprobar que exista el directorio o archivo de origen
+    if not validate_path(path_src):
+
+        return
+
+    # Usar un tipo de la biblioteca estándar sí falta la dependencia opcional
+    if compress_type in CODECS and not CODECS[compress_type]["available"]:
+
+        fallback = CODECS[compress_type]["fallback"]
+
+        report(
+            "warning",
+            warning(f'No está instalada la dependencia de "{compress_type}", se va a usar:', "ico"),
+            info(fallback)
+        )
+
+        compress_type = fallback
+
+    # Construir rutas absolutas y objetos Path
+    path_src = Path(path_src).resolve()
+    path_dst = Path(path_dst).resolve() if path_dst else path_src.parent
+
+    # Obtener el nombre del directorio o archivo sin la extensión
+    file_name = path_src.stem
+
+    # Ruta completa del archivo final comprimido
+    extension = EXTENSIONS.get(compress_type, f'.{compress_type}')
+
+    path_filecompress = path_dst / f'{file_name}{extension}'
+
+    # Volúmenes de un comprimido anterior con el mismo nombre
+    old_volumes = __volumes_of(path_filecompress) if volume_size else []
+
+    # Comprobar que no exista el archivo comprimido en la ruta de destino
+    if (path_filecompress.exists() or old_volumes) and not overwrite:
+
+        report("warning", warning("Ya existe:", "ico"), info(path_filecompress))
+
+        return
+
+    # Crear el directorio de destino sí no existe (Todas las vías
+    # de compresión lo necesitan)
+    if not create_dir(path_dst):
+
+        return
+
+    # Procedemos a crear el archivo comprimido
+    try:
+
+        # Comprimir como un flujo (dividido en volúmenes de tamaño
+        # fijo o con un códec registrado)
+        if volume_size or compress_type in CODECS:
+
+            # Eliminar los volúmenes anteriores para que no se mezclen
+            for volume in old_volumes:
+
+                os.remove(volume)
+
+            if volume_size:
+
+                writer = _VolumeWriter(path_filecompress, volume_size)
+
+            else:
+
+                writer = open(path_filecompress, "wb")
+
+            try:
+
+                root_dir = path_src.parent if path_src.is_file() or base_include else path_src
+
+                archive = compress_files(
+                    paths_src=__walk_paths(path_src, base_include),
+                    path_dst=writer,
+                    compress_type=compress_type,
+                    root_dir=root_dir,
+                    level=level,
+                    max_workers=max_workers
+                )
+
+            finally:
+
+                writer.close()
+
+            if archive is None:
+
+                # No dejar los volúmenes incompletos
+                for volume in getattr(writer, "volumes", [str(path_filecompress)]):
+
+                    if os.path.exists(volume):
+
+                        os.remove(volume)
+
+                return
+
+            result = writer.volumes[0] if volume_size else str(path_filecompress)
+
+        # Comprimir por bloques en paralelo o con un nivel de compresión
+        elif compress_type in BLOCK_TYPES and (max_workers or level is not None):
+
+            result = __make_tar_parallel(
+                path_src=path_src,
+                path_archive=path_filecompress,
+                compress_type=compress_type,
+                base_include=base_include,
+                level=level,
+                max_workers=max_workers
+            )
+
+        # Comprimir un zip con un nivel de compresión
+        elif compress_type == "zip" and level is not None:
+
+            result = __make_zip(
+                path_src=path_src,
+                path_archive=path_filecompress,
+                base_include=base_include,
+                level=level
+            )
+
+        # Comprimir sí es un directorio con la base incluida o un archivo
+        elif path_src.is_file() or base_include:
+
+            result = make_archive(
+                base_name=str(path_dst / file_name),
+                format=compress_type,
+                root_dir=path_src.parent,
+                base_dir=path_src.name
+            )
+
+        # Comprimir un directorio sin la base
+        else:
+
+            result = make_archive(
+                base_name=str(path_dst / file_name),
+                format=compress_type,
+                root_dir=path_src
+            )
+
+        # Eliminar el archivo o directorio de destino
+        if delete_src:
+
+            delete_dir(path_src)
+
+        # Retornar la ruta absoluta del archivo comprimido
+        return result
+
+    except Exception as err:
+
+        report(
+            "error",
+            error("Error al comprimir:", "ico"),
+            info(path_src),
+            "\n" + str(err)
+        )
+
+    finally:
+
+        # Las rutas del destino cambiaron (para "stat_cache")
+        invalidate_stat_cache(path_dst)
+
+
+def compress_batch(paths_src: list, path_dst: str | Path | None = None, compress_type: str = "zip", max_workers: int | None = None, base_include: bool = True, overwrite: bool = False, delete_src: bool = False, level: int | None = None, volume_size: int | None = None) -> dict:
+    """
+    Comprimir varios directorios o archivos simultaneos, cada uno
+    en un proceso diferente (Aprovecha todos los núcleos)
+
+    Parameters:
+    paths_src (list): Rutas de los directorios o archivos a comprimir
+    path_dst (str | Path | None): Ruta del directorio a guardar los comprimidos
+    compress_type (str): Tipo de comprimido (zip, tar, gztar, bztar o xztar)
+    max_workers (int | None): Cantidad de procesos simultaneos
+    base_include (bool): Incluir el directorio base en el comprimido
+    overwrite (bool): Sobrescribir los archivos comprimidos sí existen
+    delete_src (bool): Eliminar los archivos o directorios de origen
+    level (int | None): Nivel de compresión
+    volume_size (int | None): Dividir cada comprimido en volúmenes de este tamaño
+
+    Returns:
+    dict: Resultado de cada origen {ruta de origen: ruta del comprimido o None}
+    """
+
+    results = {}
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+
+        futures = {
+            executor.submit(
+                compress,
+                path_src=path,
+                path_dst=path_dst,
+                compress_type=compress_type,
+                base_include=base_include,
+                overwrite=overwrite,
+                delete_src=delete_src,
+                level=level,
+                volume_size=volume_size
+            ): str(path) for path in paths_src
+        }
+
+        for future in as_completed(futures):
+
+            try:
+
+                results[futures[future]] = future.result()
+
+            except Exception as err:
+
+                report(
+                    "error",
+                    error("Error al comprimir:", "ico"),
+                    info(futures[future]),
+                    "\n" + str(err)
+                )
+
+                results[futures[future]] = None
+
+    return results
+
+
+def __obtain_arcname(path: Path, root_dir: Path | None = None, arcnames: Callable | dict | None = None) -> str:
+    """
+    Obtener el nombre de un elemento dentro del comprimido
+
+    Parameters:
+    path (Path): Ruta absoluta del elemento
+    root_dir (Path | None): Directorio a partir del cual se conforma el nombre
+    arcnames (Callable | dict | None): Función o diccionario {ruta: nombre}
+
+    Returns:
+    str: Nombre del elemento dentro del comprimido
+    """
+
+    # Nombre según una función
+    if callable(arcnames):
+
+        return str(arcnames(path))
+
+    # Nombre según un diccionario (Las llaves pueden ser str o Path)
+    if isinstance(arcnames, dict):
+
+        for key in (path, str(path)):
+
+            if key in arcnames:
+
+                return str(arcnames[key])
+
+    # Nombre relativo al directorio raíz
+    if root_dir:
+
+        return os.path.relpath(path, root_dir)
+
+    return path.name
+
+
+def compress_files(paths_src: Iterable, path_dst: str | Path | BinaryIO, compress_type: str = "zip", root_dir: str | Path | None = None, arcnames: Callable | dict | None = None, overwrite: bool = False, level: int | None = None, max_workers: int | None = None) -> str | BinaryIO | None:
+    """
+    Comprimir un iterable de rutas directamente, sin copiarlas
+    antes a un directorio temporal
+        - Acepta cualquier iterable (Ej: "select_dir_content" o un generador)
+        - Los directorios se agregan sin su contenido, solo se comprime
+          lo que está en el iterable
+
+    Parameters:
+    paths_src (Iterable): Rutas de los archivos y directorios a comprimir
+    path_dst (str | Path | BinaryIO): Ruta del archivo comprimido, o un archivo
+                                      abierto en modo binario (Ej: una tubería)
+    compress_type (str): Tipo de comprimido (zip, tar, gztar, bztar, xztar,
+                         zsttar o lz4tar)
+    root_dir (str | Path | None): Directorio a partir del cual se conforman los
+                                  nombres (Por defecto solo el nombre del archivo)
+    arcnames (Callable | dict | None): Función o diccionario {ruta: nombre}
+                                       con los nombres dentro del comprimido
+    overwrite (bool): Sobrescribir el archivo comprimido sí existe
+    level (int | None): Nivel de compresión
+    max_workers (int | None): Cantidad de hilos para comprimir (gztar, bztar, xztar o zsttar)
+
+    Returns:
+    str: Ruta absoluta del archivo comprimido
+    BinaryIO: El mismo archivo de destino, sí se pasó un archivo abierto
+    None: Sí el tipo no es válido, sí ya existe el destino y
+          sí no se pudo comprimir
+    """
+
+    # Comprobar que sea un tipo de comprimido admitido
+    if compress_type not in EXTENSIONS:
+
+        report("warning", warning("Tipo de comprimido no admitido:", "ico"), info(compress_type))
+
+        return
+
+    root_dir = Path(root_dir).resolve() if root_dir else None
+
+    # Abrir el archivo de destino sí es una ruta
+    is_path = isinstance(path_dst, (str, Path))
+
+    if is_path:
+
+        path_dst = Path(path_dst).resolve()
+
+        # Comprobar que no exista el archivo comprimido
+        if path_dst.exists() and not overwrite:
+
+            report("warning", warning("Ya existe:", "ico"), info(path_dst))
+
+            return
+
+        create_dir(path_dst.parent)
+
+    try:
+
+        file = open(path_dst, "wb") if is_path else path_dst
+
+        try:
+
+            # Escribir un zip (admite destinos donde no se puede hacer "seek")
+            if compress_type == "zip":
+
+                with zipfile.ZipFile(file, "w", zipfile.ZIP_DEFLATED, compresslevel=level) as zip_file:
+
+                    for path in paths_src:
+
+                        path = Path(os.path.abspath(path))
+
+                        try:
+
+                            zip_file.write(path, __obtain_arcname(path, root_dir, arcnames))
+
+                        except FileNotFoundError:
+
+                            report("warning", warning("No existe la ruta:", "ico"), info(path))
+
+            # Escribir un tar como un flujo (comprimido por bloques)
+            else:
+
+                writer = __open_writer(file, compress_type, level, max_workers)
+
+                try:
+
+                    with tarfile.open(fileobj=writer, mode="w|") as tar:
+
+                        for path in paths_src:
+
+                            path = Path(os.path.abspath(path))
+
+                            try:
+
+                                tar.add(
+                                    path,
+                                    arcname=__obtain_arcname(path, root_dir, arcnames),
+                                    recursive=False
+                                )
+
+                            except FileNotFoundError:
+
+                                report("warning", warning("No existe la ruta:", "ico"), info(path))
+
+                finally:
+
+                    if writer is not file:
+
+                        writer.close()
+
+        finally:
+
+            if is_path:
+
+                file.close()
+
+                # El comprimido cambió (para "stat_cache")
+                invalidate_stat_cache(path_dst)
+
+        return str(path_dst) if is_path else path_dst
+
+    except Exception as err:
+
+        # Ruta real del comprimido aunque el destino sea un archivo abierto
+        report(
+            "error",
+            error("Error al comprimir en:", "ico"),
+            info(path_dst if is_path else getattr(path_dst, "name", path_dst)),
+            "\n" + str(err)
+        )
+
+
+def __zip_member_path(path_dst: str | Path, filename: str) -> str:
+    """
+    Obtener la ruta de destino saneada de un miembro zip
+    (igual que "ZipFile.extract": sin unidades, "." ni "..")
+
+    Parameters:
+    path_dst (str | Path): Directorio donde se extrae el zip
+    filename (str): Nombre del miembro dentro del zip
+
+    Returns:
+    str: Ruta de destino del miembro
+    """
+
+    arcname = filename.replace("/", os.path.sep)
+
+    if os.path.altsep:
+
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+
+    arcname = os.path.splitdrive(arcname)[1]
+
+    # Eliminar los componentes no válidos
+    invalid = ("", os.path.curdir, os.path.pardir)
+
+    arcname = os.path.sep.join(
+        item for item in arcname.split(os.path.sep) if item not in invalid
+    )
+
+    return os.path.join(path_dst, arcname)
+
+
+def __unzip_parallel(path_src: str | Path, path_dst: str | Path, max_workers: int | None = None) -> None:
+    """
+    Extraer un zip en paralelo (los miembros se pueden leer
+    de forma independiente)
+        - Crea todos los directorios primero y luego descomprime
+          y escribe los archivos en varios hilos
+
+    Parameters:
+    path_src (str | Path): Ruta del archivo zip
+    path_dst (str | Path): Directorio donde se extrae el zip
+    max_workers (int | None): Cantidad de miembros extrayendose a la vez
+
+    Returns:
+    None
+    """
+
+    with zipfile.ZipFile(path_src) as zip_file:
+
+        members = zip_file.infolist()
+
+    # Crear todos los directorios de antemano, para evitar que
+    # varios hilos intenten crear el mismo
+    files = []
+
+    for member in members:
+
+        target = __zip_member_path(path_dst, member.filename)
+
+        if member.is_dir():
+
+            os.makedirs(target, exist_ok=True)
+
+        else:
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+
+            files.append(member)
+
+    # Cada hilo abre su propio ZipFile (Su lectura no es simultanea)
+    threads_data = local()
+    zip_files = []
+
+    def extract(member: zipfile.ZipInfo) -> None:
+
+        if not hasattr(threads_data, "zip_file"):
+
+            threads_data.zip_file = zipfile.ZipFile(path_src)
+
+            zip_files.append(threads_data.zip_file)
+
+        threads_data.zip_file.extract(member, path_dst)
+
+    try:
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            # Propagar el primer error ocurrido
+            for _ in executor.map(extract, files):
+                pass
+
+    finally:
+
+        for zip_file in zip_files:
+
+            zip_file.close()
+
+
+def __write_member(path: str, data: bytes, mode: int | None = None, mtime: float | None = None) -> None:
+    """
+    Escribir un miembro ya descomprimido de un tar
+
+    Parameters:
+    path (str): Ruta de destino del miembro
+    data (bytes): Contenido del miembro
+    mode (int | None): Permisos del archivo
+    mtime (float | None): Fecha de modificación
+
+    Returns:
+    None
+    """
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, "wb") as file:
+
+        file.write(data)
+
+    if mode is not None:
+
+        os.chmod(path, mode)
+
+    if mtime is not None:
+
+        os.utime(path, (mtime, mtime))
+
+
+def __filter_member(member: tarfile.TarInfo, path_dst: str | Path) -> tarfile.TarInfo:
+    """
+    Sanear un miembro de un tar antes de extraerlo
+        - Con el filtro "data" de tarfile sí está disponible (Python >= 3.11.4)
+        - Sino solo se comprueba que el miembro (y su enlace) queden
+          dentro del destino (Ej: "../x" o "/etc/x")
+
+    Parameters:
+    member (tarfile.TarInfo): Miembro del tar
+    path_dst (str | Path): Directorio donde se extrae el tar
+
+    Returns:
+    tarfile.TarInfo: Miembro saneado (Levanta tarfile.TarError sí no es seguro)
+    """
+
+    if data_filter := getattr(tarfile, "data_filter", None):
+
+        return data_filter(member, str(path_dst))
+
+    root = os.path.realpath(path_dst)
+    target = os.path.join(root, member.name)
+
+    targets = [target]
+
+    # Los enlaces duros son relativos al destino y los simbólicos a su directorio
+    if member.islnk():
+
+        targets.append(os.path.join(root, member.linkname))
+
+    elif member.issym():
+
+        targets.append(os.path.join(os.path.dirname(target), member.linkname))
+
+    for path in targets:
+
+        if os.path.commonpath([root, os.path.realpath(path)]) != root:
+
+            raise tarfile.TarError(f'El miembro "{member.name}" quedaría fuera de: {path_dst}')
+
+    return member
+
+
+def __untar_pipelined(path_src: str | Path, path_dst: str | Path, max_workers: int | None = None, max_size: int = 1024 ** 2 * 8, compress_type: str = "tar") -> None:
+    """
+    Extraer un tar solapando la descompresión y la escritura
+        - El hilo principal descomprime los miembros en orden y
+          varios hilos escriben los archivos en el disco
+        - Los directorios, enlaces y archivos grandes se extraen
+          directamente en el hilo principal
+        - Los atributos de los directorios y los enlaces duros se
+          aplican al final, cuando ya se escribieron todos los archivos
+          (igual que "extractall")
+
+    Parameters:
+    path_src (str | Path): Ruta del archivo tar
+    path_dst (str | Path): Directorio donde se extrae el tar
+    max_workers (int | None): Cantidad de archivos escribiendose a la vez
+    max_size (int): Tamaño máximo de un archivo para escribirlo en otro hilo
+    compress_type (str): Tipo de comprimido (tar, gztar, bztar, xztar, zsttar, ...)
+
+    Returns:
+    None
+    """
+
+    # Usar el filtro "data" de tarfile sí está disponible (Python >= 3.11.4)
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+    max_workers = max_workers or os.cpu_count() or 1
+
+    with open(path_src, "rb") as file, __open_tar_reader(file, compress_type) as tar, ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        pending = deque()
+        directories = []
+        hardlinks = []
+
+        for member in tar:
+
+            # Sanear el miembro (rutas absolutas, "..", permisos, etc),
+            # también sin el filtro "data" de tarfile
+            filtered = __filter_member(member, path_dst)
+
+            # Crear los directorios sin sus atributos (Ej: sí es de solo
+            # lectura no se podrían escribir sus archivos)
+            if member.isdir():
+
+                os.makedirs(os.path.join(path_dst, filtered.name), exist_ok=True)
+
+                directories.append(filtered)
+
+                continue
+
+            # Los enlaces duros necesitan que ya exista su destino
+            if member.islnk():
+
+                hardlinks.append(member)
+
+                continue
+
+            # Extraer directamente lo que no es un archivo pequeño
+            if not (member.isfile() and member.size <= max_size):
+
+                tar.extract(member, path_dst, **extract_kwargs)
+
+                continue
+
+            data = tar.extractfile(member).read()
+
+            pending.append(
+                executor.submit(
+                    __write_member,
+                    os.path.join(path_dst, filtered.name),
+                    data,
+                    filtered.mode,
+                    filtered.mtime
+                )
+            )
+
+            # Limitar los archivos en memoria, esperando los más antiguos
+            while len(pending) > max_workers * 4:
+
+                pending.popleft().result()
+
+        # Esperar los archivos pendientes (propaga los errores)
+        while pending:
+
+            pending.popleft().result()
+
+        for member in hardlinks:
+
+            tar.extract(member, path_dst, **extract_kwargs)
+
+        # Aplicar los atributos de los directorios, de los más
+        # profundos a la raíz (igual que "extractall")
+        for member in sorted(directories, key=lambda item: item.name, reverse=True):
+
+            path = os.path.join(path_dst, member.name)
+
+            if member.mode is not None:
+
+                os.chmod(path, member.mode)
+
+            if member.mtime is not None:
+
+                os.utime(path, (member.mtime, member.mtime))
+
+
+def __uncompress_volumes(path_src: Path, path_dst: Path, delete_src: bool = False) -> str | None:
+    """
+    Descomprimir un comprimido dividido en volúmenes, leyéndolos
+    como un solo archivo (sin unirlos en el disco)
+
+    Parameters:
+    path_src (Path): Ruta de uno de los volúmenes
+    path_dst (Path): Directorio a descomprimir el archivo
+    delete_src (bool): Eliminar los volúmenes
+
+    Returns:
+    str: Ruta absoluta del archivo o directorio descomprimido
+    None: Sí no es admitido o no se pudo descomprimir
+    """
+
+    # Ruta del comprimido sin el número del volumen
+    path_archive = path_src.with_name(path_src.name.rsplit(".", 1)[0])
+
+    # Comprobar que sea un archivo admitido
+    if not (compress_type := obtain_compress_type(path_archive)):
+
+        report("warning", warning("Archivo no admitido:", "ico"), info(path_src))
+
+        return
+
+    volumes = __volumes_of(path_archive)
+
+    try:
+
+        reader = _VolumeReader(volumes)
+
+        try:
+
+            if compress_type == "zip":
+
+                with zipfile.ZipFile(reader) as zip_file:
+
+                    zip_file.extractall(path_dst)
+
+            else:
+
+                # Usar el filtro "data" de tarfile sí está disponible
+                extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+                with __open_tar_reader(reader, compress_type) as tar:
+
+                    tar.extractall(path_dst, **extract_kwargs)
+
+        finally:
+
+            reader.close()
+
+        # Eliminar los volúmenes
+        if delete_src:
+
+            for volume in volumes:
+
+                delete_dir(volume)
+
+        return str(path_dst / __archive_stem(path_archive))
+
+    except Exception as err:
+
+        report(
+            "error",
+            error("Error al descomprimir:", "ico"),
+            info(path_src),
+            "\n" + str(err)
+        )
+
+    finally:
+
+        # Las rutas del destino cambiaron (para "stat_cache")
+        invalidate_stat_cache(path_dst)
+
+
+def uncompress(path_src: str | Path, path_dst: str | Path | None = None, delete_src: bool = False, max_workers: int | None = None) -> str | None:
+    """
+    Descomprimir un archivo
+
+    Parameters:
+    path_src (str | Path): Ruta del archivo comprimido
+    path_dst (str | Path | None): Directorio a descomprimir el archivo
+    delete_src (bool): Eliminar el archivo comprimido
+    max_workers (int | None): Extraer en paralelo los zip, o solapando la
+                              descompresión y la escritura en los tar
+
+    Returns:
+    str: Ruta absoluta del archivo o directorio descomprimido
+    None: Sí no existe el origen, sí ya existe el destino y
+          sí no se pudo descomprimir el archivo
+    """
+
+    # Comprobar que exista el archivo comprimido
+    if not validate_path(path_src):
+
+        return
+
+    # Construir rutas absolutas y objetos Path
+    path_src = Path(path_src).resolve()
+    path_dst = Path(path_dst).resolve() if path_dst else path_src.parent
+
+    # Unir los volúmenes de un comprimido dividido (<comprimido>.001, ...)
+    if __is_volume(path_src):
+
+        return __uncompress_volumes(path_src, path_dst, delete_src)
+
+    # Comprobar que sea un archivo admitido (según su extensión real,
+    # Ej: .tar.gz, .tgz, .tar.zst)
+    if not (compress_type := obtain_compress_type(path_src)):
+
+        report("warning", warning("Archivo no admitido:", "ico"), info(path_src))
+
+        return
+
+    # Procedemos a descomprimir el archivo
+    try:
+
+        # Extraer los miembros de un zip en paralelo
+        if max_workers and compress_type == "zip":
+
+            __unzip_parallel(path_src, path_dst, max_workers)
+
+        # Extraer un tar solapando la descompresión y la escritura
+        elif max_workers:
+
+            __untar_pipelined(path_src, path_dst, max_workers, compress_type=compress_type)
+
+        # Extraer un tar de un códec registrado como un flujo
+        elif compress_type in CODECS:
+
+            # Usar el filtro "data" de tarfile sí está disponible
+            extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+            with open(path_src, "rb") as file, __open_tar_reader(file, compress_type) as tar:
+
+                tar.extractall(path_dst, **extract_kwargs)
+
+        else:
+
+            unpack_archive(path_src, path_dst, format=compress_type)
+
+        # Eliminar el archivo comprimido de destino
+        if delete_src:
+
+            delete_dir(path_src)
+
+        # Retornar la ruta absoluta del archivo comprimido
+        return str(path_dst / __archive_stem(path_src))
+
+    except Exception as err:
+
+        report(
+            "error",
+            error("Error al descomprimir:", "ico"),
+            info(path_src),
+            "\n" + str(err)
+        )
+
+    finally:
+
+        # Las rutas del destino cambiaron (para "stat_cache")
+        invalidate_stat_cache(path_dst)
+
+
+# COMMENT Descomprimir un flujo
+class _ChunkReader:
+    """
+    Objeto tipo archivo (solo lectura secuencial) sobre un iterable
+    de bloques de bytes (Ej: "response.iter_content()")
+    """
+
+    def __init__(self, chunks: Iterable) -> None:
+        """
+        Parameters:
+        chunks (Iterable): Bloques de bytes a leer en orden
+        """
+
+        self.chunks = iter(chunks)
+        self.buffer = bytearray()
+
+    def readable(self) -> bool:
+
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+
+        # Acumular bloques hasta tener los bytes pedidos (o todos)
+        while size < 0 or len(self.buffer) < size:
+
+            chunk = next(self.chunks, None)
+
+            if chunk is None:
+
+                break
+
+            self.buffer += chunk
+
+        size = len(self.buffer) if size < 0 else min(size, len(self.buffer))
+
+        data = bytes(self.buffer[:size])
+
+        del self.buffer[:size]
+
+        return data
+
+
+def __existing_member(path: str, path_dst: Path, overwrite: bool = True, rename: bool = False) -> str | None:
+    """
+    Aplicar la política de los archivos existentes a un miembro
+    (igual que al descargar un archivo)
+
+    Parameters:
+    path (str): Ruta de destino saneada del miembro
+    path_dst (Path): Directorio donde se extrae el comprimido
+    overwrite (bool): Sobrescribir el archivo sí existe
+    rename (bool): Renombrar el miembro sí existe el archivo
+
+    Returns:
+    str: Nombre relativo con el que extraer el miembro
+    None: Sí ya existe y no se va a sobreescribir ni renombrar
+    """
+
+    if os.path.lexists(path) and not os.path.isdir(path):
+
+        if rename:
+
+            path = rename_exists_file(path)
+
+        elif not overwrite:
+
+            report("warning", warning("Ya existe:", "ico"), info(path))
+
+            return
+
+    return Path(os.path.relpath(path, path_dst)).as_posix()
+
+
+def uncompress_stream(stream: Iterable | BinaryIO, filename: str, path_dst: str | Path | None = None, spool_size: int = 1024 ** 2 * 32, overwrite: bool = True, rename: bool = False) -> str | None:
+    """
+    Descomprimir un flujo sin guardar el comprimido en el disco
+        - Los tar (tar, tar.gz, tar.zst, ...) se extraen a medida que
+          llegan los datos
+        - Los zip necesitan el índice del final, se acumulan en un
+          buffer en memoria que pasa al disco sí supera "spool_size"
+
+    Parameters:
+    stream (Iterable | BinaryIO): Archivo abierto o iterable de bloques de bytes
+    filename (str): Nombre del comprimido (Para saber su tipo)
+    path_dst (str | Path | None): Directorio a descomprimir el flujo
+    spool_size (int): Tamaño máximo en memoria de un zip
+    overwrite (bool): Sobrescribir los archivos que ya existen
+    rename (bool): Renombrar los miembros cuyo archivo ya existe
+
+    Returns:
+    str: Ruta absoluta del archivo o directorio descomprimido
+    None: Sí no es admitido o no se pudo descomprimir
+    """
+
+    # Comprobar que sea un tipo de comprimido admitido
+    if not (compress_type := obtain_compress_type(filename)):
+
+        report("warning", warning("Archivo no admitido:", "ico"), info(filename))
+
+        return
+
+    # Construir rutas absolutas y objetos Path
+    path_dst = Path(path_dst).resolve() if path_dst else Path.cwd()
+
+    # Leer el iterable de bloques como un archivo
+    reader = stream if hasattr(stream, "read") else _ChunkReader(stream)
+
+    try:
+
+        create_dir(path_dst, print_msg=False)
+
+        if compress_type == "zip":
+
+            with SpooledTemporaryFile(max_size=spool_size) as buffer:
+
+                copyfileobj(reader, buffer, 1024 * 64)
+
+                buffer.seek(0)
+
+                with zipfile.ZipFile(buffer) as zip_file:
+
+                    if overwrite and not rename:
+
+                        zip_file.extractall(path_dst)
+
+                    else:
+
+                        for member in zip_file.infolist():
+
+                            name = __existing_member(__zip_member_path(path_dst, member.filename), path_dst, overwrite, rename)
+
+                            if name is None:
+
+                                continue
+
+                            # Extraer con el nuevo nombre sí se renombró
+                            member = copy(member)
+                            member.filename = name + ("/" if member.is_dir() else "")
+
+                            zip_file.extract(member, path_dst)
+
+        else:
+
+            # Leer el tar como un flujo (sin retroceder)
+            with tarfile.open(fileobj=__open_decompressed(reader, compress_type), mode="r|") as tar:
+
+                if overwrite and not rename:
+
+                    tar.extractall(path_dst, **__extract_kwargs())
+
+                else:
+
+                    for member in tar:
+
+                        # Sanear antes de comprobar el destino del miembro
+                        member = __filter_member(member, path_dst)
+
+                        name = __existing_member(os.path.join(path_dst, member.name), path_dst, overwrite, rename)
+
+                        if name is None:
+
+                            continue
+
+                        member = copy(member)
+                        member.name = name
+
+                        tar.extract(member, path_dst, **__extract_kwargs())
+
+        return str(path_dst / __archive_stem(filename))
+
+    except Exception as err:
+
+        report(
+            "error",
+            error("Error al descomprimir:", "ico"),
+            info(filename),
+            "\n" + str(err)
+        )
+
+    finally:
 
+        # Las rutas del destino cambiaron (para "stat_cache")
+        invalidate_stat_cache(path_dst)
 
-def compress(path_src: str | Path, path_dst: str | Path | None = None, compress_type: str = "zip", base_include: bool = True, overwrite: bool = False, delete_src: bool = False) -> str | None:
+
+# COMMENT Listar y extraer miembros de un comprimido
+class _BlockScanReader:
     """
-    Comprimir un directorio o archivo
+    Objeto tipo archivo que descomprime un flujo gzip, bzip2 o xz y
+    registra dónde empieza cada bloque independiente (comprimido y
+    descomprimido), para poder saltar directamente a ellos después
+    """
+
+    def __init__(self, fileobj: BinaryIO, compress_type: str, chunk_size: int = 1024 * 64) -> None:
+
+        self.fileobj = fileobj
+        self.chunk_size = chunk_size
+
+        # Crear un descompresor para cada bloque
+        self.factory = {
+            "gztar": lambda: zlib.decompressobj(wbits=31),
+            "bztar": bz2.BZ2Decompressor,
+            "xztar": lzma.LZMADecompressor
+        }[compress_type]
+
+        self.decompressor = self.factory()
+
+        # Bloques (posición comprimida, posición descomprimida)
+        self.blocks = [(0, 0)]
+
+        self.position = 0
+        self.produced = 0
+        self.buffer = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+
+        while size < 0 or len(self.buffer) < size:
+
+            # Comenzar un nuevo bloque al terminar el anterior
+            if self.decompressor.eof:
+
+                data = self.decompressor.unused_data
+                start = self.position - len(data)
+
+                if not data:
+
+                    data = self.fileobj.read(self.chunk_size)
+                    start = self.position
+
+                    self.position += len(data)
+
+                    if not data:
+                        break
+
+                self.blocks.append((start, self.produced))
+
+                self.decompressor = self.factory()
+
+            else:
+
+                data = self.fileobj.read(self.chunk_size)
+
+                self.position += len(data)
+
+                if not data:
+                    break
+
+            output = self.decompressor.decompress(data)
+
+            self.produced += len(output)
+            self.buffer += output
+
+        size = len(self.buffer) if size < 0 else size
+
+        result = bytes(self.buffer[:size])
+
+        del self.buffer[:size]
+
+        return result
+
+
+def __build_archive_index(path_src: Path, compress_type: str) -> dict:
+    """
+    Crear el índice de los miembros de un tar, con el bloque comprimido
+    donde empieza cada uno (Un solo recorrido del comprimido)
 
     Parameters:
-    path_src (str | Path): Ruta del directorio o archivo a comprimir
-    path_dst (str | Path | None): Ruta del directorio a guardar el comprimido
-    compress_type (str): Tipo de comprimido (zip, tar, gztar, bztar o xztar)
-    base_include (bool): Incluir el directorio base en el comprimido
-    overwrite (bool): Sobrescribir el archivo comprimido sí existe
-    delete_src (bool): Eliminar el archivo o directorio de origen
+    path_src (Path): Ruta del archivo tar
+    compress_type (str): Tipo de comprimido (tar, gztar, bztar o xztar)
 
     Returns:
-    str: Ruta absoluta del archivo comprimido
-    None: Sí no existe el origen, sí ya existe el destino y
-          sí no se pudo comprimir el archivo
+    dict: Índice del comprimido
     """
 
-    # Comprobar que exista el directorio o archivo de origen
+    stat = path_src.stat()
+
+    with open(path_src, "rb") as file:
+
+        # Registrar los bloques independientes de gzip, bzip2 y xz
+        if compress_type in BLOCK_TYPES:
+
+            reader = _BlockScanReader(file, compress_type)
+
+        else:
+
+            reader = __open_decompressed(file, compress_type)
+
+        with tarfile.open(fileobj=reader, mode="r|") as tar:
+
+            members = [
+                {
+                    "name": member.name,
+                    "offset": member.offset,
+                    "size": member.size,
+                    "is_dir": member.isdir()
+                } for member in tar
+            ]
+
+    # Relacionar cada miembro con el último bloque que empieza antes que él
+    blocks = reader.blocks if compress_type in BLOCK_TYPES else [(0, 0)]
+    starts = [uncompressed for _, uncompressed in blocks]
+
+    for member in members:
+
+        member["block"], member["block_start"] = blocks[
+            bisect_right(starts, member["offset"]) - 1
+        ]
+
+    return {
+        "archive_size": stat.st_size,
+        "archive_mtime": stat.st_mtime,
+        "members": members
+    }
+
+
+def __load_archive_index(path_src: Path, compress_type: str) -> dict:
+    """
+    Cargar el índice guardado de un tar o crearlo y guardarlo
+    junto al comprimido (<comprimido>.index.json)
+
+    Parameters:
+    path_src (Path): Ruta del archivo tar
+    compress_type (str): Tipo de comprimido (tar, gztar, bztar o xztar)
+
+    Returns:
+    dict: Índice del comprimido
+    """
+
+    path_index = path_src.with_name(f'{path_src.name}.index.json')
+    stat = path_src.stat()
+
+    # Usar el índice guardado sí el comprimido no ha cambiado
+    try:
+
+        index = json.loads(path_index.read_text("utf-8"))
+
+        if (index["archive_size"], index["archive_mtime"]) == (stat.st_size, stat.st_mtime):
+
+            return index
+
+    except (OSError, ValueError, KeyError):
+
+        pass
+
+    index = __build_archive_index(path_src, compress_type)
+
+    # Guardar el índice (Sí no se puede, se usa solo en memoria)
+    try:
+
+        path_index.write_text(json.dumps(index), "utf-8")
+
+    except OSError:
+
+        pass
+
+    return index
+
+
+def list_archive(path_src: str | Path, use_index: bool = False) -> list | None:
+    """
+    Listar los miembros de un comprimido
+
+    Parameters:
+    path_src (str | Path): Ruta del archivo comprimido
+    use_index (bool): Usar y guardar el índice de los tar (<comprimido>.index.json),
+                      útil antes de llamar a "extract_members"
+
+    Returns:
+    list: Nombres de los miembros del comprimido
+    None: Sí no existe, no es admitido o no se pudo leer el comprimido
+    """
+
+    # Comprobar que exista el archivo comprimido
     if not validate_path(path_src):
 
         return
 
-    # Construir rutas absolutas y objetos Path
     path_src = Path(path_src).resolve()
-    path_dst = Path(path_dst).resolve() if path_dst else path_src.parent
-
-    # Obtener el nombre del directorio o archivo sin la extensión
-    file_name = path_src.stem
-
-    # Ruta completa del archivo final comprimido
-    path_filecompress = path_dst / f'{file_name}.{compress_type}'
 
-    # Comprobar que no exista el archivo comprimido en la ruta de destino
-    if path_filecompress.exists() and not overwrite:
+    # Comprobar que sea un archivo admitido
+    if not (compress_type := obtain_compress_type(path_src)):
 
-        print(warning("Ya existe:", "ico"), info(path_filecompress))
+        report("warning", warning("Archivo no admitido:", "ico"), info(path_src))
 
         return
 
-    # Procedemos a crear el archivo comprimido
     try:
 
-        # Comprimir sí es un directorio con la base incluida o un archivo
-        if path_src.is_file() or base_include:
+        # Los zip tienen su propio índice (directorio central)
+        if compress_type == "zip":
 
-            result = make_archive(
-                base_name=str(path_dst / file_name),
-                format=compress_type,
-                root_dir=path_src.parent,
-                base_dir=path_src.name
-            )
+            with zipfile.ZipFile(path_src) as zip_file:
 
-        # Comprimir un directorio sin la base
-        else:
+                return zip_file.namelist()
 
-            result = make_archive(
-                base_name=str(path_dst / file_name),
-                format=compress_type,
-                root_dir=path_src
-            )
+        if use_index:
 
-        # Eliminar el archivo o directorio de destino
-        if delete_src:
+            index = __load_archive_index(path_src, compress_type)
 
-            delete_dir(path_src)
+            return [member["name"] for member in index["members"]]
 
-        # Retornar la ruta absoluta del archivo comprimido
-        return result
+        with open(path_src, "rb") as file, __open_tar_reader(file, compress_type) as tar:
+
+            return tar.getnames()
 
     except Exception as err:
 
-        print(
-            error("Error al comprimir:", "ico"),
+        report(
+            "error",
+            error("Error al leer:", "ico"),
             info(path_src),
             "\n" + str(err)
         )
 
 
-def uncompress(path_src: str | Path, path_dst: str | Path | None = None, delete_src: bool = False) -> str | None:
+def __link_or_copy(path_target: str, path_link: Path) -> None:
     """
-    Descomprimir un archivo
+    Crear un enlace duro hacia un archivo ya extraido
+    (o copiarlo sí el sistema de archivos no admite enlaces)
+
+    Parameters:
+    path_target (str): Ruta del archivo ya extraido
+    path_link (Path): Ruta del enlace
+
+    Returns:
+    None
+    """
+
+    os.makedirs(path_link.parent, exist_ok=True)
+
+    if os.path.lexists(path_link):
+
+        os.remove(path_link)
+
+    try:
+
+        os.link(path_target, path_link)
+
+    except OSError:
+
+        copy2(path_target, path_link)
+
+
+def __open_indexed(file: BinaryIO, entry: dict, offset: int, compress_type: str) -> BinaryIO:
+    """
+    Abrir un flujo descomprimido que comienza en la posición "offset"
+    (sin comprimir) dentro del bloque de un miembro del índice
+
+    Parameters:
+    file (BinaryIO): Archivo tar abierto en modo binario
+    entry (dict): Miembro del índice (con su bloque)
+    offset (int): Posición sin comprimir donde debe comenzar el flujo
+    compress_type (str): Tipo de comprimido (tar, gztar, bztar o xztar)
+
+    Returns:
+    BinaryIO: Flujo posicionado en la cabecera del miembro
+    """
+
+    # En los tar sin comprimir se salta directamente a la cabecera
+    if compress_type == "tar":
+
+        file.seek(offset)
+
+        return file
+
+    file.seek(entry["block"])
+
+    stream = __open_decompressed(file, compress_type)
+
+    # Descartar lo que hay entre el inicio del bloque y el miembro
+    skip = offset - entry["block_start"]
+
+    while skip > 0:
+
+        skip -= len(stream.read(min(skip, 1024 ** 2))) or skip
+
+    return stream
+
+
+def __extract_indexed(file: BinaryIO, entry: dict, compress_type: str, path_dst: Path, name: str | None = None) -> None:
+    """
+    Extraer un solo miembro de un tar saltando a su bloque
+
+    Parameters:
+    file (BinaryIO): Archivo tar abierto en modo binario
+    entry (dict): Miembro del índice del comprimido
+    compress_type (str): Tipo de comprimido (tar, gztar, bztar o xztar)
+    path_dst (Path): Directorio donde se extrae el miembro
+    name (str | None): Extraer el contenido con otro nombre (Ej: el de un enlace duro)
+
+    Returns:
+    None
+    """
+
+    with tarfile.open(fileobj=__open_indexed(file, entry, entry["offset"], compress_type), mode="r|") as tar:
+
+        member = tar.next()
+
+        if name:
+
+            member = copy(member)
+            member.name = name
+
+        tar.extract(__filter_member(member, path_dst), path_dst, **__extract_kwargs())
+
+
+def __extract_kwargs() -> dict:
+    """
+    Usar el filtro "data" de tarfile sí está disponible (Python >= 3.11.4)
+    """
+
+    return {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
+
+def extract_members(path_src: str | Path, members: str | list, path_dst: str | Path | None = None, use_index: bool = False) -> list | None:
+    """
+    Extraer miembros seleccionados de un comprimido
+        - Los miembros se seleccionan por su nombre o con patrones (Ej: "*.txt")
+        - Sin índice se recorre el tar una sola vez
+        - Con índice se salta a los bloques donde están los miembros (sí
+          el tar fue comprimido por bloques con "compress"), descomprimiendo
+          cada bloque como máximo una vez, o a su cabecera sí el tar no
+          está comprimido
+        - Los errores de un miembro se reportan y se continúa con los demás
 
     Parameters:
     path_src (str | Path): Ruta del archivo comprimido
-    path_dst (str | Path | None): Directorio a descomprimir el archivo
-    delete_src (bool): Eliminar el archivo comprimido
+    members (str | list): Nombre, patrón o lista de nombres y patrones a extraer
+    path_dst (str | Path | None): Directorio donde se extraen los miembros
+    use_index (bool): Usar y guardar el índice de los tar (<comprimido>.index.json)
 
     Returns:
-    str: Ruta absoluta del archivo o directorio descomprimido
-    None: Sí no existe el origen, sí ya existe el destino y
-          sí no se pudo descomprimir el archivo
+    list: Rutas absolutas de los miembros extraidos
+    None: Sí no existe, no es admitido o no se pudo leer el comprimido
     """
 
     # Comprobar que exista el archivo comprimido
@@ -109,34 +2158,147 @@ def uncompress(path_src: str | Path, path_dst: str | Path | None = None, delete_
 
         return
 
-    # Construir rutas absolutas y objetos Path
     path_src = Path(path_src).resolve()
     path_dst = Path(path_dst).resolve() if path_dst else path_src.parent
 
     # Comprobar que sea un archivo admitido
-    if not path_src.suffix in [".zip", ".tar", ".gztar", ".bztar", ".xztar"]:
+    if not (compress_type := obtain_compress_type(path_src)):
 
-        print(warning("Archivo no admitido:", "ico"), info(path_src))
+        report("warning", warning("Archivo no admitido:", "ico"), info(path_src))
 
         return
 
-    # Procedemos a descomprimir el archivo
+    patterns = [members] if isinstance(members, str) else list(members)
+
+    def selected(name: str) -> bool:
+
+        return any(name == pattern or fnmatchcase(name, pattern) for pattern in patterns)
+
+    result = []
+
+    # Rutas de los miembros extraidos según su nombre (para los enlaces duros)
+    extracted = {}
+
+    def extract(name: str, func: Callable, *args, **kwargs) -> None:
+
+        # Reportar el error del miembro y continuar con los demás
+        try:
+
+            func(*args, **kwargs)
+
+        except Exception as err:
+
+            report("error", error("No se pudo extraer:", "ico"), info(name), "\n" + str(err))
+
+            return
+
+        extracted[name] = str(path_dst / name)
+
+        result.append(extracted[name])
+
     try:
 
-        unpack_archive(path_src, path_dst)
+        # Extraer de un zip (tiene su propio índice)
+        if compress_type == "zip":
 
-        # Eliminar el archivo comprimido de destino
-        if delete_src:
+            with zipfile.ZipFile(path_src) as zip_file:
 
-            delete_dir(path_src)
+                for name in zip_file.namelist():
 
-        # Retornar la ruta absoluta del archivo comprimido
-        return str(path_dst / path_src.stem)
+                    if selected(name):
+
+                        extract(name, zip_file.extract, name, path_dst)
+
+            return result
+
+        # Extraer de un tar recorriéndolo una sola vez
+        if not use_index:
+
+            with open(path_src, "rb") as file, __open_tar_reader(file, compress_type) as tar:
+
+                for member in tar:
+
+                    if selected(member.name):
+
+                        extract(member.name, tar.extract, member, path_dst, **__extract_kwargs())
+
+            return result
+
+        index = __load_archive_index(path_src, compress_type)
+
+        entries = {entry["name"]: entry for entry in index["members"]}
+
+        # Agrupar los miembros seleccionados por su bloque (en los tar
+        # sin comprimir cada miembro tiene su propia cabecera)
+        groups = {}
+
+        for entry in index["members"]:
+
+            if selected(entry["name"]):
+
+                groups.setdefault(entry["offset"] if compress_type == "tar" else entry["block"], []).append(entry)
+
+        hardlinks = []
+
+        with open(path_src, "rb") as file:
+
+            for group in groups.values():
+
+                # Recorrer el bloque desde su primer miembro seleccionado
+                # hasta el último (Las posiciones son relativas al primero)
+                base = group[0]["offset"]
+                wanted = {entry["offset"] - base for entry in group}
+                last = max(wanted)
+
+                with tarfile.open(fileobj=__open_indexed(file, group[0], base, compress_type), mode="r|") as tar:
+
+                    for member in tar:
+
+                        if member.offset > last:
+
+                            break
+
+                        if member.offset not in wanted:
+
+                            continue
+
+                        # Los enlaces duros se resuelven al final
+                        if member.islnk():
+
+                            hardlinks.append(member)
+
+                            continue
+
+                        extract(member.name, tar.extract, member, path_dst, **__extract_kwargs())
+
+            # Enlazar con el destino sí ya se extrajo, sino extraer su
+            # contenido con el nombre del enlace (igual que tarfile)
+            for member in hardlinks:
+
+                if target := extracted.get(member.linkname):
+
+                    extract(member.name, lambda: __link_or_copy(target, path_dst / __filter_member(member, path_dst).name))
+
+                elif member.linkname in entries:
+
+                    extract(member.name, __extract_indexed, file, entries[member.linkname], compress_type, path_dst, member.name)
+
+                else:
+
+                    report("error", error("No se pudo extraer:", "ico"), info(member.name), "\n" + f'No existe el destino del enlace: {member.linkname}')
+
+        return result
 
     except Exception as err:
 
-        print(
-            error("Error al descomprimir:", "ico"),
+        report(
+            "error",
+            error("Error al extraer de:", "ico"),
             info(path_src),
             "\n" + str(err)
         )
+
+    finally:
+
+        # Las rutas del destino cambiaron (para "stat_cache")
+        invalidate_stat_cache(path_dst)
@@ -1,16 +1,21 @@
 """
 Operaciones con Diccioanrios:
     - join_list_to_dict: Unir dos listas en un diccionario
+    - __preview: Obtener una vista previa acotada de unos elementos
+    - join_iters_to_dict: Unir dos iterables en un diccionario en una sola pasada
 """
 
-from outputstyles import warning, bold, error
+from itertools import islice
+from typing import Iterable
+from outputstyles import bold, error
+from utilsdsp import report
 
 
 def join_list_to_dict(key_list: list, value_list: list, keys_to_str: bool = True) -> dict | None:
     """
     Unir dos listas en un diccionario
 
-    Parameters:    
+    Parameters:
     key_list (list): Lista con las llaves
     value_list (list): Lista con los valores
     keys_to_str (bool): Convertir las llaves a string
@@ -25,34 +30,129 @@ def join_list_to_dict(key_list: list, value_list: list, keys_to_str: bool = True
          o ocurrió algún error
     """
 
-    # Comprobar que se correspondan las longitudes
-    if len(key_list) != len(value_list):
+    return join_iters_to_dict(key_list, value_list, keys_to_str)
 
-        print(
-            error("Las longitudes no se corresponden:", "ico"),
-            "\n" + bold("Keys:"),
-            key_list,
-            "\n" + bold("Values:"),
-            value_list
-        )
+
+def __preview(items: Iterable, limit: int = 5) -> str:
+    """
+    Obtener una vista previa acotada de unos elementos
+    (Ej: "['a', 'b', 'c', ...]")
+
+    Parameters:
+    items (Iterable): Elementos a mostrar
+    limit (int): Cantidad máxima de elementos a mostrar
+
+    Returns:
+    str: Vista previa de los elementos
+    """
+
+    items = list(islice(items, limit + 1))
+
+    preview = ", ".join(repr(item) for item in items[:limit])
+
+    return f'[{preview}, ...]' if len(items) > limit else f'[{preview}]'
+
+
+def join_iters_to_dict(keys: Iterable, values: Iterable, keys_to_str: bool = True, duplicates: str = "last", preview: int = 5) -> dict | None:
+    """
+    Unir dos iterables en un diccionario en una sola pasada, sin
+    crear listas intermedias (listas, generadores, arrays de NumPy, etc)
+
+    Parameters:
+    keys (Iterable): Llaves
+    values (Iterable): Valores
+    keys_to_str (bool): Convertir las llaves a string
+    duplicates (str): Qué hacer con las llaves repetidas
+        - "last": Quedarse con el último valor
+        - "first": Quedarse con el primer valor
+        - "group": Agrupar todos los valores en una lista
+    preview (int): Cantidad de elementos sobrantes a mostrar sí las
+                   longitudes no se corresponden
+
+    Ej (Deben tener la misma longitud):
+    - keys = ["txt", "jpg", "txt"]
+    - values = ["Textos", "Imagenes", "Documentos"]
+    - duplicates = "group" -> {"txt": ["Textos", "Documentos"], "jpg": ["Imagenes"]}
+
+    Returns:
+    dict: Diccionario con las llaves y valores asociados
+    None: Si las longitudes son diferentes o ocurrió algún error
+    """
+
+    # Comprobar la política de las llaves repetidas
+    if duplicates not in ["last", "first", "group"]:
+
+        report("error", error('"duplicates" debe ser "last", "first" o "group":', "ico"), duplicates)
 
         return
 
-    # Convertir las llaves a string
-    keys = [str(item) for item in key_list] if keys_to_str else key_list
+    result = {}
+    count = 0
+
+    keys, values = iter(keys), iter(values)
+
+    # Objeto para detectar cuál de los dos se terminó primero
+    missing = object()
 
-    # Relacionar las dos listas en un diccionario
     try:
 
-        return {key: value for key, value in zip(keys, value_list)}
+        for key in keys:
+
+            if (value := next(values, missing)) is missing:
+
+                # Sobran llaves (contando la actual)
+                extra, first_extra, remaining = "Keys", key, keys
+
+                break
+
+            count += 1
+
+            key = str(key) if keys_to_str else key
+
+            if duplicates == "group":
+
+                result.setdefault(key, []).append(value)
+
+            elif duplicates == "first":
+
+                result.setdefault(key, value)
+
+            else:
+
+                result[key] = value
+
+        else:
+
+            # Comprobar sí sobran valores
+            if (value := next(values, missing)) is missing:
+
+                return result
+
+            extra, first_extra, remaining = "Values", value, values
 
     except Exception as err:
 
-        print(
-            error("No se pudo crear el diccionario desde las dos listas", "btn_ico"),
-            "\n" + bold("Keys:"),
-            key_list,
-            "\n" + bold("Values:"),
-            value_list,
+        report(
+            "error",
+            error("No se pudo crear el diccionario:", "ico"),
+            f'{count} elementos unidos',
             "\n" + str(err)
         )
+
+        return
+
+    # Mostrar solo las cantidades y algunos elementos sobrantes (sin
+    # contar más de un millón, por sí el iterable es infinito)
+    shown = [first_extra, *islice(remaining, preview)]
+    total = len(shown) + sum(1 for _ in islice(remaining, 1_000_000))
+    total = f'{total}+' if total > 1_000_000 else total
+
+    report(
+        "error",
+        error("Las longitudes no se corresponden:", "ico"),
+        "\n" + bold("Unidos:"),
+        count,
+        "\n" + bold(f'{extra} sobrantes:'),
+        total,
+        __preview(shown, preview)
+    )
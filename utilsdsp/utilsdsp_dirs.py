@@ -4,6 +4,8 @@ Operaciones con directorios:
     - create_downloads_dir: Crear el directorio de las descargas
     - create_symbolic_link: Crear enlace simbólico
 
+    - __delete_tree_parallel: Eliminar un directorio en paralelo
+    - __delete_trash: Eliminar un directorio movido a la papelera (en segundo plano)
     - delete_dir: Eliminar un directorio o archivo
     - del_empty_dirs: Borrar recursivamente los sub-directorios vacios
 
@@ -11,15 +13,40 @@ Operaciones con directorios:
     
     - __prepare_paths: Preparar las rutas para mover, copiar y renombrar directorios
     - move_dirs: Mover archivo(s) y directorio(s) hacia otro directorio
+    - move_dirs_batch: Mover una lista de archivo(s) y directorio(s) hacia un mismo directorio
     - copy_dirs: Copiar archivo(s) y directorio(s) hacia otro directorio
+    - __copy_file_fast: Copiar un archivo por la vía más rápida disponible
+    - __scan_tree: Recorrer una sola vez el árbol de un directorio
+    - copy_dirs_parallel: Copiar archivo(s) y directorio(s) en paralelo hacia otro directorio
+    - __files_are_equal: Comprobar sí dos archivos son iguales
+    - __scan_entries: Obtener los sub-directorios y archivos de un directorio
+    - __sync_file: Copiar un archivo o recrear un enlace simbólico
+    - __remove_entry: Eliminar un directorio, archivo o enlace simbólico (sin seguirlo)
+    - sync_dirs: Sincronizar incrementalmente un directorio con otro (similar a rsync)
     - rename_dir: Renombrar un archivo o directorio
 """
 
 import os
+import time
+import errno
+from uuid import uuid4
+from stat import S_ISREG, S_ISLNK
 from pathlib import Path
-from shutil import rmtree, move, copyfile, copytree
+from queue import Queue
+from threading import Thread
+from shutil import rmtree, move, copyfile, copytree, copyfileobj, copystat
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from outputstyles import error, success, warning, info, bold
-from utilsdsp import obtain_default_path, obtain_downloads_path, validate_path
+from utilsdsp import obtain_default_path, obtain_downloads_path, validate_path, obtain_absolute_path, invalidate_stat_cache, report, METRICS, measure_queue_wait
+
+# El módulo "fcntl" solo existe en sistemas Unix
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Código del ioctl FICLONE de Linux (reflink en Btrfs, XFS, etc)
+FICLONE = 0x40049409
 
 
 # NOTE: Crear directorios.
@@ -40,7 +67,7 @@ def create_dir(path_src: str | Path, parents: bool = True, print_msg: bool = Fal
     # Comprobar que no este vacia la ruta
     if not path_src:
 
-        print(warning("Debe insertar una ruta.", "ico"))
+        report("warning", warning("Debe insertar una ruta.", "ico"))
 
         return
 
@@ -52,9 +79,15 @@ def create_dir(path_src: str | Path, parents: bool = True, print_msg: bool = Fal
         # Crear el nuevo directorio recursivamente o no
         path.mkdir(parents=parents)
 
+        if METRICS.enabled:
+
+            METRICS.increment("utilsdsp_syscalls_total", op="mkdir")
+
+        invalidate_stat_cache(path)
+
         # Imprimir mensaje satisfatorio
         if print_msg:
-            print(success("Creado:", "ico"), info(path))
+            report("success", success("Creado:", "ico"), info(path))
 
         return str(path)
 
@@ -63,7 +96,7 @@ def create_dir(path_src: str | Path, parents: bool = True, print_msg: bool = Fal
 
         # Imprimir mensaje de advertencia
         if print_msg:
-            print(warning("Ya existe:", "ico"), info(path))
+            report("warning", warning("Ya existe:", "ico"), info(path))
 
         return str(path)
 
@@ -71,7 +104,8 @@ def create_dir(path_src: str | Path, parents: bool = True, print_msg: bool = Fal
     except FileNotFoundError as err:
 
         # Imprimir mensaje de error
-        print(
+        report(
+            "error",
             error("No existe el directorio padre de:", "ico"),
             info(path),
             "\n" + str(err)
@@ -81,7 +115,8 @@ def create_dir(path_src: str | Path, parents: bool = True, print_msg: bool = Fal
     except OSError as err:
 
         # Imprimir mensaje de error
-        print(
+        report(
+            "error",
             error("Error al crear:", "btn_ico"),
             info(path),
             "\n" + str(err)
@@ -114,7 +149,8 @@ def create_downloads_dir(input_dir: str | None = None, mount_GDrive: bool = Fals
     if not downloads_dir:
 
         # Advertir que se va a usar la ruta por defecto
-        print(
+        report(
+            "warning",
             warning("Se va a usar:", "ico"),
             info(default_path)
         )
@@ -157,7 +193,7 @@ def create_symbolic_link(path_src: str | Path, path_dst: str | Path, delete_dst:
         # Sí no se debe borrar
         if not delete_dst:
 
-            print(warning("Ya existe:", "ico"), info(symbolic_link))
+            report("warning", warning("Ya existe:", "ico"), info(symbolic_link))
 
             return
 
@@ -166,6 +202,8 @@ def create_symbolic_link(path_src: str | Path, path_dst: str | Path, delete_dst:
 
             symbolic_link.unlink()
 
+            invalidate_stat_cache(symbolic_link)
+
         else:
 
             delete_dir(symbolic_link)
@@ -175,11 +213,14 @@ def create_symbolic_link(path_src: str | Path, path_dst: str | Path, delete_dst:
 
         symbolic_link.symlink_to(path_src)
 
+        invalidate_stat_cache(symbolic_link)
+
         return str(symbolic_link)
 
     except Exception as err:
 
-        print(
+        report(
+            "error",
             error("Error al crear el enlace simbólico en:", "ico"),
             info(symbolic_link),
             "\n" + str(err)
@@ -187,16 +228,160 @@ def create_symbolic_link(path_src: str | Path, path_dst: str | Path, delete_dst:
 
 
 # NOTE: Eliminar directorios.
-def delete_dir(path_src: str | Path, print_msg: bool = True) -> bool:
+def __delete_tree_parallel(path_src: str | Path, max_workers: int | None = None) -> None:
+    """
+    Eliminar un directorio en paralelo
+        - Recorre el árbol con os.scandir, borra los archivos en varios
+          hilos y luego los directorios de abajo hacia arriba
+
+    Parameters:
+    path_src (str | Path): Ruta del directorio a eliminar
+    max_workers (int | None): Cantidad de borrados simultaneos
+
+    Returns:
+    None
+    """
+
+    # Cantidad de hilos por defecto (Borrar es una operación de E/S)
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+
+    # Cola de tareas (función, ruta) y errores ocurridos. Se usan hilos
+    # simples y no un ThreadPoolExecutor, para poder seguir borrando en
+    # segundo plano aunque el intérprete esté finalizando
+    tasks = Queue(maxsize=max_workers * 1024)
+    errors = []
+
+    def worker() -> None:
+
+        while (task := tasks.get()) is not None:
+
+            func, path = task
+
+            try:
+
+                func(path)
+
+            except Exception as err:
+
+                errors.append(err)
+
+            finally:
+
+                tasks.task_done()
+
+        tasks.task_done()
+
+    workers = [Thread(target=worker) for _ in range(max_workers)]
+
+    for thread in workers:
+
+        thread.start()
+
+    # Directorios agrupados por niveles de profundidad
+    levels = [[str(path_src)]]
+
+    try:
+
+        # Recorrer nivel por nivel y borrar los archivos mientras tanto
+        for level in levels:
+
+            next_level = []
+
+            for dir_ in level:
+
+                with os.scandir(dir_) as entries:
+
+                    for entry in entries:
+
+                        # Los enlaces simbólicos se borran, no se recorren
+                        if entry.is_dir(follow_symlinks=False):
+
+                            next_level.append(entry.path)
+
+                        else:
+
+                            tasks.put((os.unlink, entry.path))
+
+            if next_level:
+
+                levels.append(next_level)
+
+        # Esperar a que se borren todos los archivos
+        tasks.join()
+
+        # Borrar los directorios ya vacios, desde el nivel más profundo
+        for level in reversed(levels):
+
+            for dir_ in level:
+
+                tasks.put((os.rmdir, dir_))
+
+            tasks.join()
+
+    finally:
+
+        # Detener los hilos
+        for _ in workers:
+
+            tasks.put(None)
+
+        for thread in workers:
+
+            thread.join()
+
+    # Propagar el primer error ocurrido
+    if errors:
+
+        raise errors[0]
+
+
+def __delete_trash(path_trash: str | Path, max_workers: int | None = None, print_msg: bool = True) -> None:
+    """
+    Eliminar un directorio movido a la papelera (en segundo plano)
+
+    Parameters:
+    path_trash (str | Path): Ruta del directorio en la papelera
+    max_workers (int | None): Cantidad de borrados simultaneos
+    print_msg (bool): Imprimir mensaje de error
+
+    Returns:
+    None
+    """
+
+    try:
+
+        if max_workers:
+
+            __delete_tree_parallel(path_trash, max_workers)
+
+        else:
+
+            rmtree(path_trash)
+
+    except Exception as err:
+
+        if print_msg:
+            report(
+                "error",
+                error("Error al eliminar:", "btn_ico"),
+                info(path_trash),
+                "\n" + str(err)
+            )
+
+
+def delete_dir(path_src: str | Path, print_msg: bool = True, max_workers: int | None = None, background: bool = False) -> bool:
     """
     Eliminar un directorio o archivo
 
     Parameters:
     path_src (str | Path): Ruta del directorio o archivo a eliminar
     print_msg (bool): Imprimir mensaje de error
+    max_workers (int | None): Eliminar el directorio en paralelo con esta cantidad de hilos
+    background (bool): Renombrar el directorio a la papelera y eliminarlo en segundo plano
 
     Returns:
     bool: Booleano según si se pudo eliminar o no
+          (o renombrar a la papelera sí "background" está activo)
     """
 
     # Comprobar que exista el directorio o archivo
@@ -205,7 +390,7 @@ def delete_dir(path_src: str | Path, print_msg: bool = True) -> bool:
         return False
 
     # Construir rutas absolutas y un objeto Path
-    path = Path(path_src).resolve()
+    path = Path(obtain_absolute_path(path_src))
 
     try:
 
@@ -214,6 +399,36 @@ def delete_dir(path_src: str | Path, print_msg: bool = True) -> bool:
 
             os.remove(path)
 
+            invalidate_stat_cache(path)
+
+            return True
+
+        # Renombrar hacia la papelera (en el mismo directorio padre para
+        # que sea instantaneo) y eliminar el directorio en segundo plano
+        if background:
+
+            path_trash = path.with_name(f'.{path.name}.trash-{uuid4().hex[:8]}')
+
+            os.rename(path, path_trash)
+
+            invalidate_stat_cache(path)
+
+            # Hilo no "daemon" para que termine aunque finalice el script
+            Thread(
+                target=__delete_trash,
+                args=(path_trash, max_workers, print_msg),
+                name="utilsdsp-delete"
+            ).start()
+
+            return True
+
+        # Eliminar un directorio en paralelo
+        if max_workers:
+
+            __delete_tree_parallel(path, max_workers)
+
+            invalidate_stat_cache(path)
+
             return True
 
         # Eliminar un directorio
@@ -221,13 +436,16 @@ def delete_dir(path_src: str | Path, print_msg: bool = True) -> bool:
 
             rmtree(path)
 
+            invalidate_stat_cache(path)
+
             return True
 
     except Exception as err:
 
         # Imprimir mensaje de error si no se pudo eliminar
         if print_msg:
-            print(
+            report(
+                "error",
                 error("Error al eliminar:", "btn_ico"),
                 info(path),
                 "\n" + str(err)
@@ -258,7 +476,7 @@ def del_empty_dirs(path_src: str | Path, print_msg: bool = True) -> None:
     # Comprobar que sea un directorio
     if not path.is_dir():
 
-        print(warning("No es un directorio:", "ico"), info(path))
+        report("warning", warning("No es un directorio:", "ico"), info(path))
         return
 
     # Obtener todos los subdirectorios
@@ -281,14 +499,17 @@ def del_empty_dirs(path_src: str | Path, print_msg: bool = True) -> None:
                 # Borrar sub-directorio actual
                 subdir.rmdir()
 
+                invalidate_stat_cache(subdir)
+
                 if print_msg:
-                    print(success("Borrado:", "ico"), info(subdir))
+                    report("success", success("Borrado:", "ico"), info(subdir))
 
                 deleted += 1
 
             except Exception as err:
 
-                print(
+                report(
+                    "error",
                     error("No se pudo borrar:", "ico"),
                     info(subdir),
                     "\n" + str(err)
@@ -297,18 +518,20 @@ def del_empty_dirs(path_src: str | Path, print_msg: bool = True) -> None:
     # Mostrar las estadisticas del borrado
     if deleted == 0:
 
-        print(bold("No hay subdirectorios vacios en:"), info(path))
+        report("info", bold("No hay subdirectorios vacios en:"), info(path))
 
     elif deleted == 1:
 
-        print(
+        report(
+            "success",
             success(f"Eliminado 1 directorio vacio de:", "ico"),
             info(path)
         )
 
     else:
 
-        print(
+        report(
+            "success",
             success(f"Eliminados {deleted} directorios vacios de:", "ico"),
             info(path)
         )
@@ -340,7 +563,7 @@ def select_dir_content(path_src: str | Path, file_type: str | None = None, recur
     # Comprobar que sea un directorio
     if not path.is_dir():
 
-        print(warning("No es un directorio:", "ico"), info(path))
+        report("warning", warning("No es un directorio:", "ico"), info(path))
         return
 
     # Definir el tipo de contenido a buscar
@@ -367,7 +590,7 @@ def select_dir_content(path_src: str | Path, file_type: str | None = None, recur
 
             msg = f'No hay archivos {file_type.upper().replace("*.","")} en:'
 
-        print(warning(msg, "ico"), info(path))
+        report("warning", warning(msg, "ico"), info(path))
 
     return result
 
@@ -398,15 +621,15 @@ def __prepare_paths(path_src: str | Path, path_dst: str | Path | None = None, ov
     if not validate_path(path_src):
         return
 
-    # Construir rutas absolutas y un objeto Path
-    path_src = Path(path_src).resolve()
-    path_dst = Path(path_dst).resolve() if path_dst else path_src.parent
+    # Construir rutas absolutas y un objeto Path (desde la caché sí está activa)
+    path_src = Path(obtain_absolute_path(path_src))
+    path_dst = Path(obtain_absolute_path(path_dst)) if path_dst else path_src.parent
 
     # Ruta de destino final
     path_final = path_dst / new_name if rename else path_dst / path_src.name
 
     # Comprobar que no exista el destino final
-    if path_final.exists():
+    if validate_path(path_final, print_msg=False):
 
         # Eliminamos el destino sí está "overwrite" activo
         if overwrite:
@@ -415,7 +638,7 @@ def __prepare_paths(path_src: str | Path, path_dst: str | Path | None = None, ov
 
         else:
 
-            print(warning("Ya existe:", "ico"), info(path_final))
+            report("warning", warning("Ya existe:", "ico"), info(path_final))
 
             return
 
@@ -469,12 +692,10 @@ def move_dirs(path_src: str | Path | list, path_dst: str | Path, print_msg: bool
 
             msg = bold(f'Moviendo elementos hacia: ')
 
-        print(msg + info(path_dst), "\n") if print_msg else None
+        report("info", msg + info(path_dst), "\n") if print_msg else None
 
-        # Llamar a la función recursivamente
-        _ = [
-            move_dirs(path, path_dst, print_msg, overwrite) for path in path_src
-        ]
+        # Mover todos los elementos en lote
+        move_dirs_batch(path_src, path_dst, overwrite, print_msg)
 
         # Romper la ejecución de la función
         return
@@ -484,7 +705,7 @@ def move_dirs(path_src: str | Path | list, path_dst: str | Path, print_msg: bool
 
     if not paths:
 
-        print("")
+        report("info", "")
 
         return
 
@@ -494,21 +715,168 @@ def move_dirs(path_src: str | Path | list, path_dst: str | Path, print_msg: bool
     # Mover el archivo o directorio
     try:
 
+        start = time.perf_counter() if METRICS.enabled else 0
+
         move(path_src, path_dst)
 
+        if METRICS.enabled:
+
+            METRICS.observe("utilsdsp_move_seconds", time.perf_counter() - start, method="move")
+            METRICS.increment("utilsdsp_moves_total", method="move")
+
+        invalidate_stat_cache(path_src, path_final)
+
         # Imprimir mensaje satisfactorio
         if print_msg:
 
-            print(success("Movido:", "ico"), msg, "\n")
+            report("success", success("Movido:", "ico"), msg, "\n")
 
         return str(path_final)
 
     except Exception as err:
 
-        print(error("Error al mover:", "ico"), msg, "\n" + str(err), "\n")
+        report("error", error("Error al mover:", "ico"), msg, "\n" + str(err), "\n")
+
+
+def move_dirs_batch(path_src: list, path_dst: str | Path, overwrite: bool = False, print_msg: bool = True) -> dict | None:
+    """
+    Mover una lista de archivo(s) y directorio(s) hacia un mismo directorio
+        - Resuelve y crea el directorio de destino una sola vez
+        - Comprueba las colisiones con un solo listado del destino
+        - Usa os.rename sí el origen y el destino están en el
+          mismo sistema de archivos
+
+    Parameters:
+    path_src (list): Lista de rutas de los elementos a mover
+    path_dst (str | Path): Ruta del directorio al que se van a mover
+    overwrite (bool): Sobrescribir el destino sí existe
+    print_msg (bool): Imprimir el resumen al finalizar
+
+    Returns:
+    dict: Resumen de los elementos (moved, skipped, errors)
+    None: Sí no se pudo crear el directorio de destino
+    """
+
+    # Crear y resolver el directorio de destino una sola vez
+    path_dst = create_dir(path_dst)
+
+    if not path_dst:
+
+        return
+
+    # Dispositivo del destino y nombres que ya existen en él
+    dev_dst = os.stat(path_dst).st_dev
+    existing = set(os.listdir(path_dst))
+
+    # Resumen de los elementos
+    summary = {
+        "moved": 0,
+        "skipped": 0,
+        "errors": 0
+    }
+
+    for item in path_src:
+
+        # Construir la ruta absoluta sin consultar el disco
+        src = os.path.abspath(item)
+        name = os.path.basename(src)
+        target = os.path.join(path_dst, name)
+
+        try:
+
+            stat_src = os.lstat(src)
+
+        except OSError:
+
+            report("error", error("No existe la ruta:", "ico"), info(src))
+
+            summary["errors"] += 1
+
+            continue
+
+        # Comprobar que no exista el destino final
+        if name in existing:
+
+            # Sí no se debe sobrescribir o es el mismo elemento
+            if not overwrite or src == target:
+
+                report("warning", warning("Ya existe:", "ico"), info(target))
+
+                summary["skipped"] += 1
+
+                continue
+
+            delete_dir(target)
+
+        # Mover el archivo o directorio
+        try:
+
+            # Método usado para mover (Para las métricas)
+            method = "rename"
+            start = time.perf_counter() if METRICS.enabled else 0
+
+            # Renombrar directamente dentro del mismo sistema de archivos
+            if stat_src.st_dev == dev_dst:
+
+                try:
+
+                    os.rename(src, target)
+
+                except OSError as err:
+
+                    # Sí son diferentes puntos de montaje, copiar y borrar
+                    if err.errno != errno.EXDEV:
+                        raise
+
+                    method = "copy"
+
+                    move(src, target)
+
+            else:
 
+                method = "copy"
 
-def copy_dirs(path_src: str | Path | list, path_dst: str | Path, print_msg: bool = True, overwrite: bool = False, file_type: str | None = None) -> str | None:
+                move(src, target)
+
+            if METRICS.enabled:
+
+                METRICS.observe("utilsdsp_move_seconds", time.perf_counter() - start, method=method)
+                METRICS.increment("utilsdsp_moves_total", method=method)
+
+                # Al copiar entre sistemas de archivos se mueven los
+                # datos (Solo se cuenta el tamaño de los archivos)
+                if method == "copy" and S_ISREG(stat_src.st_mode):
+
+                    METRICS.increment("utilsdsp_bytes_moved_total", stat_src.st_size)
+
+            invalidate_stat_cache(src, target)
+
+            existing.add(name)
+
+            summary["moved"] += 1
+
+        except Exception as err:
+
+            report("error", error("Error al mover:", "ico"), info(src), "\n" + str(err))
+
+            summary["errors"] += 1
+
+    # Imprimir un solo resumen
+    if print_msg:
+
+        report(
+            "success",
+            success(f'Movidos: {summary["moved"]}', "ico"),
+            f' Omitidos: {summary["skipped"]}  Errores: {summary["errors"]}',
+            "\n  " + bold("hacia:"),
+            info(path_dst),
+            "\n"
+        )
+
+    return summary
+
+
+def copy_dirs(path_src: str | Path | list, path_dst: str | Path, print_msg: bool = True, overwrite: bool = False, file_type: str | None = None, max_workers: int | None = None, sync: bool = False) -> str | None:
     """
     Copiar archivo(s) y directorio(s) hacia otro directorio
 
@@ -516,13 +884,54 @@ def copy_dirs(path_src: str | Path | list, path_dst: str | Path, print_msg: bool
     path_src (str | Path | list): Ruta o lista de rutas de elemento(s) a copiar
     path_dst (str | Path): Ruta del directorio al que se van a copiar
     print_msg (bool): Imprimir un mensaje satisfactorio
-    overwrite (bool): Sobrescribir el destino sí existe
+    overwrite (bool): Sobrescribir el destino sí existe (No se usa con "sync",
+                      que siempre reemplaza los archivos modificados)
+    max_workers (int | None): Copiar en paralelo con esta cantidad de hilos
+    sync (bool): Copiar solo los archivos nuevos o modificados (ver "sync_dirs")
 
     Returns:
     str: Ruta del elemento copiado sí no es una lista "path_src"
     None: Sí no se pudo copiar el elemento o es una lista "path_src"
     """
 
+    # Sincronizar incrementalmente en vez de copiar todo de nuevo
+    if sync:
+
+        result = None
+
+        for item in path_src if isinstance(path_src, list) else [path_src]:
+
+            # Comprobar que exista el elemento a sincronizar
+            if not validate_path(item):
+
+                continue
+
+            path_final = Path(path_dst).resolve() / Path(item).resolve().name
+
+            summary = sync_dirs(
+                path_src=item,
+                path_dst=path_final,
+                max_workers=max_workers,
+                print_msg=print_msg
+            )
+
+            result = str(path_final) if summary and not summary["errors"] else None
+
+        return None if isinstance(path_src, list) else result
+
+    # Usar el motor de copia en paralelo
+    if max_workers:
+
+        stats = copy_dirs_parallel(
+            path_src, path_dst, max_workers, overwrite, print_msg
+        )
+
+        if isinstance(path_src, list) or not stats or stats["errors"]:
+
+            return
+
+        return str(Path(path_dst).resolve() / Path(path_src).resolve().name)
+
     # Procesar una lista de elementos a copiar
     if isinstance(path_src, list):
 
@@ -537,7 +946,7 @@ def copy_dirs(path_src: str | Path | list, path_dst: str | Path, print_msg: bool
 
             msg = bold(f'Copiando elementos hacia: ')
 
-        print(msg + info(path_dst), "\n") if print_msg else None
+        report("info", msg + info(path_dst), "\n") if print_msg else None
 
         # Llamar a la función recursivamente
         _ = [
@@ -552,7 +961,7 @@ def copy_dirs(path_src: str | Path | list, path_dst: str | Path, print_msg: bool
 
     if not paths:
 
-        print("")
+        report("info", "")
 
         return
 
@@ -572,16 +981,643 @@ def copy_dirs(path_src: str | Path | list, path_dst: str | Path, print_msg: bool
 
             copyfile(path_src, path_final)
 
+        invalidate_stat_cache(path_final)
+
         # Imprimir mensaje satisfactorio
         if print_msg:
 
-            print(success("Copiado:", "ico"), msg, "\n")
+            report("success", success("Copiado:", "ico"), msg, "\n")
 
         return str(path_final)
 
     except Exception as err:
 
-        print(error("Error al copiar:", "ico"), msg, "\n" + str(err), "\n")
+        report("error", error("Error al copiar:", "ico"), msg, "\n" + str(err), "\n")
+
+
+def __copy_file_fast(path_src: str, path_dst: str) -> int:
+    """
+    Copiar un archivo por la vía más rápida disponible:
+    reflink, os.copy_file_range, os.sendfile o copia por bloques
+
+    Parameters:
+    path_src (str): Ruta del archivo de origen
+    path_dst (str): Ruta del archivo de destino
+
+    Returns:
+    int: Cantidad de bytes copiados
+    """
+
+    with open(path_src, "rb") as fsrc, open(path_dst, "wb") as fdst:
+
+        fd_src = fsrc.fileno()
+        fd_dst = fdst.fileno()
+
+        copied = 0
+        size = os.fstat(fd_src).st_size
+
+        # Clonar los bloques sin copiar los datos (reflink)
+        if fcntl:
+
+            try:
+
+                fcntl.ioctl(fd_dst, FICLONE, fd_src)
+
+                copied = os.fstat(fd_dst).st_size
+
+            except OSError:
+
+                pass
+
+            else:
+
+                copystat(path_src, path_dst)
+
+                return copied
+
+        # Copiar dentro del kernel con os.copy_file_range (Linux)
+        if hasattr(os, "copy_file_range"):
+
+            try:
+
+                while sent := os.copy_file_range(fd_src, fd_dst, 1024 ** 3):
+
+                    copied += sent
+
+            except OSError:
+
+                # Solo se puede continuar sí aún no se copió nada
+                if copied:
+                    raise
+
+            # Algunos sistemas de archivos devuelven 0 antes de terminar
+            # (Ej: FUSE), se continúa desde lo copiado con la siguiente vía
+            else:
+
+                if copied >= size:
+
+                    copystat(path_src, path_dst)
+
+                    return copied
+
+        # Copiar dentro del kernel con os.sendfile
+        if hasattr(os, "sendfile"):
+
+            try:
+
+                while sent := os.sendfile(fd_dst, fd_src, copied, 1024 ** 3):
+
+                    copied += sent
+
+            except OSError:
+
+                if copied:
+                    raise
+
+            else:
+
+                if copied >= size:
+
+                    copystat(path_src, path_dst)
+
+                    return copied
+
+        # Copia tradicional por bloques de 1MB (desde lo ya copiado)
+        fsrc.seek(copied)
+        fdst.seek(copied)
+
+        copyfileobj(fsrc, fdst, 1024 ** 2)
+
+        copied = fdst.tell()
+
+    copystat(path_src, path_dst)
+
+    return copied
+
+
+def __scan_tree(path_src: str, path_dst: str) -> tuple:
+    """
+    Recorrer una sola vez el árbol de un directorio
+
+    Parameters:
+    path_src (str): Ruta del directorio de origen
+    path_dst (str): Ruta del directorio final de destino
+
+    Returns:
+    tuple: Lista de tuplas de directorios a crear (origen, destino),
+           lista de tuplas de archivos (origen, destino)
+    """
+
+    dirs = [(path_src, path_dst)]
+    files = []
+
+    # Pila de directorios pendientes (origen, destino)
+    pending = [(path_src, path_dst)]
+
+    while pending:
+
+        src, dst = pending.pop()
+
+        with os.scandir(src) as entries:
+
+            for entry in entries:
+
+                target = os.path.join(dst, entry.name)
+
+                if entry.is_dir():
+
+                    dirs.append((entry.path, target))
+                    pending.append((entry.path, target))
+
+                else:
+
+                    files.append((entry.path, target))
+
+    return dirs, files
+
+
+def copy_dirs_parallel(path_src: str | Path | list, path_dst: str | Path, max_workers: int | None = None, overwrite: bool = False, print_msg: bool = True) -> dict | None:
+    """
+    Copiar archivo(s) y directorio(s) en paralelo hacia otro directorio
+        - Recorre el árbol una sola vez, crea los directorios primero
+          y luego copia los archivos simultáneamente
+        - Los permisos y fechas de los directorios se copian al final
+
+    Parameters:
+    path_src (str | Path | list): Ruta o lista de rutas de elemento(s) a copiar
+    path_dst (str | Path): Ruta del directorio al que se van a copiar
+    max_workers (int | None): Cantidad de copias simultaneas
+    overwrite (bool): Sobrescribir el destino sí existe
+    print_msg (bool): Imprimir las estadísticas de la copia
+
+    Returns:
+    dict: Estadísticas de la copia (files, dirs, size, errors, seconds, speed)
+    None: Sí no hay nada que copiar
+    """
+
+    start = time.perf_counter()
+
+    # Recorrer los elementos a copiar y conformar las tareas
+    all_dirs, all_files, all_finals = [], [], []
+
+    for item in path_src if isinstance(path_src, list) else [path_src]:
+
+        # Preparar las rutas para copiar el elemento
+        paths = __prepare_paths(item, path_dst, overwrite)
+
+        if not paths:
+
+            continue
+
+        src, _, path_final, _ = paths
+
+        all_finals.append(path_final)
+
+        if src.is_dir():
+
+            dirs, files = __scan_tree(str(src), str(path_final))
+
+            all_dirs.extend(dirs)
+            all_files.extend(files)
+
+        else:
+
+            all_files.append((str(src), str(path_final)))
+
+    if not (all_dirs or all_files):
+
+        return
+
+    # Crear todos los directorios de antemano
+    for _, dir_ in all_dirs:
+
+        os.makedirs(dir_, exist_ok=True)
+
+    # Estadísticas de la copia
+    stats = {
+        "files": 0,
+        "dirs": len(all_dirs),
+        "size": 0,
+        "errors": 0,
+        "seconds": 0.0,
+        "speed": 0.0
+    }
+
+    # Cantidad de hilos por defecto (Copiar es una operación de E/S)
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+
+    # Copiar los archivos simultaneamente
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        futures = {
+            executor.submit(measure_queue_wait(__copy_file_fast, "copy"), src, dst): src for src, dst in all_files
+        }
+
+        for future in as_completed(futures):
+
+            try:
+
+                copied = future.result()
+
+                stats["size"] += copied
+                stats["files"] += 1
+
+                if METRICS.enabled:
+
+                    METRICS.increment("utilsdsp_bytes_copied_total", copied)
+                    METRICS.increment("utilsdsp_copies_total")
+
+            except Exception as err:
+
+                stats["errors"] += 1
+
+                report(
+                    "error",
+                    error("Error al copiar:", "ico"),
+                    info(futures[future]),
+                    "\n" + str(err)
+                )
+
+    # Copiar los permisos y fechas de los directorios después de sus
+    # archivos (los sub-directorios primero, al crear un elemento
+    # cambia la fecha de modificación de su padre)
+    for src, dir_ in reversed(all_dirs):
+
+        try:
+
+            copystat(src, dir_)
+
+        except OSError as err:
+
+            stats["errors"] += 1
+
+            report(
+                "error",
+                error("Error al copiar:", "ico"),
+                info(src),
+                "\n" + str(err)
+            )
+
+    invalidate_stat_cache(*all_finals)
+
+    # Calcular el tiempo y la velocidad total (bytes/seg)
+    stats["seconds"] = round(time.perf_counter() - start, 3)
+    stats["speed"] = stats["size"] / stats["seconds"] if stats["seconds"] else 0.0
+
+    # Imprimir las estadísticas de la copia
+    if print_msg:
+
+        report(
+            "success",
+            success(f'Copiados {stats["files"]} archivos', "ico"),
+            f'({stats["size"] / 1024 ** 2:.2f} MB en {stats["seconds"]}s -',
+            f'{stats["speed"] / 1024 ** 2:.2f} MB/s)',
+            bold("hacia:"),
+            info(Path(path_dst).resolve())
+        )
+
+    return stats
+
+
+def __files_are_equal(path_src: str, path_dst: str, stat_src: os.stat_result, stat_dst: os.stat_result, checksum: bool = False, chunk_size: int = 1024 ** 2) -> bool:
+    """
+    Comprobar sí dos archivos son iguales
+
+    Parameters:
+    path_src (str): Ruta del archivo de origen
+    path_dst (str): Ruta del archivo de destino
+    stat_src (os.stat_result): Datos del archivo de origen
+    stat_dst (os.stat_result): Datos del archivo de destino
+    checksum (bool): Comparar el contenido por bloques y no la fecha de modificación
+    chunk_size (int): Tamaño de los bloques a comparar
+
+    Returns:
+    bool: Booleano según sí son iguales o no
+    """
+
+    # Los enlaces simbólicos son iguales sí apuntan al mismo destino
+    if S_ISLNK(stat_src.st_mode) or S_ISLNK(stat_dst.st_mode):
+
+        return S_ISLNK(stat_src.st_mode) and S_ISLNK(stat_dst.st_mode) and os.readlink(path_src) == os.readlink(path_dst)
+
+    # Sí el tamaño es diferente, no hace falta comprobar nada más
+    if stat_src.st_size != stat_dst.st_size:
+
+        return False
+
+    # Comparar la fecha de modificación (en segundos)
+    if not checksum:
+
+        return int(stat_src.st_mtime) == int(stat_dst.st_mtime)
+
+    # Comparar el contenido por bloques, hasta el primer bloque diferente
+    with open(path_src, "rb") as fsrc, open(path_dst, "rb") as fdst:
+
+        while True:
+
+            chunk_src = fsrc.read(chunk_size)
+
+            if chunk_src != fdst.read(chunk_size):
+
+                return False
+
+            if not chunk_src:
+
+                return True
+
+
+def __scan_entries(path_src: str) -> tuple:
+    """
+    Obtener los sub-directorios y archivos de un directorio (rutas relativas)
+        - Los enlaces simbólicos no se siguen, se guardan como archivos
+          (aunque estén rotos o apunten a un directorio)
+
+    Parameters:
+    path_src (str): Ruta del directorio a recorrer
+
+    Returns:
+    tuple: Conjunto de sub-directorios, diccionario de archivos
+           {ruta relativa: os.stat_result} y cantidad de errores
+    """
+
+    dirs = set()
+    files = {}
+    errors = 0
+
+    # Pila de directorios pendientes (ruta absoluta, ruta relativa)
+    pending = [(path_src, "")]
+
+    while pending:
+
+        src, rel = pending.pop()
+
+        try:
+
+            with os.scandir(src) as entries:
+
+                for entry in entries:
+
+                    rel_path = os.path.join(rel, entry.name)
+
+                    # Reportar el error del elemento y continuar con los demás
+                    try:
+
+                        if entry.is_dir(follow_symlinks=False):
+
+                            dirs.add(rel_path)
+                            pending.append((entry.path, rel_path))
+
+                        else:
+
+                            files[rel_path] = entry.stat(follow_symlinks=False)
+
+                    except OSError as err:
+
+                        errors += 1
+
+                        report("error", error("No se pudo leer:", "ico"), info(entry.path), "\n" + str(err))
+
+        except OSError as err:
+
+            errors += 1
+
+            report("error", error("No se pudo leer:", "ico"), info(src), "\n" + str(err))
+
+    return dirs, files, errors
+
+
+def __sync_file(path_src: str, path_dst: str, stat_src: os.stat_result) -> int:
+    """
+    Copiar un archivo o recrear un enlace simbólico (con el mismo destino)
+
+    Parameters:
+    path_src (str): Ruta del archivo o enlace de origen
+    path_dst (str): Ruta del archivo o enlace de destino
+    stat_src (os.stat_result): Datos del origen (sin seguir los enlaces)
+
+    Returns:
+    int: Cantidad de bytes copiados
+    """
+
+    # No escribir a través de un enlace del destino
+    if os.path.islink(path_dst):
+
+        os.remove(path_dst)
+
+    if S_ISLNK(stat_src.st_mode):
+
+        os.symlink(os.readlink(path_src), path_dst)
+
+        return 0
+
+    return __copy_file_fast(path_src, path_dst)
+
+
+def __remove_entry(path_src: Path) -> bool:
+    """
+    Eliminar un directorio, archivo o enlace simbólico (sin seguirlo)
+
+    Parameters:
+    path_src (Path): Ruta a eliminar
+
+    Returns:
+    bool: Booleano según si se pudo eliminar o no
+    """
+
+    if not path_src.is_symlink():
+
+        return delete_dir(path_src)
+
+    try:
+
+        os.remove(path_src)
+
+        invalidate_stat_cache(path_src)
+
+        return True
+
+    except OSError as err:
+
+        report("error", error("Error al eliminar:", "ico"), info(path_src), "\n" + str(err))
+
+        return False
+
+
+def sync_dirs(path_src: str | Path, path_dst: str | Path, checksum: bool = False, delete: bool = False, max_workers: int | None = None, print_msg: bool = True) -> dict | None:
+    """
+    Sincronizar incrementalmente un directorio con otro (similar a rsync)
+        - Solo copia los archivos nuevos o modificados (tamaño y fecha de
+          modificación, o el contenido sí "checksum" está activo)
+        - El contenido de "path_src" queda reflejado dentro de "path_dst"
+        - Los enlaces simbólicos se copian como enlaces (no se siguen)
+
+    Parameters:
+    path_src (str | Path): Ruta del directorio o archivo de origen
+    path_dst (str | Path): Ruta del directorio o archivo espejo
+    checksum (bool): Comparar el contenido de los archivos por bloques
+    delete (bool): Eliminar del destino lo que no existe en el origen
+    max_workers (int | None): Cantidad de copias simultaneas
+    print_msg (bool): Imprimir el resumen de la sincronización
+
+    Returns:
+    dict: Resumen de los cambios (new, updated, deleted, unchanged, errors, size, seconds)
+    None: Sí no existe el origen
+    """
+
+    # Comprobar que exista el directorio o archivo de origen
+    if not validate_path(path_src):
+
+        return
+
+    start = time.perf_counter()
+
+    # Construir rutas absolutas
+    path_src = Path(path_src).resolve()
+    path_dst = Path(path_dst).resolve()
+
+    # Resumen de los cambios
+    summary = {
+        "new": [],
+        "updated": [],
+        "deleted": [],
+        "unchanged": 0,
+        "errors": 0,
+        "size": 0,
+        "seconds": 0.0
+    }
+
+    # Obtener el contenido del origen y del destino
+    if path_src.is_dir():
+
+        # Sí el destino es un archivo, se reemplaza por un directorio
+        if path_dst.exists() and not path_dst.is_dir():
+
+            delete_dir(path_dst)
+
+        os.makedirs(path_dst, exist_ok=True)
+
+        dirs_src, files_src, errors_src = __scan_entries(str(path_src))
+        dirs_dst, files_dst, errors_dst = __scan_entries(str(path_dst))
+
+        summary["errors"] += errors_src + errors_dst
+
+    else:
+
+        dirs_src, dirs_dst = set(), set()
+        files_src = {"": path_src.stat()}
+        files_dst = {"": path_dst.stat()} if path_dst.is_file() else {}
+
+        if path_dst.is_dir():
+
+            delete_dir(path_dst)
+
+    # Reemplazar los archivos que ahora son directorios y viceversa
+    for rel in (dirs_src & files_dst.keys()) | (files_src.keys() & dirs_dst):
+
+        __remove_entry(path_dst / rel)
+
+        # Olvidar el elemento eliminado y su contenido
+        files_dst = {
+            key: value for key, value in files_dst.items() if not (key == rel or key.startswith(rel + os.sep))
+        }
+
+        dirs_dst = {
+            key for key in dirs_dst if not (key == rel or key.startswith(rel + os.sep))
+        }
+
+    # Crear los sub-directorios que faltan (los padres primero)
+    for rel in sorted(dirs_src - dirs_dst):
+
+        os.makedirs(path_dst / rel, exist_ok=True)
+
+    # Seleccionar los archivos nuevos y modificados
+    pending = []
+
+    for rel, stat_src in files_src.items():
+
+        src = str(path_src / rel) if rel else str(path_src)
+        dst = str(path_dst / rel) if rel else str(path_dst)
+
+        if rel not in files_dst:
+
+            pending.append((src, dst, rel, "new"))
+
+        elif not __files_are_equal(src, dst, stat_src, files_dst[rel], checksum):
+
+            pending.append((src, dst, rel, "updated"))
+
+        else:
+
+            summary["unchanged"] += 1
+
+    # Copiar los archivos simultaneamente
+    max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        futures = {
+            executor.submit(__sync_file, src, dst, files_src[rel]): (rel or path_src.name, change) for src, dst, rel, change in pending
+        }
+
+        for future in as_completed(futures):
+
+            rel, change = futures[future]
+
+            try:
+
+                summary["size"] += future.result()
+                summary[change].append(rel)
+
+            except Exception as err:
+
+                summary["errors"] += 1
+
+                report(
+                    "error",
+                    error("Error al sincronizar:", "ico"),
+                    info(rel),
+                    "\n" + str(err)
+                )
+
+    # Eliminar del destino lo que no existe en el origen
+    if delete:
+
+        extraneous = (files_dst.keys() - files_src.keys()) | (dirs_dst - dirs_src)
+
+        for rel in sorted(extraneous):
+
+            # Ya se eliminó junto a su directorio padre
+            if os.path.dirname(rel) in extraneous:
+
+                continue
+
+            if __remove_entry(path_dst / rel):
+
+                summary["deleted"].append(rel)
+
+            else:
+
+                summary["errors"] += 1
+
+    invalidate_stat_cache(path_dst)
+
+    summary["seconds"] = round(time.perf_counter() - start, 3)
+
+    # Imprimir el resumen de la sincronización
+    if print_msg:
+
+        report(
+            "success",
+            success("Sincronizado:", "ico"),
+            info(path_src),
+            "\n  " + bold("hacia:"),
+            info(path_dst),
+            f'\n  Nuevos: {len(summary["new"])}  Modificados: {len(summary["updated"])}',
+            f' Eliminados: {len(summary["deleted"])}  Sin cambios: {summary["unchanged"]}',
+            f' Errores: {summary["errors"]}'
+        )
+
+    return summary
 
 
 def rename_dir(path_src: str | Path, new_name: str, path_dst: str | Path | None = None,  print_msg: bool = True, overwrite: bool = False) -> str | None:
@@ -604,7 +1640,7 @@ def rename_dir(path_src: str | Path, new_name: str, path_dst: str | Path | None
     # Comprobar que el nuevo nombre no este vacio y sea un string
     if not (new_name and isinstance(new_name, str)):
 
-        print(warning("El nuevo nombre no debe estar vacio y ser un texto.", "ico"))
+        report("warning", warning("El nuevo nombre no debe estar vacio y ser un texto.", "ico"))
 
         return
 
@@ -629,12 +1665,14 @@ def rename_dir(path_src: str | Path, new_name: str, path_dst: str | Path | None
 
         path_src.rename(path_final)
 
+        invalidate_stat_cache(path_src, path_final)
+
         if print_msg:
 
-            print(success("Renombrado", "ico"), msg, "\n")
+            report("success", success("Renombrado", "ico"), msg, "\n")
 
         return str(path_final)
 
     except Exception as err:
 
-        print(error("Error al renombrar:", "ico"), msg, "\n" + str(err), "\n")
+        report("error", error("Error al renombrar:", "ico"), msg, "\n" + str(err), "\n")
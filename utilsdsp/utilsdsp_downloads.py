@@ -3,25 +3,51 @@ Descargar un archivo desde internet:
     - validate_and_resquest: Comprobar sí una URL es válida y accesible
     - obtain_filename: Obtener nombre del archivo que se va a descargar
     - update_download_logs: Actualizar los logs de la descarga
+    - __iter_chunks: Recorrer los bloques de una respuesta registrando las métricas
+    - __write_chunks: Escribir los bloques de una respuesta en un archivo
     - download_file: Descargar un archivo desde internet
 
 Descargar varios archivos desde internet
     - organize_urls_data: Organizar en tuplas los datos de las URLs a descargar
     - update_description_pbar: Actualizar descripción de la barra de progreso principal
+    - _AdaptiveLimiter: Ajustar la cantidad de descargas simultaneas (AIMD)
+    - __download_tracked: Descargar un archivo y obtener su estado HTTP
+    - __download_adaptive: Descargar con concurrencia adaptativa y reintentos
     - download_files: Descargar multiples archivos simultaneos desde internet
+
+Descargar varios archivos hacia comprimidos:
+    - _ArchiveSink: Agregar miembros a comprimidos tar o zip que se van rotando
+    - __fetch_payload: Descargar el contenido de una URL en un buffer
+    - __archive_dir: Obtener el directorio saneado de un miembro dentro del comprimido
+    - download_files_to_archive: Descargar multiples archivos directamente hacia comprimidos
 """
 
 import os
+import re
+import json
+import time
+import tarfile
+import zipfile
+import heapq
 import requests
 import validators
 from pathlib import Path
+from threading import local
+from collections import deque
+from itertools import count
+from shutil import copyfileobj
+from tempfile import SpooledTemporaryFile
 from tqdm.auto import tqdm
 from datetime import datetime
-from urllib.parse import unquote
+from urllib.parse import unquote, urlparse
 from curl_cffi import requests as requests_curl
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from outputstyles import error, warning, info, success, bold
-from utilsdsp import sanitize_filename, create_downloads_dir, natural_size, join_path, validate_path, write_text_file, obtain_downloads_path, rename_exists_file
+from utilsdsp import sanitize_filename, create_downloads_dir, natural_size, join_path, validate_path, write_text_file, obtain_downloads_path, rename_exists_file, obtain_compress_type, uncompress_stream, invalidate_stat_cache, report, METRICS, measure_queue_wait
+
+# Último estado HTTP de cada hilo (código de estado, "timeout" o el
+# nombre del error de conexión) y su "Retry-After"
+__http_state = local()
 
 
 # COMMENT Funciones para descargar un archivo
@@ -55,7 +81,7 @@ def validate_and_resquest(url: str, accessible: bool = True, timeout: int | None
 
         if print_msg:
 
-            print(error("URL no válida:", "btn_ico"), info(url))
+            report("error", error("URL no válida:", "btn_ico"), info(url))
 
         # Atualizar los logs
         update_download_logs(
@@ -73,8 +99,12 @@ def validate_and_resquest(url: str, accessible: bool = True, timeout: int | None
         return True
 
     # Hacer la petición a la URL
+    __http_state.status = __http_state.retry_after = None
+
     try:
 
+        start = time.perf_counter() if METRICS.enabled else 0
+
         # Usar el requests tradicional o el de curl_cffi
         response = (requests_curl if r_curl else requests).get(
             url=url,
@@ -85,6 +115,17 @@ def validate_and_resquest(url: str, accessible: bool = True, timeout: int | None
             auth=auth
         )
 
+        __http_state.status = response.status_code
+        __http_state.retry_after = response.headers.get("Retry-After")
+
+        # Tiempo hasta recibir los encabezados (DNS + conexión + TTFB)
+        if METRICS.enabled:
+
+            host = urlparse(url).hostname or ""
+
+            METRICS.observe("utilsdsp_http_response_seconds", time.perf_counter() - start, host=host)
+            METRICS.increment("utilsdsp_http_requests_total", host=host, status=str(response.status_code))
+
         # Levantar una exception si no se obtuvo una respuesta
         # satisfactoria
         response.raise_for_status()
@@ -94,9 +135,19 @@ def validate_and_resquest(url: str, accessible: bool = True, timeout: int | None
 
     except requests.exceptions.RequestException as err:
 
+        if getattr(err, "response", None) is None:
+
+            __http_state.status = "timeout" if isinstance(err, requests.exceptions.Timeout) else type(err).__name__
+
+        # Contar los errores de conexión (Los de estado ya se contaron)
+        if METRICS.enabled and getattr(err, "response", None) is None:
+
+            METRICS.increment("utilsdsp_http_requests_total", host=urlparse(url).hostname or "", status=type(err).__name__)
+
         if print_msg:
 
-            print(
+            report(
+                "error",
                 error("No se pudo establecer conexión con:", "ico"),
                 info(url),
                 "\n" + str(err)
@@ -203,10 +254,93 @@ def update_download_logs(write_logs: bool, logs_path: str | Path, msg_type: str,
 
         except Exception as err:
 
-            print(error("Error al actualizar los logs", "ico"), "\n" + str(err))
+            report("error", error("Error al actualizar los logs", "ico"), "\n" + str(err))
+
+
+def __iter_chunks(response: requests.Response, chunk_size: int, pbar: tqdm | None = None):
+    """
+    Recorrer los bloques de una respuesta, actualizando la barra de
+    progreso y registrando el tiempo de transferencia, el del consumidor
+    (escritura o descompresión) y los bytes (sí están habilitadas las métricas)
+
+    Parameters:
+    response (requests.Response): Respuesta de la URL
+    chunk_size (int): Tamaño de los bloques
+    pbar (tqdm | None): Barra de progreso a actualizar
+
+    Returns:
+    Generator: Bloques de la respuesta
+    """
+
+    if not METRICS.enabled:
+
+        for data in response.iter_content(chunk_size=chunk_size):
+
+            if pbar is not None:
+
+                pbar.update(len(data))
+
+            yield data
+
+        return
+
+    received, writes, write_time = 0, 0, 0.0
+    start = time.perf_counter()
+
+    try:
+
+        for data in response.iter_content(chunk_size=chunk_size):
+
+            writes += 1
+            received += len(data)
+
+            if pbar is not None:
+
+                pbar.update(len(data))
+
+            # El tiempo hasta pedir el siguiente bloque es del consumidor
+            before = time.perf_counter()
+
+            yield data
+
+            write_time += time.perf_counter() - before
 
+    finally:
 
-def download_file(url: str, filename: str | None = None, path_dst: str | None = None, overwrite: bool = False, rename: bool = False, missing_name: str | None = None, write_logs: bool = True, logs_path: str | None = None, timeout: int = 10, chunk_size: int | None = None, headers: dict | None = None, cookies: dict | None = None, auth: dict | None = None, r_curl: bool = False, show_pbar: bool = True, disable_pbar: bool = False, leave: bool = True, ncols: int | None = None, colour: str | None = None, position: int | None = None, desc_len: int | None = None, print_msg: bool = True) -> str | bool | None:
+        host = urlparse(response.url).hostname or ""
+
+        # La transferencia no incluye el tiempo del consumidor
+        METRICS.observe("utilsdsp_download_transfer_seconds", time.perf_counter() - start - write_time, host=host)
+        METRICS.observe("utilsdsp_disk_write_seconds", write_time)
+        METRICS.increment("utilsdsp_download_bytes_total", received, host=host)
+        METRICS.increment("utilsdsp_disk_writes_total", writes)
+
+
+def __write_chunks(response: requests.Response, file, chunk_size: int, pbar: tqdm | None = None) -> int:
+    """
+    Escribir los bloques de una respuesta en un archivo
+    (Las métricas se registran en __iter_chunks)
+
+    Parameters:
+    response (requests.Response): Respuesta de la URL
+    file (IO): Archivo o buffer abierto en modo binario
+    chunk_size (int): Tamaño de los bloques
+    pbar (tqdm | None): Barra de progreso a actualizar
+
+    Returns:
+    int: Cantidad de bytes escritos
+    """
+
+    written = 0
+
+    for data in __iter_chunks(response, chunk_size, pbar):
+
+        written += file.write(data)
+
+    return written
+
+
+def download_file(url: str, filename: str | None = None, path_dst: str | None = None, overwrite: bool = False, rename: bool = False, missing_name: str | None = None, write_logs: bool = True, logs_path: str | None = None, timeout: int = 10, chunk_size: int | None = None, headers: dict | None = None, cookies: dict | None = None, auth: dict | None = None, r_curl: bool = False, show_pbar: bool = True, disable_pbar: bool = False, leave: bool = True, ncols: int | None = None, colour: str | None = None, position: int | None = None, desc_len: int | None = None, print_msg: bool = True, extract: bool = False) -> str | bool | None:
     """
     Descargar un archivo desde internet
 
@@ -239,8 +373,12 @@ def download_file(url: str, filename: str | None = None, path_dst: str | None =
 
     print_msg (bool): Imprimir o no los mensajes (warnings & errors)
 
+    extract (bool): Descomprimir mientras se descarga, sin guardar el
+                    comprimido (zip, tar, tar.gz, tar.zst, ...). Los
+                    miembros que ya existen siguen "overwrite" y "rename"
+
     Returns:
-    str: Ruta del archivo descargado
+    str: Ruta del archivo descargado (o descomprimido sí "extract")
     False: Si ocurrió alguna adevertencia al descargar
     None: Si ocurrió algún error al descargar
     """
@@ -269,14 +407,16 @@ def download_file(url: str, filename: str | None = None, path_dst: str | None =
 
         return  # Retornar un error
 
-    # Obtener el tamaño del archivo
-    filesize = int(response.headers.get("Content-Length", 0))
+    # Obtener el tamaño del archivo (None sí es desconocido, Ej: en las
+    # respuestas "chunked" sin Content-Length)
+    filesize = response.headers.get("Content-Length")
+    filesize = int(filesize) if filesize and filesize.isdigit() else None
 
     if filesize == 0:
 
         if print_msg:
 
-            print(error("El archivo no se encuentra o está vacio:", "ico"), info(url))
+            report("error", error("El archivo no se encuentra o está vacio:", "ico"), info(url))
 
         # Atualizar los logs
         update_download_logs(
@@ -300,15 +440,19 @@ def download_file(url: str, filename: str | None = None, path_dst: str | None =
     # Obtener la ruta del archivo
     filepath = join_path(path_dst, filename)
 
-    # Comprobar si existe el archivo a descargar
-    if validate_path(filepath, print_msg=False):
+    # Comprobar sí se va a descomprimir mientras se descarga
+    archive = filename if extract and obtain_compress_type(filename) else None
+
+    # Comprobar si existe el archivo a descargar (Sí no se descomprime al vuelo)
+    if validate_path(filepath, print_msg=False) and not archive:
 
         # Comprobar si no se va a sobreescribir o renombrar
         if not (overwrite or rename):
 
             if print_msg:
 
-                print(
+                report(
+                    "warning",
                     warning("Ya existe:", "ico"),
                     info(filepath),
                     "\n" + bold("  URL:"),
@@ -373,20 +517,69 @@ def download_file(url: str, filename: str | None = None, path_dst: str | None =
         # El chunk_size va a ser de 64KB por defecto
         chunk_size = 1024 * 64
 
+    # Sí se creó el archivo (para eliminarlo sí la descarga no termina)
+    created = False
+
     # Descargar el archivo
     try:
 
+        # Descomprimir los bloques a medida que llegan, sin guardar
+        # el comprimido en el disco
+        if archive:
+
+            if disable_pbar:
+
+                report("info", bold("Descargando y descomprimiendo:"), info(filepath))
+
+            # Actualizar la barra de progreso con cada bloque recibido
+            # (los miembros que ya existen se sobrescriben o renombran
+            # igual que el archivo descargado)
+            path_extracted = uncompress_stream(
+                __iter_chunks(response, chunk_size, pbar),
+                archive,
+                path_dst,
+                overwrite=overwrite,
+                rename=rename
+            )
+
+            pbar.close()
+
+            # El error ya se reportó al descomprimir
+            if not path_extracted:
+
+                # Atualizar los logs
+                update_download_logs(
+                    write_logs=write_logs,
+                    logs_path=logs_path,
+                    msg_type="download_error",
+                    url=url,
+                    filepath=filepath,
+                    err=f'No se pudo descomprimir: {archive}'
+                )
+
+                return  # Retornar un error
+
+            # Atualizar los logs
+            update_download_logs(
+                write_logs=write_logs,
+                logs_path=logs_path,
+                msg_type="downloaded",
+                url=url,
+                filepath=path_extracted
+            )
+
+            return path_extracted
+
         with open(filepath, "wb") as file:
 
+            created = True
+
             if disable_pbar:
 
-                print(bold("Descargando:"), info(filepath))
+                report("info", bold("Descargando:"), info(filepath))
 
             # Escribir el archivo y actualizar la barra de progreso
-            for data in response.iter_content(chunk_size=chunk_size):
-
-                size = file.write(data)
-                pbar.update(size)
+            __write_chunks(response, file, chunk_size, pbar)
 
             pbar.close()
 
@@ -403,9 +596,24 @@ def download_file(url: str, filename: str | None = None, path_dst: str | None =
 
     except Exception as err:
 
+        pbar.close()
+
+        # Eliminar el archivo incompleto (para que se pueda reintentar
+        # la descarga sin que ya exista)
+        if created and os.path.exists(filepath):
+
+            os.remove(filepath)
+
+        # Los cortes a mitad de la transferencia también cuentan
+        # como "timeout" (para la concurrencia adaptativa)
+        if isinstance(err, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+
+            __http_state.status = "timeout"
+
         if print_msg:
 
-            print(
+            report(
+                "error",
                 error("Error al descargar:", "ico"),
                 info(filename),
                 "\n" + bold("  URL:"),
@@ -424,6 +632,13 @@ def download_file(url: str, filename: str | None = None, path_dst: str | None =
 
         return  # Retornar un error
 
+    finally:
+
+        # El archivo se creó o se eliminó (para "stat_cache")
+        if created:
+
+            invalidate_stat_cache(filepath)
+
 
 # COMMENT Funciones para descargar varios archivos simultaneos
 def organize_urls_data(urls_data: list, path_dst: str, char_separation: str = ",") -> list:
@@ -477,7 +692,7 @@ def organize_urls_data(urls_data: list, path_dst: str, char_separation: str = ",
     return result
 
 
-def update_description_pbar(result: str | bool | None, downloads_status: dict) -> tuple:
+def update_description_pbar(result: str | bool | None, downloads_status: dict, size: int | None = None) -> tuple:
     """
     Actualizar la descripción de la barra de progreso principal
     cuando se descarga varios archivos
@@ -485,6 +700,7 @@ def update_description_pbar(result: str | bool | None, downloads_status: dict) -
     Parameters:
     result (str | bool | None): Resultado al descargar un archivo
     downloads_status (dict): Estadísticas de las descargas
+    size (int | None): Tamaño de lo descargado (Sí no es la ruta de un archivo)
 
     Returns:
     tuple (srt, dict): Descripción actualizada y diccionario con las estadísticas
@@ -496,7 +712,7 @@ def update_description_pbar(result: str | bool | None, downloads_status: dict) -
 
         # Incrementar los archivos descargados y el tamaño total
         downloads_status["downloaded"] += 1
-        downloads_status["size"] += Path(result).stat().st_size
+        downloads_status["size"] += Path(result).stat().st_size if size is None else size
 
     # Actualizar las advertencias y errores
     if result == False:
@@ -532,7 +748,301 @@ def update_description_pbar(result: str | bool | None, downloads_status: dict) -
     return desc, downloads_status
 
 
-def download_files(urls_data: list, path_dst: str | None = None, max_workers: int = 1, char_separation: str = ",", overwrite: bool = False, rename: bool = False, missing_name: str | None = None, write_logs: bool = True, logs_path: str | None = None, timeout: int = 10, chunk_size: int | None = None, headers: dict | None = None, cookies: dict | None = None, auth: dict | None = None, r_curl: bool = False, show_pbar: bool = True, disable_pbar: bool = False, leave: bool = True, ncols: int | None = None, colour_main: str | None = None, colour: str | None = None, desc_len: int | None = None, print_msg: bool = False) -> str | None:
+class _AdaptiveLimiter:
+    """
+    Ajustar la cantidad de descargas simultaneas (AIMD):
+        - Al comienzo los límites se duplican hasta el primer error
+          o hasta que el rendimiento deja de crecer
+        - Por host: aumenta de a poco con cada descarga satisfactoria y
+          se reduce a la mitad (con una espera creciente) ante un 429,
+          un 5xx o un timeout
+        - En total: aumenta mientras el rendimiento agregado (bytes/seg)
+          siga creciendo y se reduce a la mitad con cada error de carga
+    """
+
+    def __init__(self, max_workers: int, initial: int = 2, window: float = 0.5) -> None:
+        """
+        Parameters:
+        max_workers (int): Cantidad máxima de descargas simultaneas
+        initial (int): Cantidad inicial de descargas simultaneas
+        window (float): Segundos de cada ventana para medir el rendimiento
+        """
+
+        self.max_workers = max(1, max_workers)
+        self.limit = float(min(initial, self.max_workers))
+        self.active = 0
+
+        # Duplicar los límites hasta el primer error o estancamiento
+        self.slow_start = True
+
+        # Estado de cada host (limit, active, failures, reduced_at, backoff_until)
+        self.hosts = {}
+
+        # Rendimiento de la ventana actual y de la anterior
+        self.window = window
+        self.window_start = time.monotonic()
+        self.window_bytes = 0
+        self.last_rate = 0.0
+
+    def _host(self, host: str) -> dict:
+
+        if host not in self.hosts:
+
+            self.hosts[host] = {
+                "limit": self.limit,
+                "active": 0,
+                "failures": 0,
+                "reduced_at": 0.0,
+                "backoff_until": 0.0
+            }
+
+        return self.hosts[host]
+
+    def can_start(self, host: str) -> bool:
+        """
+        Comprobar sí se puede comenzar otra descarga del host
+        """
+
+        state = self._host(host)
+
+        return (
+            self.active < int(self.limit)
+            and state["active"] < int(state["limit"])
+            and time.monotonic() >= state["backoff_until"]
+        )
+
+    def start(self, host: str) -> float:
+        """
+        Registrar el comienzo de una descarga
+
+        Returns:
+        float: Momento en que comenzó
+        """
+
+        self.active += 1
+        self._host(host)["active"] += 1
+
+        return time.monotonic()
+
+    def finish(self, host: str, status: int | str | None, size: int = 0, retry_after: str | None = None, started: float = 0.0) -> float | None:
+        """
+        Registrar el final de una descarga y ajustar los límites
+
+        Parameters:
+        host (str): Host de la URL
+        status (int | str | None): Código de estado, "timeout" o nombre del error
+        size (int): Bytes descargados
+        retry_after (str | None): Encabezado "Retry-After" de la respuesta
+        started (float): Momento en que comenzó la descarga
+
+        Returns:
+        float: Segundos a esperar antes de reintentar (sí hay que reducir la carga)
+        None: Sí no hay que reducir la carga
+        """
+
+        state = self._host(host)
+        now = time.monotonic()
+
+        self.active -= 1
+        state["active"] -= 1
+
+        # Reducir a la mitad ante 429, 5xx o timeout
+        if status == 429 or status == "timeout" or (isinstance(status, int) and status >= 500):
+
+            # Las descargas que comenzaron antes de la última reducción
+            # son parte del mismo episodio de carga (solo esperan)
+            if started < state["reduced_at"]:
+
+                return max(0.5, state["backoff_until"] - now)
+
+            state["failures"] += 1
+            state["reduced_at"] = now
+            state["limit"] = max(1.0, state["limit"] / 2)
+
+            self.limit = max(1.0, self.limit / 2)
+            self.slow_start = False
+
+            # Esperar lo indicado por el servidor o de forma exponencial
+            delay = min(30.0, 0.5 * 2.0 ** (state["failures"] - 1))
+
+            if retry_after and retry_after.strip().isdigit():
+
+                delay = min(300.0, float(retry_after))
+
+            state["backoff_until"] = max(state["backoff_until"], now + delay)
+
+            if METRICS.enabled:
+
+                METRICS.increment("utilsdsp_http_backoffs_total", host=host, status=str(status))
+
+            return delay
+
+        state["failures"] = 0
+
+        # Aumento aditivo (aprox. +1 cada "limit" descargas) o
+        # exponencial al comienzo (+1 por cada descarga)
+        state["limit"] = min(self.max_workers, state["limit"] + (1 if self.slow_start else 1 / state["limit"]))
+
+        self.window_bytes += size
+
+        # Aumentar el total solo mientras el rendimiento siga creciendo
+        if (elapsed := now - self.window_start) >= self.window:
+
+            rate = self.window_bytes / elapsed
+
+            if rate > self.last_rate * 1.05:
+
+                self.limit = min(self.max_workers, self.limit * 2 if self.slow_start else self.limit + 1)
+
+            else:
+
+                self.slow_start = False
+
+            self.last_rate = rate
+            self.window_start = now
+            self.window_bytes = 0
+
+        return None
+
+
+def __download_tracked(**kwargs) -> tuple:
+    """
+    Descargar un archivo y obtener el estado HTTP con que terminó
+    (Para la concurrencia adaptativa)
+
+    Parameters:
+    kwargs (Any): Argumentos de "download_file"
+
+    Returns:
+    tuple: (resultado de download_file, estado HTTP, Retry-After, bytes)
+    """
+
+    __http_state.status = __http_state.retry_after = None
+
+    result = download_file(**kwargs)
+
+    size = Path(result).stat().st_size if isinstance(result, str) and Path(result).is_file() else 0
+
+    return result, __http_state.status, __http_state.retry_after, size
+
+
+def __download_adaptive(data_organized: list, options: dict, max_workers: int, max_retries: int, pbar: tqdm) -> None:
+    """
+    Descargar los archivos ajustando la concurrencia por host y en
+    total, reintentando las descargas rechazadas por carga (429, 5xx
+    o timeout) después de esperar
+
+    Parameters:
+    data_organized (list): Tuplas (URL, Filename, Path_Folder)
+    options (dict): Demás argumentos de "download_file"
+    max_workers (int): Cantidad máxima de descargas simultaneas
+    max_retries (int): Reintentos de cada descarga rechazada por carga
+    pbar (tqdm): Barra de progreso principal
+
+    Returns:
+    None
+    """
+
+    limiter = _AdaptiveLimiter(max_workers)
+
+    # Descargas pendientes de cada host (URL, Filename, Path_Folder, intento)
+    queues = {}
+
+    for url, filename, path_dst_folder in data_organized:
+
+        host = urlparse(url).hostname or ""
+
+        queues.setdefault(host, deque()).append((url, filename, path_dst_folder, 0))
+
+    # Reintentos en espera (momento, orden, host, descarga)
+    delayed = []
+    order = count()
+    running = {}
+
+    downloads_status = {
+        "downloaded": 0,
+        "size": 0,
+        "warnings": 0,
+        "errors": 0
+    }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        while running or delayed or any(queues.values()):
+
+            # Devolver a su cola los reintentos que ya esperaron
+            while delayed and delayed[0][0] <= time.monotonic():
+
+                _, _, host, item = heapq.heappop(delayed)
+
+                queues[host].appendleft(item)
+
+            # Comenzar todas las descargas que permitan los límites
+            for host, queue in queues.items():
+
+                while queue and limiter.can_start(host):
+
+                    item = queue.popleft()
+
+                    started = limiter.start(host)
+
+                    future = executor.submit(
+                        measure_queue_wait(__download_tracked, "downloads"),
+                        url=item[0],
+                        filename=item[1],
+                        path_dst=item[2],
+                        position=1,
+                        **options
+                    )
+
+                    running[future] = (host, item, started)
+
+            # Esperar a que termine alguna descarga o a que pueda comenzar otra
+            if not running:
+
+                time.sleep(max(0.01, min(1.0, delayed[0][0] - time.monotonic())) if delayed else 0.05)
+
+                continue
+
+            done, _ = wait(running, timeout=1.0, return_when=FIRST_COMPLETED)
+
+            for future in done:
+
+                host, item, started = running.pop(future)
+
+                # Un error inesperado cuenta como descarga fallida, sin
+                # detener las demás ni dejar ocupado su lugar en el límite
+                try:
+
+                    result, status, retry_after, size = future.result()
+
+                except Exception as err:
+
+                    result, status, retry_after, size = None, type(err).__name__, None, 0
+
+                    if options.get("print_msg"):
+
+                        report("error", error("Error al descargar:", "ico"), info(item[0]), "\n" + bold("  Error:"), info(err))
+
+                delay = limiter.finish(host, status, size, retry_after, started)
+
+                # Reintentar más tarde sí se rechazó por carga
+                if not result and delay is not None and item[3] < max_retries:
+
+                    retry = (*item[:3], item[3] + 1)
+
+                    heapq.heappush(delayed, (time.monotonic() + delay, next(order), host, retry))
+
+                    continue
+
+                pbar.update(1)
+
+                desc, downloads_status = update_description_pbar(result, downloads_status, size if result else None)
+
+                pbar.set_description(desc)
+
+
+def download_files(urls_data: list, path_dst: str | None = None, max_workers: int = 1, char_separation: str = ",", overwrite: bool = False, rename: bool = False, missing_name: str | None = None, write_logs: bool = True, logs_path: str | None = None, timeout: int = 10, chunk_size: int | None = None, headers: dict | None = None, cookies: dict | None = None, auth: dict | None = None, r_curl: bool = False, show_pbar: bool = True, disable_pbar: bool = False, leave: bool = True, ncols: int | None = None, colour_main: str | None = None, colour: str | None = None, desc_len: int | None = None, print_msg: bool = False, adaptive: bool = False, max_retries: int = 3) -> str | None:
     """
     Descargar multiples archivos simultaneos desde internet
 
@@ -579,6 +1089,11 @@ def download_files(urls_data: list, path_dst: str | None = None, max_workers: in
 
     print_msg (bool): Imprimir los mensajes (warnings & errors)
 
+    adaptive (bool): Ajustar automáticamente las descargas simultaneas
+                     (por host y en total), hasta "max_workers"
+    max_retries (int): Reintentos de las descargas rechazadas por carga
+                       (429, 5xx o timeout) en modo adaptativo
+
     Returns:
     str: Ruta del directorio donde se descargaron los archivos
     None: En caso de no realizar la descarga
@@ -609,6 +1124,40 @@ def download_files(urls_data: list, path_dst: str | None = None, max_workers: in
     # Comenzar la descarga de los archivos
     try:
 
+        # Ajustar la concurrencia automáticamente
+        if adaptive:
+
+            with progress_bar as pbar:
+
+                __download_adaptive(
+                    data_organized,
+                    options={
+                        "overwrite": overwrite,
+                        "rename": rename,
+                        "missing_name": missing_name,
+                        "write_logs": write_logs,
+                        "logs_path": logs_path,
+                        "timeout": timeout,
+                        "chunk_size": chunk_size,
+                        "headers": headers,
+                        "cookies": cookies,
+                        "auth": auth,
+                        "r_curl": r_curl,
+                        "show_pbar": show_pbar,
+                        "disable_pbar": disable_pbar,
+                        "leave": leave,
+                        "ncols": ncols,
+                        "colour": colour,
+                        "desc_len": desc_len,
+                        "print_msg": print_msg
+                    },
+                    max_workers=max_workers,
+                    max_retries=max_retries,
+                    pbar=pbar
+                )
+
+            return path_dst
+
         # Crear un ThreadPoolExecutor para multitareas
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
 
@@ -619,7 +1168,7 @@ def download_files(urls_data: list, path_dst: str | None = None, max_workers: in
                 # resultado en "futures" al finalizar
                 futures = {
                     executor.submit(
-                        download_file,
+                        measure_queue_wait(download_file, "downloads"),
                         url=url,
                         filename=filename,
                         path_dst=path_dst_folder,
@@ -677,5 +1226,509 @@ def download_files(urls_data: list, path_dst: str | None = None, max_workers: in
         return path_dst
 
     except Exception as err:
-        print(error("Error en la descarga simultanea de archivos.", "ico"))
-        print(err)
+        report("error", error("Error en la descarga simultanea de archivos.", "ico"))
+        report("error", err)
+
+    finally:
+
+        # Los hilos no ven la caché de este contexto (para "stat_cache")
+        invalidate_stat_cache(path_dst)
+
+
+# COMMENT Descargar varios archivos hacia comprimidos
+class _ArchiveSink:
+    """
+    Agregar miembros a uno o varios comprimidos tar o zip, pasando
+    al siguiente cuando el actual supera el tamaño máximo
+        - Sin tamaño máximo se usa un solo comprimido: <nombre>.tar
+        - Con tamaño máximo se numeran: <nombre>-00001.tar, ...
+    """
+
+    def __init__(self, path_dst: str, archive_name: str, compress_type: str = "tar", max_size: int | None = None) -> None:
+        """
+        Parameters:
+        path_dst (str): Directorio donde se guardan los comprimidos
+        archive_name (str): Nombre de los comprimidos (sin extensión)
+        compress_type (str): Tipo de comprimido (tar o zip)
+        max_size (int | None): Tamaño máximo de cada comprimido en bytes
+        """
+
+        self.path_dst = path_dst
+        self.archive_name = archive_name
+        self.compress_type = compress_type
+        self.max_size = max_size
+
+        self.archive = None
+        self.path_archive = None
+        self.number = 0
+        self.size = 0
+        self.arcnames = set()
+
+    def path_of(self, number: int) -> str:
+        """
+        Obtener la ruta del comprimido según su número
+        """
+
+        suffix = f'-{number:05d}' if self.max_size else ""
+
+        return join_path(self.path_dst, f'{self.archive_name}{suffix}.{self.compress_type}')
+
+    def existing(self) -> list:
+        """
+        Obtener los comprimidos que ya existen con este nombre
+        (<nombre>.tar y todos los numerados <nombre>-00001.tar, ...)
+        """
+
+        pattern = re.compile(rf'{re.escape(self.archive_name)}(-\d{{5,}})?\.{self.compress_type}')
+
+        try:
+
+            names = [name for name in os.listdir(self.path_dst) if pattern.fullmatch(name)]
+
+        except OSError:
+
+            return []
+
+        return [join_path(self.path_dst, name) for name in sorted(names)]
+
+    def _open_next(self) -> None:
+        """
+        Cerrar el comprimido actual y abrir el siguiente
+        """
+
+        self.close()
+
+        self.number += 1
+        self.size = 0
+        self.arcnames = set()
+        self.path_archive = self.path_of(self.number)
+
+        if self.compress_type == "zip":
+
+            self.archive = zipfile.ZipFile(self.path_archive, "w", zipfile.ZIP_DEFLATED)
+
+        else:
+
+            self.archive = tarfile.open(self.path_archive, "w", format=tarfile.PAX_FORMAT)
+
+    def _unique_arcname(self, arcname: str) -> str:
+        """
+        Evitar miembros repetidos dentro del mismo comprimido
+        (Ej: "foto.jpg" -> "foto_1.jpg")
+        """
+
+        stem, ext = os.path.splitext(arcname)
+        counter = 0
+
+        while arcname in self.arcnames:
+
+            counter += 1
+
+            arcname = f'{stem}_{counter}{ext}'
+
+        self.arcnames.add(arcname)
+
+        return arcname
+
+    def add(self, arcname: str, fileobj, size: int, mtime: float | None = None) -> tuple:
+        """
+        Agregar un miembro al comprimido actual
+
+        Parameters:
+        arcname (str): Nombre del miembro dentro del comprimido
+        fileobj (BinaryIO): Contenido del miembro (desde el inicio)
+        size (int): Tamaño del contenido
+        mtime (float | None): Fecha de modificación
+
+        Returns:
+        tuple (str, str): Nombre del comprimido y del miembro agregado
+        """
+
+        # Pasar al siguiente comprimido sí se supera el tamaño máximo
+        if not self.archive or (self.max_size and self.size and self.size + size > self.max_size):
+
+            self._open_next()
+
+        arcname = self._unique_arcname(arcname)
+        mtime = mtime or time.time()
+
+        if self.compress_type == "zip":
+
+            info = zipfile.ZipInfo(arcname, time.localtime(mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+
+            with self.archive.open(info, "w", force_zip64=size > zipfile.ZIP64_LIMIT) as member:
+
+                copyfileobj(fileobj, member, 1024 * 64)
+
+        else:
+
+            info = tarfile.TarInfo(arcname)
+            info.size = size
+            info.mtime = mtime
+            info.mode = 0o644
+
+            self.archive.addfile(info, fileobj)
+
+        self.size += size
+
+        return Path(self.path_archive).name, arcname
+
+    def close(self) -> None:
+
+        if self.archive:
+
+            self.archive.close()
+
+            self.archive = None
+
+
+def __fetch_payload(url: str, filename: str, arcdir: str, missing_name: str | None = None, write_logs: bool = True, logs_path: str | None = None, timeout: int = 10, chunk_size: int | None = None, headers: dict | None = None, cookies: dict | None = None, auth: dict | None = None, r_curl: bool = False, spool_size: int = 1024 ** 2 * 8, print_msg: bool = False) -> tuple | bool | None:
+    """
+    Descargar el contenido de una URL en un buffer (en memoria
+    y en el disco sí supera "spool_size")
+
+    Parameters:
+    url (str): URL del archivo a descargar
+    filename (str): Nombre del archivo (Vacio para obtenerlo de la respuesta)
+    arcdir (str): Directorio del miembro dentro del comprimido
+    spool_size (int): Tamaño máximo del contenido en memoria
+
+    Returns:
+    tuple (str, SpooledTemporaryFile, int): Nombre del miembro, contenido y tamaño
+    False: Sí la URL no es válida (advertencia)
+    None: Sí ocurrió algún error al descargar
+    """
+
+    # Hacer la petición a la URL
+    response = validate_and_resquest(
+        url=url,
+        timeout=timeout,
+        headers=headers,
+        cookies=cookies,
+        auth=auth,
+        r_curl=r_curl,
+        write_logs=write_logs,
+        logs_path=logs_path,
+        print_msg=print_msg
+    )
+
+    # Retornar una advertencia (False) o un error (None)
+    if not response:
+
+        return response
+
+    # Obtener el nombre del archivo
+    filename = sanitize_filename(filename) if filename else obtain_filename(response, url, missing_name)
+
+    arcname = f'{arcdir}/{filename}' if arcdir else filename
+
+    # Descargar el contenido
+    buffer = SpooledTemporaryFile(max_size=spool_size)
+
+    try:
+
+        __write_chunks(response, buffer, chunk_size or 1024 * 64)
+
+    except Exception as err:
+
+        buffer.close()
+
+        if print_msg:
+
+            report(
+                "error",
+                error("Error al descargar:", "ico"),
+                info(filename),
+                "\n" + bold("  URL:"),
+                info(url)
+            )
+
+        # Atualizar los logs
+        update_download_logs(
+            write_logs=write_logs,
+            logs_path=logs_path,
+            msg_type="download_error",
+            url=url,
+            filepath=arcname,
+            err=err
+        )
+
+        return
+
+    size = buffer.tell()
+
+    # Comprobar que no esté vacio
+    if size == 0:
+
+        buffer.close()
+
+        if print_msg:
+
+            report("error", error("El archivo no se encuentra o está vacio:", "ico"), info(url))
+
+        # Atualizar los logs
+        update_download_logs(
+            write_logs=write_logs,
+            logs_path=logs_path,
+            msg_type="file_empty",
+            url=url
+        )
+
+        return
+
+    buffer.seek(0)
+
+    return arcname, buffer, size
+
+
+def __archive_dir(folder: str, path_dst: str) -> str:
+    """
+    Obtener el directorio de un miembro dentro del comprimido, relativo
+    al destino y sin componentes que salgan de él (Ej: "..", "/" o "C:")
+
+    Parameters:
+    folder (str): Directorio de la descarga
+    path_dst (str): Directorio de los comprimidos
+
+    Returns:
+    str: Directorio saneado dentro del comprimido ("" sí es la raíz)
+    """
+
+    try:
+
+        arcdir = os.path.relpath(folder, path_dst)
+
+    # Rutas en distintas unidades (Windows)
+    except ValueError:
+
+        arcdir = os.path.splitdrive(folder)[1]
+
+    arcdir = arcdir.replace(os.sep, "/")
+
+    # Eliminar los componentes no válidos
+    return "/".join(item for item in arcdir.split("/") if item not in ("", ".", ".."))
+
+
+def download_files_to_archive(urls_data: list, path_dst: str | None = None, archive_name: str = "downloads", compress_type: str = "tar", max_archive_size: int | None = None, max_workers: int = 1, char_separation: str = ",", overwrite: bool = False, missing_name: str | None = None, write_logs: bool = True, logs_path: str | None = None, timeout: int = 10, chunk_size: int | None = None, headers: dict | None = None, cookies: dict | None = None, auth: dict | None = None, r_curl: bool = False, disable_pbar: bool = False, ncols: int | None = None, colour_main: str | None = None, print_msg: bool = False) -> str | None:
+    """
+    Descargar multiples archivos simultaneos directamente hacia uno
+    o varios comprimidos tar o zip (sin crear un archivo por cada URL)
+        - El directorio y el nombre de cada archivo (de "urls_data") se
+          usan como el nombre del miembro dentro del comprimido
+        - Un índice (<archive_name>.index.jsonl) relaciona cada URL con
+          su comprimido y su miembro
+
+    Ejemplo (URL, Filename, Path_Folder separados por comas u otro carácter):
+    urls_data = [
+        "https://dominio.com/imagen.jpg, Foto1.jpg, Carpeta de imagenes",
+        "https://solo_la_url.com/imagen2.jpg"
+    ]
+
+    Parameters:
+    urls_data (list): Datos de las URLs (URL, Filename, Path_Folder)
+    path_dst (str): Directorio para guardar los comprimidos
+    archive_name (str): Nombre de los comprimidos (sin extensión)
+    compress_type (str): Tipo de comprimido (tar o zip)
+    max_archive_size (int | None): Tamaño máximo de cada comprimido en bytes,
+                                   al superarlo se pasa a uno nuevo
+    max_workers (int): Cantidad de descargas simultaneas
+    char_separation (str): Caracter que separa los datos de "urls_data"
+
+    overwrite (bool): Sobrescribir los comprimidos sí existen
+    missing_name (str): Nombre por defecto si no se obtiene el nombre del archivo
+
+    write_logs (bool): Guardar los logs
+    logs_path (str): Ruta del archivo de los logs
+
+    timeout (int): Tiempo de espera por una respuesta del servidor
+    chunk_size (int | None): Tamaño del bloque a descargar desde el servidor
+    headers (dict | None): Datos del Headers de la petición Get
+    cookies (dict | None): Datos de las cookies de la petición Get
+    auth (dict | None): Credenciales de autenticación
+    r_curl (bool | None): Usar el metodo requests de curl_cffi
+
+    disable_pbar (bool): Deshabilitar la barra de progreso
+    ncols (int): Número de columnas de la barra de progreso
+    colour_main (str): Color de la barra de progreso
+
+    print_msg (bool): Imprimir los mensajes (warnings & errors)
+
+    Returns:
+    str: Ruta del índice de los archivos descargados
+    None: En caso de no realizar la descarga
+    """
+
+    # Comprobar el tipo de comprimido
+    if compress_type not in ["tar", "zip"]:
+
+        report("error", error("Tipo de comprimido no admitido:", "ico"), info(compress_type))
+
+        return
+
+    # Ruta para guardar los comprimidos y los logs
+    path_dst = create_downloads_dir(path_dst)
+
+    logs_path = logs_path or join_path(path_dst, "logs.txt")
+
+    # Rutas del índice y de los comprimidos
+    sink = _ArchiveSink(path_dst, archive_name, compress_type, max_archive_size)
+
+    index_path = join_path(path_dst, f'{archive_name}.index.jsonl')
+
+    # Comprobar sí ya existen los comprimidos (todos los numerados,
+    # para no mezclar los nuevos con los de una descarga anterior)
+    existing = sink.existing()
+
+    if existing and not overwrite:
+
+        report("warning", warning("Ya existe:", "ico"), info(existing[0]))
+
+        return
+
+    for path_archive in existing:
+
+        os.remove(path_archive)
+
+    # Organizar en tuplas los datos de las URLs, con el directorio
+    # relativo de cada una dentro del comprimido
+    data_organized = []
+
+    for url, filename, folder in organize_urls_data(urls_data, path_dst, char_separation):
+
+        data_organized.append((url, filename, __archive_dir(folder, path_dst)))
+
+    # Definir el color de la barra de progreso principal
+    if not (os.getenv("COLAB_RELEASE_TAG") or colour_main):
+
+        colour_main = "green"
+
+    # Estado de las estadísticas de las descargas
+    downloads_status = {
+        "downloaded": 0,
+        "size": 0,
+        "warnings": 0,
+        "errors": 0
+    }
+
+    try:
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, open(index_path, "w", encoding="utf-8") as index_file, tqdm(total=len(data_organized), desc=bold("Descargando archivos..."), ncols=ncols, colour=colour_main, disable=disable_pbar, unit="File") as pbar:
+
+            # Limitar las descargas en memoria (solo se envían unas
+            # pocas más de las que se pueden descargar a la vez)
+            pending = iter(data_organized)
+            futures = {}
+
+            def submit(amount: int) -> None:
+
+                for _ in range(amount):
+
+                    if not (data := next(pending, None)):
+
+                        break
+
+                    url, filename, arcdir = data
+
+                    future = executor.submit(
+                        measure_queue_wait(__fetch_payload, "downloads"),
+                        url=url,
+                        filename=filename,
+                        arcdir=arcdir,
+                        missing_name=missing_name,
+                        write_logs=write_logs,
+                        logs_path=logs_path,
+                        timeout=timeout,
+                        chunk_size=chunk_size,
+                        headers=headers,
+                        cookies=cookies,
+                        auth=auth,
+                        r_curl=r_curl,
+                        print_msg=print_msg
+                    )
+
+                    futures[future] = url
+
+            submit(max_workers * 2)
+
+            while futures:
+
+                # Agregar al comprimido las descargas ya terminadas (el
+                # comprimido solo se escribe desde este hilo)
+                future = next(as_completed(futures))
+                url = futures.pop(future)
+
+                submit(1)
+
+                pbar.update(1)
+
+                # Contar como un error una excepción inesperada de una
+                # descarga y continuar con las demás
+                try:
+
+                    payload = future.result()
+
+                except Exception as err:
+
+                    report("error", error("Error al descargar:", "ico"), info(url), "\n" + str(err))
+
+                    # Atualizar los logs
+                    update_download_logs(
+                        write_logs=write_logs,
+                        logs_path=logs_path,
+                        msg_type="download_error",
+                        url=url,
+                        err=str(err)
+                    )
+
+                    payload = None
+
+                if not payload:
+
+                    desc, downloads_status = update_description_pbar(payload, downloads_status)
+
+                    pbar.set_description(desc)
+
+                    continue
+
+                arcname, buffer, size = payload
+
+                with buffer:
+
+                    archive, member = sink.add(arcname, buffer, size)
+
+                # Relacionar la URL con su miembro en el índice
+                index_file.write(json.dumps({
+                    "url": url,
+                    "archive": archive,
+                    "member": member,
+                    "size": size
+                }, ensure_ascii=False) + "\n")
+
+                # Atualizar los logs
+                update_download_logs(
+                    write_logs=write_logs,
+                    logs_path=logs_path,
+                    msg_type="downloaded",
+                    url=url,
+                    filepath=f'{archive}/{member}'
+                )
+
+                desc, downloads_status = update_description_pbar(member, downloads_status, size)
+
+                pbar.set_description(desc)
+
+        # Devolver la ruta del índice, sí todo salió bien
+        return index_path
+
+    except Exception as err:
+
+        report("error", error("Error en la descarga simultanea de archivos.", "ico"))
+        report("error", err)
+
+    finally:
+
+        sink.close()
+
+        # Los comprimidos cambiaron (para "stat_cache")
+        invalidate_stat_cache(path_dst)
@@ -6,7 +6,7 @@ Operaciones con archivos:
 
 from pathlib import Path
 from outputstyles import error, info, warning, success
-from utilsdsp import create_dir, validate_path
+from utilsdsp import create_dir, validate_path, invalidate_stat_cache, report
 
 
 def read_text_file(path_file: str | Path, by_line: bool = True, print_msg: bool = True) -> list | str | None:
@@ -35,7 +35,7 @@ def read_text_file(path_file: str | Path, by_line: bool = True, print_msg: bool
     # Comprobar que sea un archivo
     if not file.is_file():
 
-        print(error("No es un archivo:", "ico"), info(file))
+        report("error", error("No es un archivo:", "ico"), info(file))
 
         return
 
@@ -49,7 +49,8 @@ def read_text_file(path_file: str | Path, by_line: bool = True, print_msg: bool
 
     except Exception as err:
 
-        print(
+        report(
+            "error",
             error("Error al leer el archivo:", "ico"),
             info(file),
             "\n" + str(err)
@@ -74,7 +75,7 @@ def write_text_file(path_file: str | Path, content: str | list, replace: bool =
     # Comprobar que el contenido no este vacio
     if not content:
 
-        print(warning("El contenido no puede estar vacio.", "ico"))
+        report("warning", warning("El contenido no puede estar vacio.", "ico"))
 
         return
 
@@ -84,7 +85,7 @@ def write_text_file(path_file: str | Path, content: str | list, replace: bool =
     # Comprobar sí existe y no es un archivo
     if file.exists() and not file.is_file():
 
-        print(warning("Ya existe y no es un archivo:", "ico"), info(file))
+        report("warning", warning("Ya existe y no es un archivo:", "ico"), info(file))
 
         return
 
@@ -137,17 +138,20 @@ def write_text_file(path_file: str | Path, content: str | list, replace: bool =
             # Escribimos el contenido en el archivo como un texto único
             file.write_text(str(new_content), "utf-8")
 
+        invalidate_stat_cache(file)
+
         # Imprimir mensaje satisfactorio
         if print_msg:
 
-            print(success("Guardado el contenido en:", "ico"), info(file))
+            report("success", success("Guardado el contenido en:", "ico"), info(file))
 
         # Retornar la ruta absoluta del archivo
         return str(file)
 
     except Exception as err:
 
-        print(
+        report(
+            "error",
             error("Error al escribir en el archivo:", "ico"),
             info(file),
             "\n" + str(err)
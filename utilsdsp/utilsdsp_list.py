@@ -1,8 +1,16 @@
 """
 Operaciones con listas:
     - remove_repeated_elements: Eliminar elementos repetidos
+    - __freeze: Convertir un elemento no hashable en uno hashable
+    - __fingerprint: Serializar un elemento de forma estable entre procesos
+    - _BloomFilter: Conjunto aproximado con memoria limitada
+    - iter_unique_elements: Recorrer los elementos no repetidos de un iterable
 """
 
+import math
+from hashlib import blake2b
+from typing import Callable, Iterable, Iterator
+
 
 def remove_repeated_elements(list_: list) -> list:
     """
@@ -17,4 +25,204 @@ def remove_repeated_elements(list_: list) -> list:
 
     # Usar "fromkeys" de los diccionarios para
     # eliminar elementos repetidos
-    return list(dict.fromkeys(list_))
+    try:
+
+        return list(dict.fromkeys(list_))
+
+    # Sí hay elementos no hashables (Ej: diccionarios o listas)
+    except TypeError:
+
+        return list(iter_unique_elements(list_))
+
+
+def __freeze(value):
+    """
+    Convertir un elemento no hashable en uno hashable equivalente
+    (Ej: listas -> tuplas, diccionarios -> frozenset de sus pares)
+
+    Parameters:
+    value (Any): Elemento a convertir
+
+    Returns:
+    Any: El mismo elemento sí ya es hashable o su equivalente
+    """
+
+    try:
+
+        hash(value)
+
+        return value
+
+    except TypeError:
+        pass
+
+    if isinstance(value, dict):
+
+        return ("dict", frozenset((__freeze(key), __freeze(item)) for key, item in value.items()))
+
+    if isinstance(value, (set, frozenset)):
+
+        return ("set", frozenset(__freeze(item) for item in value))
+
+    if isinstance(value, (list, tuple)):
+
+        return (type(value).__name__, tuple(__freeze(item) for item in value))
+
+    # Otros objetos no hashables se comparan por su representación
+    return (type(value).__name__, repr(value))
+
+
+def __fingerprint(value) -> bytes:
+    """
+    Serializar un elemento de forma estable (igual en todos los
+    procesos y sin las colisiones de "hash"), para el filtro de Bloom
+        - Los elementos iguales dan los mismos bytes (Ej: 1, 1.0 y True)
+        - Los conjuntos y diccionarios no dependen del orden
+
+    Parameters:
+    value (Any): Elemento a serializar
+
+    Returns:
+    bytes: Bytes del elemento, con una etiqueta de su tipo
+    """
+
+    if isinstance(value, str):
+
+        return b"s" + value.encode("utf-8", "surrogatepass")
+
+    if isinstance(value, (bytes, bytearray)):
+
+        return b"b" + bytes(value)
+
+    # Los números iguales se serializan igual (Ej: 1 == 1.0 == True)
+    if isinstance(value, (bool, int)) or (isinstance(value, float) and value.is_integer()):
+
+        return b"i" + str(int(value)).encode()
+
+    if isinstance(value, float):
+
+        return b"f" + repr(value).encode()
+
+    if isinstance(value, list):
+
+        tag, parts = b"l", [__fingerprint(item) for item in value]
+
+    elif isinstance(value, tuple):
+
+        tag, parts = b"t", [__fingerprint(item) for item in value]
+
+    elif isinstance(value, dict):
+
+        tag, parts = b"d", sorted(__fingerprint((key, item)) for key, item in value.items())
+
+    elif isinstance(value, (set, frozenset)):
+
+        tag, parts = b"e", sorted(__fingerprint(item) for item in value)
+
+    else:
+
+        return b"r" + type(value).__name__.encode() + b":" + repr(value).encode("utf-8", "surrogatepass")
+
+    # Anteponer la longitud de cada parte para que no se confundan
+    # (Ej: ("ab", "c") y ("a", "bc"))
+    return tag + b"".join(len(part).to_bytes(8, "little") + part for part in parts)
+
+
+class _BloomFilter:
+    """
+    Conjunto aproximado con memoria fija: nunca olvida un elemento
+    agregado, pero puede dar como repetido uno que no lo es
+    (con una probabilidad de "error_rate")
+    """
+
+    def __init__(self, capacity: int = 10_000_000, error_rate: float = 0.001) -> None:
+        """
+        Parameters:
+        capacity (int): Cantidad de elementos esperados
+        error_rate (float): Probabilidad de falsos repetidos
+        """
+
+        # Cantidad de bits y de hashes óptimos
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def add(self, data: bytes) -> bool:
+        """
+        Agregar un elemento
+
+        Returns:
+        bool: Sí el elemento (probablemente) ya estaba
+        """
+
+        # Doble hash: h1 + i * h2
+        digest = blake2b(data, digest_size=16).digest()
+
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        exists = True
+
+        for i in range(self.hashes):
+
+            position = (h1 + i * h2) % self.size
+            byte, bit = position >> 3, 1 << (position & 7)
+
+            if not self.bits[byte] & bit:
+
+                exists = False
+
+                self.bits[byte] |= bit
+
+        return exists
+
+
+def iter_unique_elements(iterable: Iterable, key: Callable | None = None, approximate: bool = False, capacity: int = 10_000_000, error_rate: float = 0.001) -> Iterator:
+    """
+    Recorrer los elementos no repetidos de un iterable (en el mismo
+    orden y sin cargarlo completo en memoria)
+        - Admite elementos no hashables (Ej: diccionarios o listas)
+        - En modo aproximado la memoria es fija (un filtro de Bloom),
+          pero se puede descartar algún elemento que no estaba repetido
+
+    Parameters:
+    iterable (Iterable): Elementos a recorrer (lista, archivo, generador, etc)
+    key (Callable | None): Función que devuelve lo que se compara de cada
+                           elemento (Ej: str.lower)
+    approximate (bool): Usar memoria fija en lugar de guardar cada elemento
+    capacity (int): Cantidad de elementos esperados (modo aproximado)
+    error_rate (float): Probabilidad de descartar un elemento no repetido
+                        (modo aproximado)
+
+    Returns:
+    Iterator: Elementos no repetidos
+    """
+
+    if approximate:
+
+        seen = _BloomFilter(capacity, error_rate)
+
+        for element in iterable:
+
+            # Convertir lo que se compara en bytes estables para el filtro
+            # (No se usa "hash": colisiona y varía entre procesos)
+            data = __fingerprint(key(element) if key else element)
+
+            if not seen.add(data):
+
+                yield element
+
+        return
+
+    seen = set()
+
+    for element in iterable:
+
+        value = __freeze(key(element) if key else element)
+
+        if value not in seen:
+
+            seen.add(value)
+
+            yield element
@@ -0,0 +1,346 @@
+"""
+Métricas de las funciones (deshabilitadas por defecto):
+    - _MetricsRegistry: Guardar contadores e histogramas con etiquetas
+    - enable_metrics: Habilitar el registro de las métricas
+    - disable_metrics: Deshabilitar el registro de las métricas
+    - reset_metrics: Borrar las métricas registradas
+    - increment: Incrementar un contador
+    - observe: Registrar un valor en un histograma
+    - timer: Medir el tiempo de un bloque "with" en un histograma
+    - measure_queue_wait: Medir la espera de una tarea en la cola de un pool
+    - obtain_metrics: Obtener las métricas en un diccionario
+    - export_metrics: Exportar las métricas como diccionario o texto de Prometheus
+
+Las funciones del paquete solo registran sí "METRICS.enabled" está activo:
+    - if METRICS.enabled:
+          METRICS.increment("utilsdsp_syscalls_total", op="stat")
+"""
+
+import json
+import time
+from pathlib import Path
+from functools import wraps
+from threading import Lock
+from typing import Callable
+from contextlib import contextmanager
+
+
+# Límites de los intervalos de los histogramas (en segundos)
+BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Caracteres a escapar en los valores de las etiquetas de Prometheus
+LABEL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+
+
+class _MetricsRegistry:
+    """
+    Guardar contadores e histogramas con etiquetas (Ej: host, op),
+    de forma segura entre hilos
+    """
+
+    def __init__(self) -> None:
+
+        self.enabled = False
+        self.lock = Lock()
+
+        # (nombre, etiquetas) -> valor
+        self.counters = {}
+
+        # (nombre, etiquetas) -> [cantidad por intervalo, suma, cantidad]
+        self.histograms = {}
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+
+        key = (name, tuple(sorted(labels.items())))
+
+        with self.lock:
+
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+
+        key = (name, tuple(sorted(labels.items())))
+
+        with self.lock:
+
+            if (histogram := self.histograms.get(key)) is None:
+
+                histogram = self.histograms[key] = [[0] * len(BUCKETS), 0.0, 0]
+
+            # Solo se incrementa el primer intervalo que lo contiene
+            # (se acumulan al exportar)
+            for idx, bound in enumerate(BUCKETS):
+
+                if value <= bound:
+
+                    histogram[0][idx] += 1
+
+                    break
+
+            histogram[1] += value
+            histogram[2] += 1
+
+    def reset(self) -> None:
+
+        with self.lock:
+
+            self.counters.clear()
+            self.histograms.clear()
+
+
+# Registro de las métricas de todo el paquete
+METRICS = _MetricsRegistry()
+
+
+def enable_metrics() -> None:
+    """
+    Habilitar el registro de las métricas en todo el paquete
+
+    Returns:
+    None
+    """
+
+    METRICS.enabled = True
+
+
+def disable_metrics() -> None:
+    """
+    Deshabilitar el registro de las métricas (Las registradas se conservan)
+
+    Returns:
+    None
+    """
+
+    METRICS.enabled = False
+
+
+def reset_metrics() -> None:
+    """
+    Borrar las métricas registradas
+
+    Returns:
+    None
+    """
+
+    METRICS.reset()
+
+
+def increment(name: str, value: float = 1, **labels) -> None:
+    """
+    Incrementar un contador (sí están habilitadas las métricas)
+
+    Parameters:
+    name (str): Nombre del contador (Ej: utilsdsp_bytes_total)
+    value (float): Cantidad a incrementar
+    labels (str): Etiquetas del contador (Ej: op="rename")
+
+    Returns:
+    None
+    """
+
+    if METRICS.enabled:
+
+        METRICS.increment(name, value, **labels)
+
+
+def observe(name: str, value: float, **labels) -> None:
+    """
+    Registrar un valor en un histograma (sí están habilitadas las métricas)
+
+    Parameters:
+    name (str): Nombre del histograma (Ej: utilsdsp_move_seconds)
+    value (float): Valor a registrar
+    labels (str): Etiquetas del histograma
+
+    Returns:
+    None
+    """
+
+    if METRICS.enabled:
+
+        METRICS.observe(name, value, **labels)
+
+
+@contextmanager
+def timer(name: str, **labels):
+    """
+    Medir el tiempo de un bloque "with" en un histograma
+    (sí están habilitadas las métricas)
+
+    Ej:
+    - with timer("utilsdsp_phase_seconds", phase="select"):
+          files = select_dir_content(path)
+
+    Parameters:
+    name (str): Nombre del histograma
+    labels (str): Etiquetas del histograma
+
+    Returns:
+    None
+    """
+
+    if not METRICS.enabled:
+
+        yield
+
+        return
+
+    start = time.perf_counter()
+
+    try:
+
+        yield
+
+    finally:
+
+        METRICS.observe(name, time.perf_counter() - start, **labels)
+
+
+def measure_queue_wait(func: Callable, pool: str = "default") -> Callable:
+    """
+    Medir la espera de una tarea en la cola de un pool de hilos,
+    desde que se envía hasta que comienza a ejecutarse
+    (sí están habilitadas las métricas)
+
+    Ej:
+    - executor.submit(measure_queue_wait(download_file, "downloads"), url)
+
+    Parameters:
+    func (Callable): Función de la tarea
+    pool (str): Nombre del pool (etiqueta del histograma)
+
+    Returns:
+    Callable: La misma función o una que registra la espera
+    """
+
+    if not METRICS.enabled:
+
+        return func
+
+    submitted = time.perf_counter()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+
+        METRICS.observe("utilsdsp_pool_queue_wait_seconds", time.perf_counter() - submitted, pool=pool)
+
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def obtain_metrics() -> dict:
+    """
+    Obtener las métricas registradas en un diccionario
+
+    Returns:
+    dict: {"counters": {nombre: [{"labels", "value"}]},
+           "histograms": {nombre: [{"labels", "count", "sum", "buckets"}]}}
+    """
+
+    result = {"counters": {}, "histograms": {}}
+
+    with METRICS.lock:
+
+        for (name, labels), value in sorted(METRICS.counters.items()):
+
+            result["counters"].setdefault(name, []).append({
+                "labels": dict(labels),
+                "value": value
+            })
+
+        for (name, labels), (buckets, total, count) in sorted(METRICS.histograms.items()):
+
+            # Cantidad acumulada de valores menores o iguales a cada límite
+            cumulative, accumulated = {}, 0
+
+            for bound, amount in zip(BUCKETS, buckets):
+
+                accumulated += amount
+
+                cumulative[str(bound)] = accumulated
+
+            cumulative["+Inf"] = count
+
+            result["histograms"].setdefault(name, []).append({
+                "labels": dict(labels),
+                "count": count,
+                "sum": total,
+                "buckets": cumulative
+            })
+
+    return result
+
+
+def __prometheus_labels(labels: dict, **extra) -> str:
+    """
+    Conformar las etiquetas en el formato de Prometheus
+    (Ej: '{host="dominio.com",le="0.5"}')
+    """
+
+    labels = {**labels, **extra}
+
+    if not labels:
+
+        return ""
+
+    items = ",".join(
+        f'{key}="{str(value).translate(LABEL_ESCAPES)}"' for key, value in labels.items()
+    )
+
+    return "{" + items + "}"
+
+
+def export_metrics(path_dst: str | Path | None = None, output_format: str = "dict") -> dict | str:
+    """
+    Exportar las métricas como diccionario (JSON) o texto de Prometheus
+
+    Parameters:
+    path_dst (str | Path | None): Archivo donde guardarlas (Ej: metrics.prom)
+    output_format (str): Formato de salida (dict o prometheus)
+
+    Returns:
+    dict: Métricas sí el formato es "dict"
+    str: Texto de Prometheus sí el formato es "prometheus"
+    """
+
+    metrics = obtain_metrics()
+
+    if output_format == "prometheus":
+
+        lines = []
+
+        for name, samples in metrics["counters"].items():
+
+            lines.append(f'# TYPE {name} counter')
+
+            for sample in samples:
+
+                lines.append(f'{name}{__prometheus_labels(sample["labels"])} {sample["value"]}')
+
+        for name, samples in metrics["histograms"].items():
+
+            lines.append(f'# TYPE {name} histogram')
+
+            for sample in samples:
+
+                for bound, amount in sample["buckets"].items():
+
+                    lines.append(f'{name}_bucket{__prometheus_labels(sample["labels"], le=bound)} {amount}')
+
+                lines.append(f'{name}_sum{__prometheus_labels(sample["labels"])} {sample["sum"]}')
+                lines.append(f'{name}_count{__prometheus_labels(sample["labels"])} {sample["count"]}')
+
+        result = "\n".join(lines) + "\n"
+
+        if path_dst:
+
+            Path(path_dst).write_text(result, "utf-8")
+
+        return result
+
+    if path_dst:
+
+        Path(path_dst).write_text(json.dumps(metrics, indent=2), "utf-8")
+
+    return metrics
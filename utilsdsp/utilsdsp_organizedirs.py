@@ -8,7 +8,7 @@ Organizar directorios:
 
 from pathlib import Path
 from outputstyles import warning, info, bold, error
-from utilsdsp import validate_path, select_dir_content, move_dirs, del_empty_dirs, join_list_to_dict, join_path
+from utilsdsp import validate_path, select_dir_content, move_dirs, del_empty_dirs, join_list_to_dict, join_path, report, timer
 
 
 def move_files_to_root(path_src: str | Path, file_type: str | None = None, delete_empty: bool = False, overwrite: bool = False, print_msg: bool = True) -> None:
@@ -52,7 +52,7 @@ def move_files_to_root(path_src: str | Path, file_type: str | None = None, delet
 
             msg = f'No hay archivos en los sub-directorios de:'
 
-        print(warning(msg, "ico"), info(path_root))
+        report("warning", warning(msg, "ico"), info(path_root))
 
         return
 
@@ -103,7 +103,7 @@ def move_files_to_subdir(path_src: str | Path, subdir_name: str, file_type: str
     # Comprobar que hayan subdirectorios en el nivel 1
     if not all_subdirs:
 
-        print(warning(f'No hay sub-directorios en:', "ico"), info(path_src))
+        report("warning", warning(f'No hay sub-directorios en:', "ico"), info(path_src))
 
         return
 
@@ -118,7 +118,7 @@ def move_files_to_subdir(path_src: str | Path, subdir_name: str, file_type: str
         # Continuamos sí no hay archivos
         if not files:
 
-            print("")
+            report("info", "")
 
             continue
 
@@ -186,7 +186,7 @@ def organize_files_by_type(path_src: str | Path, files_data: dict | list, path_d
 
     else:
 
-        print(error('"files_data" no es un diccionario o una lista', "btn_ico"))
+        report("error", error('"files_data" no es un diccionario o una lista', "btn_ico"))
 
         return
 
@@ -196,7 +196,8 @@ def organize_files_by_type(path_src: str | Path, files_data: dict | list, path_d
         # Comprobar que que no esten vacios los valores (type, foldername)
         if not (ext and folder):
 
-            print(
+            report(
+                "warning",
                 warning("Los valores no deben estar vacios.", "ico"),
                 "\n" + bold("Extensión:"),
                 ext,
@@ -208,12 +209,14 @@ def organize_files_by_type(path_src: str | Path, files_data: dict | list, path_d
             continue
 
         # Buscar los archivos según la extensión
-        files = select_dir_content(path_root, file_type=ext)
+        with timer("utilsdsp_phase_seconds", phase="select"):
+
+            files = select_dir_content(path_root, file_type=ext)
 
         # Continuamos sí no hay archivos
         if not files:
 
-            print("")
+            report("info", "")
 
             continue
 
@@ -221,13 +224,15 @@ def organize_files_by_type(path_src: str | Path, files_data: dict | list, path_d
         path_folder = path_dst / folder
 
         # Mover los archivos
-        move_dirs(
-            path_src=files,
-            path_dst=path_folder,
-            print_msg=print_msg,
-            overwrite=overwrite,
-            file_type=ext
-        )
+        with timer("utilsdsp_phase_seconds", phase="move"):
+
+            move_dirs(
+                path_src=files,
+                path_dst=path_folder,
+                print_msg=print_msg,
+                overwrite=overwrite,
+                file_type=ext
+            )
 
 
 def organize_files_by_name(path_src: str | Path, path_dst: str | Path | None = None, file_type: str | None = None, secondary: str | None = None, not_include: str | None = None, subdir: str | None = None, overwrite: bool = False, print_msg: bool = True) -> None:
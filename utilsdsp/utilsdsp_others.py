@@ -1,16 +1,63 @@
 """
 Otras funciones útiles:
+    - __read_url_line: Leer solo hasta la línea de la URL de un archivo HTML
     - obtain_url_from_html: Obtener la URL desde un archivo HTML
+    - obtain_urls_from_htmls: Obtener las URLs de varios archivos HTML simultaneos
     - create_headers_decorates: Crear un encabezado decorado
     - clear_output: Limpiar salida en la Terminal según el SO
+    - __jpeg_size: Obtener las dimensiones de un JPEG según su marcador SOF
+    - obtain_img_size: Obtener el tamaño de una imagen leyendo solo su encabezado
     - calc_img_dimensions: Calcular las dimensiones de una imagen
+    - calc_imgs_dimensions: Calcular las dimensiones de varias imágenes a la vez
     - obtain_similar_vars: Obtener el valor o nombre de variables similares
 """
 
 import os
+import json
 from pathlib import Path
-from utilsdsp import validate_path, read_text_file
-from outputstyles import warning, error, info, add_text_styles
+from typing import BinaryIO, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from utilsdsp import validate_path, report
+from outputstyles import warning, error, info, success, add_text_styles
+
+# Dependencia opcional para calcular las dimensiones de muchas imágenes
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def __read_url_line(path_src: str | Path, num_line: int = 3, max_line: int = 1024 * 64) -> str:
+    """
+    Leer solo hasta la línea de la URL de un archivo HTML, sin
+    cargar el resto del archivo (Suelen tener imágenes en base64)
+
+    Parameters:
+    path_src (str | Path): Ruta del archivo HTML
+    num_line (int): Número de la linea donde está la URL
+    max_line (int): Cantidad máxima de bytes a leer de cada vez
+
+    Returns:
+    str: URL real del archivo HTML
+    """
+
+    with open(path_src, "rb") as file:
+
+        # Saltar las líneas anteriores (leyéndolas por partes sí son muy largas)
+        for _ in range(num_line - 1):
+
+            while (line := file.readline(max_line)) and not line.endswith(b"\n"):
+                pass
+
+            if not line:
+
+                raise IndexError(f'El archivo tiene menos de {num_line} líneas')
+
+        line = file.readline(max_line)
+
+    # Retornar la URL real (Siempre es la 3ra línea)
+    # Ej:  url: https://dominio.com/otra/dir/
+    return line.decode("utf-8", errors="replace").replace("url:", "").strip()
 
 
 def obtain_url_from_html(path_src: str | Path, num_line: int = 3) -> str | None:
@@ -38,33 +85,142 @@ def obtain_url_from_html(path_src: str | Path, num_line: int = 3) -> str | None:
     # Comprobar que sea un archivo HTML
     if path_src.suffix.lower() != ".html":
 
-        print(
+        report(
+            "warning",
             warning("No es un archivo HTML:", "ico"),
             error(path_src, "ico")
         )
         return
 
-    # Leer contenido del archivo HTML por lineas
-    content_html = read_text_file(path_src)
-
     try:
 
         num_line = num_line if isinstance(num_line, int) else 3
 
-        # Retornar la URL real (Siempre es la 3ra línea)
-        # Ej:  url: https://dominio.com/otra/dir/
-        # return content_html[num_line - 1].strip().split(" ")[1]
-        return content_html[num_line - 1].replace("url:", "").strip()
+        # Leer solo hasta la línea de la URL
+        return __read_url_line(path_src, num_line)
 
     except Exception as err:
 
-        print(
+        report(
+            "error",
             error("No se pudo obtener la URL de:", "ico"),
             info(path_src),
             "\n" + str(err)
         )
 
 
+def obtain_urls_from_htmls(path_src: str | Path | list, num_line: int = 3, recursive: bool = False, max_workers: int | None = None, path_index: str | Path | None = None, print_msg: bool = True) -> dict | None:
+    """
+    Obtener las URLs de varios archivos HTML simultaneos, guardados
+    con SingleFile (Extensión de Firefox)
+
+    Parameters:
+    path_src (str | Path | list): Directorio con los HTML o lista de rutas
+    num_line (int): Número de la linea donde está la URL
+    recursive (bool): Buscar también en los sub-directorios
+    max_workers (int | None): Cantidad de archivos leyéndose a la vez
+    path_index (str | Path | None): Archivo JSON donde guardar el índice
+    print_msg (bool): Imprimir los errores y un mensaje satisfactorio
+
+    Returns:
+    dict: Índice con la ruta de cada HTML y su URL
+    None: Sí no existe el directorio
+    """
+
+    # Obtener las rutas de los HTML de un directorio
+    if isinstance(path_src, (str, Path)):
+
+        if not validate_path(path_src):
+
+            return
+
+        paths = []
+        pending = [os.path.abspath(path_src)]
+
+        # Recorrer los directorios con os.scandir (sin crear objetos Path)
+        while pending:
+
+            with os.scandir(pending.pop()) as entries:
+
+                for entry in entries:
+
+                    if entry.is_dir(follow_symlinks=False):
+
+                        if recursive:
+
+                            pending.append(entry.path)
+
+                    elif entry.name.lower().endswith(".html"):
+
+                        paths.append(entry.path)
+
+    else:
+
+        paths = [os.path.abspath(path) for path in path_src]
+
+    num_line = num_line if isinstance(num_line, int) else 3
+
+    # Leer la URL de un HTML (los errores no detienen al resto)
+    def read_url(path: str) -> tuple:
+
+        try:
+
+            return path, __read_url_line(path, num_line), None
+
+        except Exception as err:
+
+            return path, None, err
+
+    result = {}
+    errors = 0
+
+    # Leer los archivos en varios hilos (La lectura libera el GIL)
+    with ThreadPoolExecutor(max_workers=max_workers or min(32, (os.cpu_count() or 1) * 4)) as executor:
+
+        for path, url, err in executor.map(read_url, paths, chunksize=64):
+
+            if err is None:
+
+                result[path] = url
+
+                continue
+
+            errors += 1
+
+            if print_msg:
+
+                report(
+                    "error",
+                    error("No se pudo obtener la URL de:", "ico"),
+                    info(path),
+                    "\n" + str(err)
+                )
+
+    # Guardar el índice (ruta -> URL) en un archivo JSON
+    if path_index:
+
+        try:
+
+            with open(path_index, "w", encoding="utf-8") as file:
+
+                json.dump(result, file, ensure_ascii=False, indent=2)
+
+        except Exception as err:
+
+            report(
+                "error",
+                error("Error al guardar el índice:", "ico"),
+                info(path_index),
+                "\n" + str(err)
+            )
+
+    if print_msg:
+
+        report("success", success(f'URLs obtenidas: {len(result)}  Errores: {errors}', "ico"))
+
+    return result
+
+
 def create_headers_decorates(header: str, chars_cant: int = 100, decoration: str = "*", deco_init: int = 2, styles: list | None = None) -> str:
     """
     Crear un encabezado decorado
@@ -111,7 +267,7 @@ def create_headers_decorates(header: str, chars_cant: int = 100, decoration: str
 
     except Exception as err:
 
-        print(error("Error:", "ico"), err)
+        report("error", error("Error:", "ico"), err)
 
 
 def clear_output() -> None:
@@ -141,20 +297,172 @@ def clear_output() -> None:
         print("\n" * 120)
 
 
-def calc_img_dimensions(img_size: tuple, width_final: int | None = None, height_final: int | None = None) -> tuple:
+def __jpeg_size(file: BinaryIO) -> tuple | None:
+    """
+    Obtener las dimensiones de un JPEG buscando su marcador SOF,
+    saltando el contenido del resto de segmentos
+
+    Parameters:
+    file (BinaryIO): Archivo abierto después de la firma (FF D8)
+
+    Returns:
+    tuple: Ancho y alto de la imagen
+    None: Sí no se encontró el marcador SOF
+    """
+
+    while True:
+
+        # Buscar el siguiente marcador (FF seguido del tipo)
+        byte = file.read(1)
+
+        while byte and byte != b"\xff":
+
+            byte = file.read(1)
+
+        while byte == b"\xff":
+
+            byte = file.read(1)
+
+        if not byte:
+
+            return
+
+        marker = byte[0]
+
+        # Marcadores sin contenido (RST, SOI, EOI, TEM)
+        if 0xD0 <= marker <= 0xD9 or marker == 0x01:
+
+            continue
+
+        data = file.read(2)
+
+        # Segmento truncado o con una longitud inválida (que no avanza)
+        if len(data) < 2 or (length := int.from_bytes(data, "big")) < 2:
+
+            return
+
+        # SOF0 - SOF15 (Excepto DHT, JPG y DAC)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+
+            data = file.read(5)
+
+            if len(data) < 5:
+
+                return
+
+            return int.from_bytes(data[3:5], "big"), int.from_bytes(data[1:3], "big")
+
+        file.seek(length - 2, os.SEEK_CUR)
+
+
+def obtain_img_size(path_src: str | Path, print_msg: bool = True) -> tuple | None:
+    """
+    Obtener el tamaño (ancho, alto) de una imagen leyendo solo
+    su encabezado, sin decodificarla (PNG, JPEG, GIF, WebP y BMP)
+
+    Parameters:
+    path_src (str | Path): Ruta de la imagen
+    print_msg (bool): Imprimir los mensajes (warnings & errors)
+
+    Returns:
+    tuple: Ancho y alto de la imagen
+    None: Sí no es un formato admitido o no se pudo leer
+    """
+
+    try:
+
+        with open(path_src, "rb") as file:
+
+            head = file.read(32)
+
+            # PNG: Firma y el bloque IHDR (ancho y alto de 4 bytes)
+            if head.startswith(b"\x89PNG\r\n\x1a\n"):
+
+                return int.from_bytes(head[16:20], "big"), int.from_bytes(head[20:24], "big")
+
+            # GIF: Ancho y alto de 2 bytes (little-endian)
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+
+                return int.from_bytes(head[6:8], "little"), int.from_bytes(head[8:10], "little")
+
+            # BMP: Según el tamaño del encabezado DIB
+            if head.startswith(b"BM"):
+
+                if int.from_bytes(head[14:18], "little") == 12:
+
+                    return int.from_bytes(head[18:20], "little"), int.from_bytes(head[20:22], "little")
+
+                width = int.from_bytes(head[18:22], "little", signed=True)
+                height = int.from_bytes(head[22:26], "little", signed=True)
+
+                # La altura es negativa sí las filas van de arriba a abajo
+                return abs(width), abs(height)
+
+            # WebP: Según el tipo del primer bloque (VP8, VP8L o VP8X)
+            if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+
+                chunk = head[12:16]
+
+                if chunk == b"VP8 ":
+
+                    return int.from_bytes(head[26:28], "little") & 0x3FFF, int.from_bytes(head[28:30], "little") & 0x3FFF
+
+                if chunk == b"VP8L":
+
+                    bits = int.from_bytes(head[21:25], "little")
+
+                    return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+
+                if chunk == b"VP8X":
+
+                    return int.from_bytes(head[24:27], "little") + 1, int.from_bytes(head[27:30], "little") + 1
+
+            # JPEG: Recorrer los segmentos hasta el SOF
+            if head.startswith(b"\xff\xd8"):
+
+                file.seek(2)
+
+                if size := __jpeg_size(file):
+
+                    return size
+
+        if print_msg:
+
+            report("warning", warning("Formato de imagen no admitido:", "ico"), info(path_src))
+
+    except Exception as err:
+
+        if print_msg:
+
+            report(
+                "error",
+                error("No se pudo leer la imagen:", "ico"),
+                info(path_src),
+                "\n" + str(err)
+            )
+
+
+def calc_img_dimensions(img_size: tuple | str | Path, width_final: int | None = None, height_final: int | None = None) -> tuple:
     """
     Calcular las dimensiones finales (ancho, alto) de
     una imagen según su ancho o altura a modificar
 
     Parameters:
-    img_size (tuple): Tamaño original de la imagen (ancho, alto)
+    img_size (tuple | str | Path): Tamaño original de la imagen (ancho, alto)
+                                   o su ruta (se lee solo el encabezado)
     width_final (int | None): Ancho a modificar
     height_final (int | None): Alto a modificar
 
     Returns:
     tuple: Devuelve el ancho y alto de la imagen modificada
+    None: Sí no se pudo obtener el tamaño de la imagen
     """
 
+    # Obtener el tamaño desde el encabezado de la imagen
+    if isinstance(img_size, (str, Path)) and not (img_size := obtain_img_size(img_size)):
+
+        return
+
     # Calcular la altura final si se introdujo un ancho
     if width_final and isinstance(width_final, int):
 
@@ -175,6 +483,81 @@ def calc_img_dimensions(img_size: tuple, width_final: int | None = None, height_
     return width_final, height_final
 
 
+def calc_imgs_dimensions(imgs_size: Iterable, width_final: int | None = None, height_final: int | None = None) -> list:
+    """
+    Calcular las dimensiones finales (ancho, alto) de varias
+    imágenes a la vez, según su ancho o altura a modificar
+        - Con NumPy instalado se calculan todas en una sola operación
+          (y sí "imgs_size" es un array, se devuelve otro array, sin
+          cambiar las filas con un lado en 0)
+
+    Ej (combinado con obtain_img_size):
+        - calc_imgs_dimensions([obtain_img_size(img) for img in imgs], 256)
+
+    Parameters:
+    imgs_size (Iterable): Tamaños originales de las imágenes [(ancho, alto), ...]
+    width_final (int | None): Ancho a modificar
+    height_final (int | None): Alto a modificar
+
+    Returns:
+    list: Ancho y alto de cada imagen modificada [(ancho, alto), ...], con
+          None en las que no tienen un tamaño válido (None o con un lado en 0)
+    """
+
+    is_array = np is not None and isinstance(imgs_size, np.ndarray)
+
+    if not is_array:
+
+        imgs_size = list(imgs_size)
+
+        # Posiciones de los tamaños válidos (Ej: obtain_img_size
+        # devuelve None sí no pudo leer la imagen)
+        valid = [idx for idx, size in enumerate(imgs_size) if size is not None and size[0] and size[1]]
+
+        result = [None] * len(imgs_size)
+
+        if np is None:
+
+            for idx in valid:
+
+                result[idx] = calc_img_dimensions(imgs_size[idx], width_final, height_final)
+
+            return result
+
+        sizes = np.asarray([imgs_size[idx] for idx in valid], dtype=np.int64).reshape(-1, 2)
+
+    else:
+
+        sizes = imgs_size.astype(np.int64).reshape(-1, 2)
+
+    calculated = sizes.copy()
+
+    # Solo las filas sin lados en 0 (las demás quedan igual)
+    mask = (sizes[:, 0] > 0) & (sizes[:, 1] > 0)
+
+    # Las mismas fórmulas que "calc_img_dimensions" (np.rint redondea
+    # igual que round, al par más cercano)
+    if width_final and isinstance(width_final, int):
+
+        calculated[mask, 0] = width_final
+        calculated[mask, 1] = np.rint(width_final / sizes[mask, 0] * sizes[mask, 1])
+
+    elif height_final and isinstance(height_final, int):
+
+        calculated[mask, 0] = np.rint(height_final / sizes[mask, 1] * sizes[mask, 0])
+        calculated[mask, 1] = height_final
+
+    if is_array:
+
+        return calculated
+
+    for idx, (width, height) in zip(valid, calculated):
+
+        result[idx] = (int(width), int(height))
+
+    return result
+
+
 def obtain_similar_vars(var_name: str, var_cant: int, all_vars: dict, value: bool = True) -> list | None:
     """
     Obtener el valor de las variables que tienen el nombre similar,
@@ -208,4 +591,4 @@ def obtain_similar_vars(var_name: str, var_cant: int, all_vars: dict, value: boo
 
     except Exception as err:
 
-        print(error("Error al obtener las variables:", "ico"), err)
+        report("error", error("Error al obtener las variables:", "ico"), err)
@@ -9,11 +9,36 @@ Operaciones con rutas:
     - obtain_downloads_path: Obtener la ruta para guardar las descargas
     - rename_exists_file: Renombrar un archivo sí existe en el destino
 
+Caché de rutas y stat (opcional, solo dentro de "stat_cache"):
+    - stat_cache: Guardar en caché las rutas resueltas y sus stat durante un lote
+    - obtain_path_stat: Obtener el stat de una ruta (None sí no existe)
+    - invalidate_stat_cache: Eliminar de la caché las rutas modificadas
 """
 
 import os
+import re
+import stat
+import time
 from pathlib import Path
+from threading import Lock
+from contextvars import ContextVar
+from contextlib import contextmanager
 from outputstyles import error, info, warning
+from utilsdsp import report, METRICS
+
+
+# Sufijos reservados al renombrar que aún no existen en el disco, por
+# (directorio, nombre, extensión) -> {número: momento}. Se olvidan al
+# aparecer en el disco o al pasar "__rename_ttl" segundos
+__rename_pending = {}
+__rename_lock = Lock()
+__rename_ttl = 5.0
+
+# Caché de las rutas resueltas (ruta -> ruta absoluta) y de sus stat
+# (ruta absoluta -> os.stat_result o None sí no existe), como la tupla
+# (resueltas, stats). Solo existe dentro de un "stat_cache" y es propia
+# de su contexto (los otros hilos o tareas no la ven)
+__cache = ContextVar("utilsdsp_stat_cache", default=None)
 
 
 def obtain_current_path(os_method: bool = False) -> str:
@@ -45,7 +70,20 @@ def obtain_absolute_path(path_src: str | Path, os_method: bool = False) -> str:
     # Sanear la ruta relativa a un string
     path = str(path_src)
 
-    return os.path.abspath(path) if os_method else str(Path(path).resolve())
+    if os_method:
+
+        return os.path.abspath(path)
+
+    # Reutilizar la ruta resuelta sí está activa la caché
+    if (cache := __cache.get()) is not None:
+
+        if (resolved := cache[0].get(path)) is None:
+
+            resolved = cache[0][path] = str(Path(path).resolve())
+
+        return resolved
+
+    return str(Path(path).resolve())
 
 
 def change_current_path(path_dst: str | Path) -> str | None:
@@ -68,15 +106,21 @@ def change_current_path(path_dst: str | Path) -> str | None:
 
         os.chdir(path)
 
+        # Las rutas relativas ya resueltas dejan de ser válidas
+        if (cache := __cache.get()) is not None:
+
+            cache[0].clear()
+
         return path
 
     except FileNotFoundError:
 
-        print(error("No existe la ruta:", "ico"), info(path))
+        report("error", error("No existe la ruta:", "ico"), info(path))
 
     except Exception as err:
 
-        print(
+        report(
+            "error",
             error("Error al cambiar hacia la ruta:", "ico"),
             info(path),
             "\n" + str(err)
@@ -99,7 +143,7 @@ def validate_path(path_src: str | Path, os_method: bool = False, print_msg: bool
     # Comprobar que no este vacia la ruta
     if not path_src:
 
-        print(warning("Debe insertar una ruta.", "ico"))
+        report("warning", warning("Debe insertar una ruta.", "ico"))
 
         return False
 
@@ -107,12 +151,22 @@ def validate_path(path_src: str | Path, os_method: bool = False, print_msg: bool
     path = obtain_absolute_path(path_src)
 
     # Comprobar la existencia de la ruta
-    result = os.path.exists(path) if os_method else Path(path).exists()
+    if __cache.get() is not None:
+
+        result = obtain_path_stat(path) is not None
+
+    else:
+
+        if METRICS.enabled:
+
+            METRICS.increment("utilsdsp_syscalls_total", op="stat")
+
+        result = os.path.exists(path) if os_method else Path(path).exists()
 
     # Imprimir un mensaje si no existe
     if not result and print_msg:
 
-        print(error('No existe la ruta:', "ico"), info(path))
+        report("error", error('No existe la ruta:', "ico"), info(path))
 
     return result
 
@@ -193,6 +247,10 @@ def obtain_downloads_path(input_dir: str | None = None, mount_GDrive: bool = Fal
 def rename_exists_file(path_src: str | Path) -> str:
     """
     Renombrar un archivo sí existe en el destino
+        - Lista una sola vez el directorio padre para obtener el
+          siguiente sufijo libre (nombre_N.ext)
+        - Recuerda los números reservados hasta que aparecen en el disco,
+          para que los hilos simultaneos obtengan nombres únicos
 
     Parameters:
     path_src (str | Path): Ruta del archivo
@@ -208,16 +266,189 @@ def rename_exists_file(path_src: str | Path) -> str:
     name = path_src.stem
     ext = path_src.suffix
 
-    # Conformar nueva ruta renombrada
-    num = 1
-    path_new = parent / f'{name}_{str(num)}{ext}'
+    key = (str(parent), name, ext)
+
+    pattern = re.compile(rf'{re.escape(name)}_(\d+){re.escape(ext)}')
+
+    with __rename_lock:
 
-    # Verificar que no exista la nueva ruta
-    while validate_path(str(path_new), print_msg=False):
+        # Obtener los números usados listando el directorio una sola vez
+        # (Refleja los archivos eliminados o creados fuera de esta función)
+        try:
 
-        # Sí existe, seguimos creando una nueva ruta hasta que no exista
-        num += 1
+            numbers = {
+                int(match.group(1)) for item in os.listdir(parent) if (match := pattern.fullmatch(item))
+            }
+
+        except OSError:
+
+            numbers = set()
+
+        # Olvidar las reservas que ya existen en el disco o que son
+        # antiguas (Ej: el archivo se creó y luego se eliminó)
+        now = time.monotonic()
+
+        pending = {
+            number: reserved for number, reserved in __rename_pending.pop(key, {}).items()
+            if number not in numbers and now - reserved < __rename_ttl
+        }
+
+        # Conformar nueva ruta renombrada (Se verifica que no exista,
+        # por sí se creó después de listar el directorio)
+        num = max(numbers | pending.keys(), default=0) + 1
         path_new = parent / f'{name}_{str(num)}{ext}'
 
+        while os.path.exists(path_new):
+
+            num += 1
+            path_new = parent / f'{name}_{str(num)}{ext}'
+
+        # Reservar el número hasta que se cree el archivo
+        pending[num] = now
+
+        __rename_pending[key] = pending
+
+        # Eliminar los nombres sin reservas vigentes (para no crecer sin límite)
+        for item in [item for item, values in __rename_pending.items() if now - max(values.values()) >= __rename_ttl]:
+
+            del __rename_pending[item]
+
     # Retornamos la ruta del archivo renombrado
     return str(path_new)
+
+
+# COMMENT Caché de rutas y stat
+@contextmanager
+def stat_cache():
+    """
+    Guardar en caché las rutas resueltas y sus stat durante un lote
+    de operaciones, para no repetir las llamadas al sistema
+        - Se puede anidar, la caché se vacía al cerrar el último
+        - Solo se usa en el hilo (o tarea de asyncio) que lo abre
+        - Las funciones que crean, mueven o eliminan rutas
+          eliminan de la caché las rutas afectadas
+
+    Ej:
+    - with stat_cache():
+          for file in files:
+              move_dirs(file, path_dst)
+
+    Returns:
+    None
+    """
+
+    # Reutilizar la caché sí ya hay un "stat_cache" abierto
+    if __cache.get() is not None:
+
+        yield
+
+        return
+
+    token = __cache.set(({}, {}))
+
+    try:
+
+        yield
+
+    finally:
+
+        __cache.reset(token)
+
+
+def obtain_path_stat(path_src: str | Path) -> os.stat_result | None:
+    """
+    Obtener el stat de una ruta (siguiendo los enlaces simbólicos),
+    desde la caché sí está activa
+
+    Parameters:
+    path_src (str | Path): Ruta a consultar
+
+    Returns:
+    os.stat_result: Stat de la ruta
+    None: Sí no existe la ruta
+    """
+
+    path = os.path.abspath(path_src)
+
+    cache = __cache.get()
+
+    if cache is not None and path in cache[1]:
+
+        if METRICS.enabled:
+
+            METRICS.increment("utilsdsp_stat_cache_hits_total")
+
+        return cache[1][path]
+
+    if METRICS.enabled:
+
+        METRICS.increment("utilsdsp_syscalls_total", op="stat")
+
+    try:
+
+        result = os.stat(path)
+
+    except (OSError, ValueError):
+
+        result = None
+
+    if cache is not None:
+
+        cache[1][path] = result
+
+    return result
+
+
+def invalidate_stat_cache(*paths_src: str | Path) -> None:
+    """
+    Eliminar de la caché las rutas modificadas (creadas, movidas
+    o eliminadas), su contenido sí son directorios y sus directorios
+    padres que no existían
+
+    Parameters:
+    paths_src (str | Path): Rutas modificadas
+
+    Returns:
+    None
+    """
+
+    if (cache := __cache.get()) is None:
+
+        return
+
+    cache_resolved, cache_stats = cache
+
+    missing = object()
+
+    for path_src in paths_src:
+
+        path = os.path.abspath(path_src)
+
+        cache_resolved.pop(str(path_src), None)
+        cache_resolved.pop(path, None)
+
+        result = cache_stats.pop(path, missing)
+
+        # Eliminar el contenido sí era un directorio (o no se conocía)
+        if result is missing or (result and stat.S_ISDIR(result.st_mode)):
+
+            prefix = os.path.join(path, "")
+
+            for key in [key for key in list(cache_stats) if key.startswith(prefix)]:
+
+                cache_stats.pop(key, None)
+
+            for key, value in list(cache_resolved.items()):
+
+                if value == path or value.startswith(prefix):
+
+                    cache_resolved.pop(key, None)
+
+        # Los directorios padres que no existían pudieron crearse
+        parent = os.path.dirname(path)
+
+        while parent in cache_stats and cache_stats[parent] is None:
+
+            cache_stats.pop(parent)
+
+            parent = os.path.dirname(parent)
@@ -0,0 +1,305 @@
+"""
+Reportar los mensajes de las funciones:
+    - Reporter: Interfaz para recibir los mensajes (error, warning, success, info)
+    - ConsoleReporter: Imprimir cada mensaje en la Terminal (por defecto)
+    - SilentReporter: No mostrar ningún mensaje
+    - CountersReporter: Solo contar los mensajes de cada tipo
+    - LogReporter: Enviar los mensajes sin estilos al módulo logging
+    - RateLimitedReporter: Imprimir como máximo un mensaje cada cierto tiempo
+    - set_reporter: Cambiar el reporter de todo el paquete
+    - obtain_reporter: Obtener el reporter actual
+    - use_reporter: Usar un reporter solo dentro de un bloque "with"
+    - report: Reportar un mensaje con el reporter actual
+"""
+
+import re
+import time
+import logging
+from abc import ABC, abstractmethod
+from threading import Lock
+from contextlib import contextmanager
+
+
+# Códigos de los estilos de la Terminal (Ej: "\x1b[01;31m")
+ANSI_STYLES = re.compile(r'\x1b\[[0-9;]*m')
+
+# Tipos de mensajes
+LEVELS = ["error", "warning", "success", "info"]
+
+
+def _plain_text(*args, sep: str = " ") -> str:
+    """
+    Unir los argumentos de un mensaje en un texto sin estilos
+    ni saltos de línea
+    """
+
+    text = ANSI_STYLES.sub("", sep.join(str(arg) for arg in args))
+
+    return " ".join(text.split())
+
+
+class Reporter(ABC):
+    """
+    Interfaz para recibir los mensajes de las funciones del paquete
+        - Se debe implementar "report" (Ej: para guardarlos en una base de datos)
+    """
+
+    @abstractmethod
+    def report(self, level: str, *args, sep: str = " ", end: str = "\n") -> None:
+        """
+        Parameters:
+        level (str): Tipo de mensaje (error, warning, success o info)
+        args (Any): Partes del mensaje, igual que en "print"
+        sep (str): Separador entre las partes
+        end (str): Final del mensaje
+        """
+
+    def summary(self) -> dict:
+        """
+        Obtener la cantidad de mensajes de cada tipo (sí los cuenta)
+        """
+
+        return {}
+
+    def flush(self) -> None:
+        """
+        Mostrar los mensajes pendientes (sí los hay)
+        """
+
+
+class ConsoleReporter(Reporter):
+    """
+    Imprimir cada mensaje en la Terminal, con sus estilos (por defecto)
+    """
+
+    def report(self, level: str, *args, sep: str = " ", end: str = "\n") -> None:
+
+        print(*args, sep=sep, end=end)
+
+
+class SilentReporter(Reporter):
+    """
+    No mostrar ningún mensaje
+    """
+
+    def report(self, level: str, *args, sep: str = " ", end: str = "\n") -> None:
+        pass
+
+
+class CountersReporter(Reporter):
+    """
+    Solo contar los mensajes de cada tipo, para mostrar un
+    resumen al final de una operación en lote
+    """
+
+    def __init__(self) -> None:
+
+        self.counters = dict.fromkeys(LEVELS, 0)
+        self.lock = Lock()
+
+    def report(self, level: str, *args, sep: str = " ", end: str = "\n") -> None:
+
+        # No contar las líneas vacias de separación
+        if not _plain_text(*args, sep=sep):
+
+            return
+
+        with self.lock:
+
+            self.counters[level] = self.counters.get(level, 0) + 1
+
+    def summary(self) -> dict:
+
+        with self.lock:
+
+            return dict(self.counters)
+
+
+class LogReporter(CountersReporter):
+    """
+    Enviar los mensajes sin estilos al módulo logging (un registro
+    por mensaje, con el tipo en "utilsdsp_level")
+    """
+
+    # Nivel de logging de cada tipo de mensaje
+    LOGGING_LEVELS = {
+        "error": logging.ERROR,
+        "warning": logging.WARNING,
+        "success": logging.INFO,
+        "info": logging.INFO
+    }
+
+    def __init__(self, logger: logging.Logger | None = None) -> None:
+        """
+        Parameters:
+        logger (logging.Logger | None): Logger a usar (Por defecto "utilsdsp")
+        """
+
+        super().__init__()
+
+        self.logger = logger or logging.getLogger("utilsdsp")
+
+    def report(self, level: str, *args, sep: str = " ", end: str = "\n") -> None:
+
+        if not (text := _plain_text(*args, sep=sep)):
+
+            return
+
+        super().report(level, text)
+
+        self.logger.log(
+            self.LOGGING_LEVELS.get(level, logging.INFO),
+            text,
+            extra={"utilsdsp_level": level}
+        )
+
+
+class RateLimitedReporter(CountersReporter):
+    """
+    Imprimir en la Terminal como máximo un mensaje cada "interval"
+    segundos, contando los que se omiten
+        - "flush" imprime la cantidad de mensajes omitidos de cada tipo
+    """
+
+    def __init__(self, interval: float = 1.0) -> None:
+        """
+        Parameters:
+        interval (float): Segundos mínimos entre dos mensajes impresos
+        """
+
+        super().__init__()
+
+        self.interval = interval
+        self.last = 0.0
+        self.skipped = dict.fromkeys(LEVELS, 0)
+
+    def report(self, level: str, *args, sep: str = " ", end: str = "\n") -> None:
+
+        if not _plain_text(*args, sep=sep):
+
+            return
+
+        super().report(level, *args, sep=sep)
+
+        now = time.monotonic()
+
+        with self.lock:
+
+            if now - self.last < self.interval:
+
+                self.skipped[level] = self.skipped.get(level, 0) + 1
+
+                return
+
+            self.last = now
+
+        print(*args, sep=sep, end=end)
+
+    def flush(self) -> None:
+
+        with self.lock:
+
+            skipped = {level: count for level, count in self.skipped.items() if count}
+
+            self.skipped = dict.fromkeys(LEVELS, 0)
+
+        if skipped:
+
+            details = ", ".join(f'{level}: {count}' for level, count in skipped.items())
+
+            print(f'... {sum(skipped.values())} mensajes omitidos ({details})')
+
+
+# Reporters según su nombre
+REPORTERS = {
+    "console": ConsoleReporter,
+    "silent": SilentReporter,
+    "counters": CountersReporter,
+    "log": LogReporter,
+    "ratelimited": RateLimitedReporter
+}
+
+# Reporter actual de todo el paquete
+__reporter = ConsoleReporter()
+
+
+def set_reporter(reporter: Reporter | str) -> Reporter:
+    """
+    Cambiar el reporter de todo el paquete
+
+    Parameters:
+    reporter (Reporter | str): Reporter o su nombre (console, silent,
+                               counters, log o ratelimited)
+
+    Returns:
+    Reporter: Reporter anterior (para restaurarlo)
+    """
+
+    global __reporter
+
+    if isinstance(reporter, str):
+
+        reporter = REPORTERS[reporter]()
+
+    previous, __reporter = __reporter, reporter
+
+    return previous
+
+
+def obtain_reporter() -> Reporter:
+    """
+    Obtener el reporter actual
+
+    Returns:
+    Reporter: Reporter actual
+    """
+
+    return __reporter
+
+
+@contextmanager
+def use_reporter(reporter: Reporter | str):
+    """
+    Usar un reporter solo dentro de un bloque "with"
+
+    Ej (Mostrar solo un resumen al organizar muchos archivos):
+    - with use_reporter("counters") as reporter:
+          organize_files_by_type(path, files_data)
+
+      print(reporter.summary())
+
+    Parameters:
+    reporter (Reporter | str): Reporter o su nombre
+
+    Returns:
+    Reporter: Reporter en uso
+    """
+
+    previous = set_reporter(reporter)
+
+    try:
+
+        yield obtain_reporter()
+
+    finally:
+
+        obtain_reporter().flush()
+
+        set_reporter(previous)
+
+
+def report(level: str, *args, sep: str = " ", end: str = "\n") -> None:
+    """
+    Reportar un mensaje con el reporter actual
+
+    Parameters:
+    level (str): Tipo de mensaje (error, warning, success o info)
+    args (Any): Partes del mensaje, igual que en "print"
+    sep (str): Separador entre las partes
+    end (str): Final del mensaje
+
+    Returns:
+    None
+    """
+
+    __reporter.report(level, *args, sep=sep, end=end)
@@ -1,68 +1,293 @@
 """
 Operaciones de saneamiento
+    - __split_graphemes: Dividir un texto en grupos de carácteres que se ven como uno
+    - __cut_graphemes: Cortar un texto por carácteres y bytes sin dividir los grupos
     - truncate_filename: Truncar el nombre del archivo o directorio
+    - __sanitize_cached: Sanear un nombre, guardando los resultados en caché
     - sanitize_filename: Sanear el nombre de un archivo o directorio
+    - sanitize_filenames: Sanear una lista de nombres de archivos o directorios
 """
 
 import re
+import unicodedata
 from pathlib import Path
+from functools import lru_cache
+from typing import Iterable
 
+# Dependencia opcional para dividir los grupos de carácteres (\X)
+try:
+    import regex
+except ImportError:
+    regex = None
 
-def truncate_filename(filename: str, chars_cant: int = 120) -> str:
+
+# Expresión Regular con los carácteres no admitidos en los nombres
+# [\\/:*?"<>|] --> Carácteres no admitidos que se van a cambiar
+# ^\. --> Cambiar un punto (.) que este al inicio
+# \.+$ --> Cambiar un punto (.) o más que esten al final
+INVALID_CHARS = re.compile(r'[\\/:*?"<>|]|^\.|\.+$')
+
+# Más de un espacio (o tabulaciones, saltos de línea, etc)
+MULTIPLE_SPACES = re.compile(r'\s+')
+
+
+def __split_graphemes(text: str) -> list:
+    """
+    Dividir un texto en grupos de carácteres que se ven como uno solo
+    (Ej: letras con acentos combinados, emojis con modificadores o
+    unidos con ZWJ y banderas)
+
+    Parameters:
+    text (str): Texto a dividir
+
+    Returns:
+    list: Grupos de carácteres en orden
+    """
+
+    # Usar el paquete "regex" sí está instalado (\X es un grupo completo)
+    if regex:
+
+        return regex.findall(r'\X', text)
+
+    clusters = []
+    regional = False
+
+    for char in text:
+
+        code = ord(char)
+
+        # Comprobar sí el carácter se une al grupo anterior
+        extend = clusters and (
+            unicodedata.combining(char)
+            or unicodedata.category(char) in ("Mn", "Me", "Mc")
+            or code == 0x200D
+            or clusters[-1][-1] == "\u200d"
+            or 0xFE00 <= code <= 0xFE0F
+            or 0xE0100 <= code <= 0xE01EF
+            or 0x1F3FB <= code <= 0x1F3FF
+            or 0xE0020 <= code <= 0xE007F
+            or (regional and 0x1F1E6 <= code <= 0x1F1FF)
+        )
+
+        # Las banderas son dos indicadores regionales seguidos
+        is_regional = 0x1F1E6 <= code <= 0x1F1FF
+
+        regional = is_regional and not (extend and regional)
+
+        if extend:
+
+            clusters[-1] += char
+
+        else:
+
+            clusters.append(char)
+
+    return clusters
+
+
+def __cut_graphemes(text: str, max_chars: int, max_bytes: int, encoding: str = "utf-8") -> str:
+    """
+    Cortar un texto sin pasarse de una cantidad de carácteres y de
+    bytes, y sin dividir ningún grupo de carácteres
+
+    Parameters:
+    text (str): Texto a cortar
+    max_chars (int): Cantidad máxima de carácteres
+    max_bytes (int): Cantidad máxima de bytes según la codificación
+    encoding (str): Codificación de los nombres en el sistema de archivos
+
+    Returns:
+    str: Texto cortado
+    """
+
+    result = ""
+    size = 0
+
+    for cluster in __split_graphemes(text):
+
+        size += len(cluster.encode(encoding, errors="replace"))
+
+        if len(result) + len(cluster) > max_chars or size > max_bytes:
+
+            break
+
+        result += cluster
+
+    return result
+
+
+def truncate_filename(filename: str, chars_cant: int = 120, max_bytes: int | None = 255, encoding: str = "utf-8") -> str:
     """
-    Truncar el nombre del archivo o directorio
+    Truncar el nombre del archivo o directorio, sin dividir los
+    grupos de carácteres (Ej: emojis, letras con acentos combinados)
 
     Parameters:
     filename (str): Nombre del archivo o directorio
     chars_cant (int): Cantidad de carácteres a dejar en el nombre
+    max_bytes (int | None): Cantidad máxima de bytes del nombre (255 en
+                            la mayoría de los sistemas de archivos)
+    encoding (str): Codificación de los nombres en el sistema de archivos
 
     Returns:
     srt: Devuelve el nombre truncado o no, según los carácteres que contenga
     """
 
+    # Cantidad de bytes del nombre según la codificación
+    encoded_len = lambda text: len(text.encode(encoding, errors="replace"))
+
+    max_bytes = max_bytes or float("inf")
+
     # Retornar el nombre tal y como está,
-    # sí tiene menos carácteres de los admitidos
-    if len(filename) <= chars_cant:
+    # sí tiene menos carácteres y bytes de los admitidos
+    if len(filename) <= chars_cant and encoded_len(filename) <= max_bytes:
 
         return filename
 
     # Obtener el nombre y la extesión por separados
-    name = Path(filename).stem
-    ext = Path(filename).suffix
+    path = Path(filename)
 
-    # Indice donde vamos a truncar el nombre del archivo
-    idx_trunc = chars_cant - len(ext)
+    name, ext = path.stem, path.suffix
 
     # Retornar el nombre truncado y a los ficheros
     # agregarle tres puntos al final
-    return f'{name[:idx_trunc - 3]}...{ext}' if ext else name[:idx_trunc]
+    if ext:
 
+        name = __cut_graphemes(
+            name,
+            chars_cant - len(ext) - 3,
+            max_bytes - encoded_len(ext) - encoded_len("..."),
+            encoding
+        )
 
-def sanitize_filename(filename: str, chars_cant: int = 120) -> str:
+        return f'{name}...{ext}'
+
+    return __cut_graphemes(name, chars_cant, max_bytes, encoding)
+
+
+@lru_cache(maxsize=4096)
+def __sanitize_cached(filename: str, chars_cant: int = 120, max_bytes: int | None = 255, encoding: str = "utf-8", normalize: bool = False) -> str:
     """
-    Sanear el nombre de un archivo o directorio, eliminando
-    los carácteres no adminitidos por Linux y Windows
+    Sanear un nombre, guardando los resultados en caché para
+    los nombres que se repiten
 
     Parameters:
     filename (str): Nombre del archivo o directorio
     chars_cant (int): Cantidad de carácteres a dejar en el nombre
+    max_bytes (int | None): Cantidad máxima de bytes del nombre
+    encoding (str): Codificación de los nombres en el sistema de archivos
+    normalize (bool): Normalizar el nombre en Unicode NFC
 
     Returns:
     srt: Devuelve el nombre saneado
     """
 
-    # Expresión Regular con los carácteres no admitidos en los nombres
-    # [\\/:*?"<>|] --> Carácteres no admitidos que se van a cambiar
-    # ^\. --> Cambiar un punto (.) que este al inicio
-    # \.+$ --> Cambiar un punto (.) o más que esten al final
-    invalid_chars = r'[\\/:*?"<>|]|^\.|\.+$'
+    # Unir las letras y sus acentos combinados en un solo carácter
+    # (Ej: "e" + "\u0301" -> "é"), para que se comparen igual
+    if normalize:
+
+        filename = unicodedata.normalize("NFC", filename)
 
     # Reemplazar los carácteres no admitidos
-    # filename = re.sub(invalid_chars, '_', filename)
-    filename = re.sub(invalid_chars, '', filename)  # Es mejor eliminarlos
+    # filename = INVALID_CHARS.sub('_', filename)
+    filename = INVALID_CHARS.sub('', filename)  # Es mejor eliminarlos
 
     # Reemplazar más de un espacio por uno sencillo
-    filename = re.sub(r'\s+', ' ', filename)
+    filename = MULTIPLE_SPACES.sub(' ', filename)
 
     # Retornar el nombre saneado y truncado en caso de ser necesario
-    return truncate_filename(filename.strip(), chars_cant)
+    return truncate_filename(filename.strip(), chars_cant, max_bytes, encoding)
+
+
+def sanitize_filename(filename: str, chars_cant: int = 120, max_bytes: int | None = 255, encoding: str = "utf-8", normalize: bool = False) -> str:
+    """
+    Sanear el nombre de un archivo o directorio, eliminando
+    los carácteres no adminitidos por Linux y Windows
+
+    Parameters:
+    filename (str): Nombre del archivo o directorio
+    chars_cant (int): Cantidad de carácteres a dejar en el nombre
+    max_bytes (int | None): Cantidad máxima de bytes del nombre
+    encoding (str): Codificación de los nombres en el sistema de archivos
+    normalize (bool): Normalizar el nombre en Unicode NFC
+
+    Returns:
+    srt: Devuelve el nombre saneado
+    """
+
+    return __sanitize_cached(filename, chars_cant, max_bytes, encoding, normalize)
+
+
+def sanitize_filenames(filenames: Iterable, chars_cant: int = 120, unique: bool = False, max_bytes: int | None = 255, encoding: str = "utf-8", normalize: bool = False) -> list:
+    """
+    Sanear una lista de nombres de archivos o directorios
+
+    Parameters:
+    filenames (Iterable): Nombres de los archivos o directorios
+    chars_cant (int): Cantidad de carácteres a dejar en los nombres
+    unique (bool): Evitar nombres repetidos, agregando un número
+                   al final (Ej: "foto.jpg", "foto_1.jpg", ...)
+    max_bytes (int | None): Cantidad máxima de bytes de cada nombre
+    encoding (str): Codificación de los nombres en el sistema de archivos
+    normalize (bool): Normalizar los nombres en Unicode NFC
+
+    Returns:
+    list: Nombres saneados (en el mismo orden)
+    """
+
+    result = [
+        __sanitize_cached(filename, chars_cant, max_bytes, encoding, normalize) for filename in filenames
+    ]
+
+    if not unique:
+
+        return result
+
+    # Nombres ya usados y último número de cada nombre repetido
+    used = set()
+    counters = {}
+
+    for idx, filename in enumerate(result):
+
+        if filename not in used:
+
+            used.add(filename)
+
+            continue
+
+        path = Path(filename)
+
+        name, ext = path.stem, path.suffix
+
+        # Buscar el siguiente número libre, cortando el nombre (sin la
+        # extensión, que ya está separada) para que quepa el número
+        counter = counters.get(filename, 0)
+
+        while True:
+
+            counter += 1
+
+            number = f'_{counter}{ext}'
+
+            name_chars = chars_cant - len(number)
+            name_bytes = max_bytes - len(number.encode(encoding, errors="replace")) if max_bytes else float("inf")
+
+            if len(name) <= name_chars and len(name.encode(encoding, errors="replace")) <= name_bytes:
+
+                new_name = f'{name}{number}'
+
+            # Conservar los tres puntos del nombre truncado
+            else:
+
+                new_name = f'{__cut_graphemes(name.removesuffix("..."), name_chars - 3, name_bytes - 3, encoding)}...{number}'
+
+            if new_name not in used:
+
+                break
+
+        counters[filename] = counter
+
+        used.add(new_name)
+
+        result[idx] = new_name
+
+    return result
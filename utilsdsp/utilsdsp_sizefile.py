@@ -67,7 +67,7 @@ def natural_size(size_file: int, unit: str | None = None) -> str:
     return f'{round(size, 2)} {unit.lower() if unit == "BYTES" else unit}'
 
 
-def __obtain_size_dir(path_src: str | Path, unit: str | None = None, file_type: str = "*") -> str | None:
+def __obtain_size_dir(path_src: str | Path, unit: str | None = None, file_type: str = "*", raw: bool = False) -> str | int | None:
     """
     Obtener el tamaño de un directorio
 
@@ -75,9 +75,11 @@ def __obtain_size_dir(path_src: str | Path, unit: str | None = None, file_type:
     path_src (str | Path): Ruta del directorio para determinar su tamaño
     unit (str | None): Unidad para dar el resulado (KB, MB, GB o TB)
     file_type (str): Tipos de archivos a seleccionar
+    raw (bool): Retornar la cantidad de bytes (int) sin la unidad
 
     Returns:
     str: Suma del tamaño de todos los elementos en el directorio
+    int: Suma del tamaño en bytes (sí "raw" está activo)
     None: Sí la ruta no es válida o sí no es directorio
     """
 
@@ -92,6 +94,10 @@ def __obtain_size_dir(path_src: str | Path, unit: str | None = None, file_type:
     # Comprobar que sea un directorio
     if not path.is_dir():
 
+        if raw:
+
+            return
+
         return f'{error("No es un directorio:", "ico")} {info(path)}'
 
     # Obtener la suma del tamaño de todos los archivos
@@ -101,11 +107,15 @@ def __obtain_size_dir(path_src: str | Path, unit: str | None = None, file_type:
         ]
     )
 
+    if raw:
+
+        return total_size
+
     # Retornar el tamaño total con su unidad de medida
     return natural_size(total_size, unit) if total_size else "0 bytes"
 
 
-def __obtain_size_file(path_src: str | Path, unit: str | None = None, method_stat: bool = False, method_getsize: bool = False) -> str | None:
+def __obtain_size_file(path_src: str | Path, unit: str | None = None, method_stat: bool = False, method_getsize: bool = False, raw: bool = False) -> str | int | None:
     """
     Obtener el tamaño de un archivo
 
@@ -114,9 +124,11 @@ def __obtain_size_file(path_src: str | Path, unit: str | None = None, method_sta
     unit (str | None): Unidad para dar el resulado (KB, MB, GB o TB)
     method_stat (bool): Usar os.stat() para determinar el tamaño
     metod_getsize (bool): Usar os.path.getsize() para determinar el tamaño
+    raw (bool): Retornar la cantidad de bytes (int) sin la unidad
 
     Returns:
     str: Tamaño del archivo con su unidad de medida.
+    int: Tamaño en bytes (sí "raw" está activo)
     None: Sí la ruta no es válida o sí no es archivo
     """
 
@@ -131,8 +143,16 @@ def __obtain_size_file(path_src: str | Path, unit: str | None = None, method_sta
     # Comprobar que sea un archivo
     if not path.is_file():
 
+        if raw:
+
+            return
+
         return f'{error("No es un archivo:", "ico")} {info(path)}'
 
+    if raw:
+
+        return path.stat().st_size
+
     # Método 01: os.stat()
     if method_stat:
         return natural_size(os.stat(path).st_size, unit)
@@ -145,7 +165,7 @@ def __obtain_size_file(path_src: str | Path, unit: str | None = None, method_sta
     return natural_size(path.stat().st_size, unit)
 
 
-def obtain_size(path_src: str | Path, unit: str | None = None, file_type: str = "*") -> str:
+def obtain_size(path_src: str | Path, unit: str | None = None, file_type: str = "*", raw: bool = False) -> str | int | None:
     """
     Obtener tamaño de un archivo o directorio
 
@@ -153,9 +173,12 @@ def obtain_size(path_src: str | Path, unit: str | None = None, file_type: str =
     path_src (str | Path): Ruta del archivo o directorio a determinar su tamaño
     unit (str | None): Unidad para dar el resulado (KB, MB, GB o TB)
     file_type (str): Tipos de archivos a seleccionar en el directorio
+    raw (bool): Retornar la cantidad de bytes (int) sin la unidad
 
     Returns:
     str: Tamaño del archivo o directorio con su unidad de medida
+    int: Tamaño en bytes (sí "raw" está activo)
+    None: Sí no existe la ruta
     """
 
     # Comprobar que exista el directorio o archivo
@@ -166,7 +189,7 @@ def obtain_size(path_src: str | Path, unit: str | None = None, file_type: str =
     # Obtener tamaño de un archivo
     if Path(path_src).is_file():
 
-        return __obtain_size_file(path_src, unit)
+        return __obtain_size_file(path_src, unit, raw=raw)
 
     # Obtener tamaño de un directorio
-    return __obtain_size_dir(path_src, unit, file_type)
+    return __obtain_size_dir(path_src, unit, file_type, raw)